@@ -0,0 +1,317 @@
+"""Asyncio facade of browser."""
+from __future__ import annotations
+
+import asyncio
+import inspect
+from functools import partial
+from time import monotonic
+from typing import TYPE_CHECKING, Any, Callable, Final
+
+from selenium.common.exceptions import TimeoutException
+
+from easelenium.browser import Browser, TypeElement
+from easelenium.wait_policy import WaitResult
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+    from selenium.webdriver.remote.webelement import WebElement
+
+    from easelenium.wait_policy import WaitPolicy
+
+
+class AsyncBrowser:
+    """
+    Browser with awaitable methods for driving many sessions from one loop.
+
+    Every public method of Browser is available as coroutine, its WebDriver
+    commands are run in `executor` (default executor of the loop if it is
+    not passed), so the loop is not blocked by requests to the driver.
+    Commands of single session are run one by one.
+
+    Waits are polled from the loop: every check is run in executor and the
+    loop sleeps between checks, so waiting session doesn't hold a thread.
+    Click, type and other operations which wait for visible element before
+    they act on it wait the same way and then act on found element without
+    waiting for it again.
+    """
+
+    __VISIBLE_ACTIONS: Final = (
+        "type",
+        "click",
+        "get_text",
+        "get_attribute",
+        "get_selected_value_from_dropdown",
+        "get_selected_text_from_dropdown",
+        "select_option_by_value_from_dropdown",
+        "select_option_by_text_from_dropdown",
+        "select_option_by_index_from_dropdown",
+        "select_random_option_from_dropdown",
+        "get_texts_from_dropdown",
+        "get_values_from_dropdown",
+    )
+    __QUERY_ARGS: Final = (
+        "element",
+        "by_id",
+        "by_xpath",
+        "by_link",
+        "by_partial_link",
+        "by_name",
+        "by_tag",
+        "by_css",
+        "by_class",
+    )
+
+    def __init__(self, browser: Browser, executor: Executor | None = None) -> None:
+        """Initialize with started browser."""
+        self.browser = browser
+        self.executor = executor
+        self.last_wait = None
+        # lock is bound to the loop where it is created before python 3.10
+        self.__lock = None
+
+    @classmethod
+    async def create(
+        cls: type[AsyncBrowser],
+        *args: Any,  # noqa: ANN401
+        executor: Executor | None = None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> AsyncBrowser:
+        """Start Browser(*args, **kwargs) in executor and return its facade."""
+        browser = await asyncio.get_running_loop().run_in_executor(
+            executor,
+            partial(Browser, *args, **kwargs),
+        )
+        return cls(browser, executor)
+
+    async def __aenter__(self) -> AsyncBrowser:  # noqa: PYI034
+        """Return self."""
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Quit browser."""
+        await self.run(self.browser.quit)
+
+    def __getattr__(self, name: str) -> Any:  # noqa: ANN401
+        """Return coroutine function for public method of browser."""
+        attr = getattr(self.browser, name)
+        if name.startswith("_") or not callable(attr):
+            return attr
+
+        if name in self.__VISIBLE_ACTIONS:
+
+            async def method(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+                return await self.__run_visible_action(name, args, kwargs)
+
+        else:
+
+            async def method(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+                return await self.run(attr, *args, **kwargs)
+
+        method.__name__ = name
+        method.__doc__ = attr.__doc__
+        return method
+
+    async def run(
+        self,
+        function: Callable[..., Any],
+        *args: Any,  # noqa: ANN401
+        **kwargs: Any,  # noqa: ANN401
+    ) -> Any:  # noqa: ANN401
+        """Return result of function which uses the browser, run in executor."""
+        if self.__lock is None:
+            self.__lock = asyncio.Lock()
+        async with self.__lock:
+            return await asyncio.get_running_loop().run_in_executor(
+                self.executor,
+                partial(function, *args, **kwargs),
+            )
+
+    async def __run_visible_action(
+        self,
+        name: str,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> Any:  # noqa: ANN401
+        arguments = inspect.signature(getattr(Browser, name)).bind(
+            self.browser,
+            *args,
+            **kwargs,
+        )
+        arguments.apply_defaults()
+        arguments = dict(arguments.arguments)
+        del arguments["self"]
+        if arguments["visible"]:
+            query = {key: arguments[key] for key in self.__QUERY_ARGS}
+            arguments.update(dict.fromkeys(query))
+            arguments["element"] = await self.wait_for_visible(
+                parent=arguments.pop("parent"),
+                **query,
+            )
+            # element is already visible, browser should not wait in executor
+            arguments["visible"] = False
+        return await self.run(getattr(self.browser, name), **arguments)
+
+    async def webdriver_wait(
+        self,
+        function: Callable[[Any], Any],
+        msg: str = "",
+        timeout: float | None = None,
+        *,
+        wait_policy: WaitPolicy | None = None,
+    ) -> Any:  # noqa: ANN401
+        """
+        Wait for condition and return its first truthy value.
+
+        Condition is called with WebDriver in executor and stale elements
+        are handled like in Browser.webdriver_wait. Poll intervals and
+        ignored exceptions are taken from `wait_policy` or from the policy of
+        the browser, other exceptions are propagated. Elapsed time and number
+        of polls are saved to `last_wait`.
+        """
+        timeout = timeout or self.browser.get_timeout()
+        wait_policy = wait_policy or self.browser.get_wait_policy()
+        condition = self.browser._wait_condition(function)  # noqa: SLF001
+
+        started_at = monotonic()
+        deadline = started_at + timeout
+        polls = 0
+        value = None
+        for interval in wait_policy.intervals():
+            polls += 1
+            try:
+                value = await self.run(condition, self.browser._driver)  # noqa: SLF001
+            except wait_policy.ignored_exceptions:
+                value = None
+            except Exception:
+                self.__record_wait(WaitResult(None, monotonic() - started_at, polls))
+                raise
+            if value:
+                break
+
+            remaining = deadline - monotonic()
+            if remaining <= 0:
+                break
+            await asyncio.sleep(min(interval, remaining))
+
+        self.__record_wait(WaitResult(value, monotonic() - started_at, polls))
+        if self.last_wait.timed_out:
+            raise TimeoutException(msg)
+        return value
+
+    def __record_wait(self, result: WaitResult) -> None:
+        self.last_wait = result
+        self.browser.stats["waits"] += 1
+        self.browser.stats["wait_polls"] += result.polls
+
+    async def wait_for_visible(
+        self,
+        element: TypeElement | WebElement | None = None,
+        msg: str | None = None,
+        timeout: float | None = None,
+        parent: TypeElement | WebElement | None = None,
+        **query: str | None,
+    ) -> WebElement:
+        """Wait until element is visible and return it."""
+        element = self.browser._get_element(element, **query)  # noqa: SLF001
+        timeout = timeout or self.browser.get_timeout()
+
+        def get_visible_element(_driver: Any) -> WebElement | None:  # noqa: ANN401
+            elements = self.browser.find_elements(element, parent=parent)
+            if elements and elements[0].is_displayed():
+                return elements[0]
+            return None
+
+        return await self.webdriver_wait(
+            get_visible_element,
+            msg or f"{element} is not visible for {timeout} seconds",
+            timeout,
+        )
+
+    async def wait_for_not_visible(
+        self,
+        element: TypeElement | WebElement | None = None,
+        msg: str | None = None,
+        timeout: float | None = None,
+        parent: TypeElement | WebElement | None = None,
+        **query: str | None,
+    ) -> None:
+        """Wait until element is not visible."""
+        element = self.browser._get_element(element, **query)  # noqa: SLF001
+        timeout = timeout or self.browser.get_timeout()
+        await self.webdriver_wait(
+            lambda _driver: not self.browser.is_visible(element, parent=parent),
+            msg or f"{element} is visible for {timeout} seconds",
+            timeout,
+        )
+
+    async def wait_for_present(
+        self,
+        element: TypeElement | WebElement | None = None,
+        msg: str | None = None,
+        timeout: float | None = None,
+        **query: str | None,
+    ) -> WebElement:
+        """Wait until element is present and return it."""
+        element = self.browser._get_element(element, **query)  # noqa: SLF001
+        timeout = timeout or self.browser.get_timeout()
+        return await self.webdriver_wait(
+            lambda _driver: next(iter(self.browser.find_elements(element)), None),
+            msg or f"{element} is not present for {timeout} seconds",
+            timeout,
+        )
+
+    async def wait_for_not_present(
+        self,
+        element: TypeElement | WebElement | None = None,
+        msg: str | None = None,
+        timeout: float | None = None,
+        **query: str | None,
+    ) -> None:
+        """Wait until element is not present."""
+        element = self.browser._get_element(element, **query)  # noqa: SLF001
+        timeout = timeout or self.browser.get_timeout()
+        await self.webdriver_wait(
+            lambda _driver: not self.browser.is_present(element),
+            msg or f"{element} is present for {timeout} seconds",
+            timeout,
+        )
+
+    async def wait_for_text_is_changed(  # noqa: PLR0913
+        self,
+        element: TypeElement | WebElement | None = None,
+        old_text: str | None = None,
+        parent: TypeElement | WebElement | None = None,
+        msg: str | None = None,
+        timeout: float | None = None,
+        **query: str | None,
+    ) -> None:
+        """Wait for text is changed."""
+        element = self.browser._get_element(element, **query)  # noqa: SLF001
+        timeout = timeout or self.browser.get_timeout()
+        await self.webdriver_wait(
+            lambda _driver: old_text
+            != self.browser.get_text(element, parent=parent, visible=False),
+            msg or f"{element} text was not changed for {timeout} seconds",
+            timeout,
+        )
+
+    async def wait_for_attribute_is_changed(  # noqa: PLR0913
+        self,
+        element: TypeElement | WebElement | None = None,
+        attr: str | None = None,
+        old_value: str | None = None,
+        parent: TypeElement | WebElement | None = None,
+        msg: str | None = None,
+        timeout: float | None = None,
+        **query: str | None,
+    ) -> None:
+        """Wait for attribute is changed."""
+        element = self.browser._get_element(element, **query)  # noqa: SLF001
+        timeout = timeout or self.browser.get_timeout()
+        await self.webdriver_wait(
+            lambda _driver: old_value
+            != self.browser.get_attribute(element, attr, parent=parent),
+            msg or f"{element} attribute was not changed for {timeout} seconds",
+            timeout,
+        )
@@ -6,6 +6,7 @@ from typing import Any
 from unittest.case import TestCase
 
 from easelenium.browser import Browser
+from easelenium.browser_pool import get_default_browser_pool
 from easelenium.utils import Logger, get_timestamp
 
 
@@ -16,6 +17,11 @@ class BaseTest(TestCase):
     BROWSER_NAME = None
     FAILED_SCREENSHOT_FOLDER = None
     LOGGER = Logger(name="easyselenim.base_test.BaseTest")
+    # browser is leased from shared pool and is reused by next test classes
+    # with the same browser arguments, set to None to start own browser,
+    # browsers other than Chromium based keep cookies and storage of sites
+    # except the last opened one, see BrowserPool
+    BROWSER_POOL = get_default_browser_pool()
 
     @classmethod
     def setUpClass(cls: type[BaseTest], **kwargs: dict[str, Any]) -> None:
@@ -26,13 +32,19 @@ class BaseTest(TestCase):
         kwargs["logger"] = kwargs.get("logger") or cls.LOGGER
 
         cls.logger = kwargs["logger"]
-        cls.browser = Browser(**kwargs)
+        if cls.BROWSER_POOL:
+            cls.browser = cls.BROWSER_POOL.acquire(**kwargs)
+        else:
+            cls.browser = Browser(**kwargs)
 
     @classmethod
     def tearDownClass(cls: type[BaseTest]) -> None:
         """Tear down class."""
         super().tearDownClass()
-        cls.browser.quit()
+        if cls.BROWSER_POOL:
+            cls.BROWSER_POOL.release(cls.browser)
+        else:
+            cls.browser.quit()
 
     def setUp(self) -> None:
         """Set up."""
@@ -0,0 +1,330 @@
+"""Batch of browser actions which are run with single script."""
+from __future__ import annotations
+
+import traceback
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webelement import WebElement
+
+from easelenium.utils import get_js_script, get_selenium_atom
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+    from easelenium.browser import Browser, TypeElement
+
+
+class BatchStep:
+    """Recorded call of Browser method, `value` is its result after batch is run."""
+
+    def __init__(  # noqa: PLR0913
+        self,
+        method: str,
+        element: TypeElement | WebElement,
+        parent: TypeElement | WebElement | None,
+        args: dict[str, Any],
+        *,
+        visible: bool,
+        native: bool,
+    ) -> None:
+        """Initialize, call site of the step is taken from the stack."""
+        self.method = method
+        self.element = element
+        self.parent = parent
+        self.args = args
+        self.visible = visible
+        self.native = native
+        self.value = None
+        # frames of caller, Batch method, Batch.__add and this method
+        self.call_site = traceback.extract_stack(limit=4)[0]
+
+    def to_js(self) -> dict[str, Any]:
+        """Return step as argument of batch script."""
+        return {
+            "method": self.method,
+            "element": self.__to_js_element(self.element),
+            "parent": self.__to_js_element(self.parent),
+            "args": self.args,
+            "visible": self.visible,
+        }
+
+    @staticmethod
+    def __to_js_element(
+        element: TypeElement | WebElement | None,
+    ) -> list[str] | WebElement | None:
+        if element is None or isinstance(element, WebElement):
+            return element
+        return list(element)
+
+    def __str__(self) -> str:
+        """Return call of the step and where it was recorded."""
+        args = ", ".join(f"{name}={value!r}" for name, value in self.args.items())
+        element = (
+            f"element={self.element.id!r}"
+            if isinstance(self.element, WebElement)
+            else f"element={tuple(self.element)!r}"
+        )
+        return (
+            f"{self.method}({', '.join(filter(None, [element, args]))}) "
+            f"at {Path(self.call_site.filename).name}:{self.call_site.lineno}"
+        )
+
+
+class BatchError(WebDriverException):
+    """Step of batch failed in the page."""
+
+    def __init__(self, index: int, step: BatchStep, error: str) -> None:
+        """Initialize."""
+        super().__init__(f"Batch step {index} {step} failed: {error}")
+        self.index = index
+        self.step = step
+
+
+class Batch:
+    """
+    Actions and reads which are sent to the page as one script.
+
+    Steps are recorded with the same arguments as Browser methods have and
+    are run when `with` block is exited, values of reads are available in
+    returned steps after that. Elements are not waited for, they should be
+    present and visible when batch is run. Values are set and events are
+    fired from the script, so steps which need trusted input, ex. typing
+    to file input or to rich text editor, or steps recorded with
+    `native=True` are run with WebDriver between scripts. If step fails
+    then BatchError with position and call site of the step is raised and
+    the next steps are not run.
+    """
+
+    def __init__(self, browser: Browser) -> None:
+        """Initialize."""
+        self.browser = browser
+        self.steps = []
+
+    def __enter__(self) -> Batch:  # noqa: PYI034
+        """Start recording steps."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        exc_traceback: TracebackType | None,
+    ) -> None:
+        """Run recorded steps if `with` block succeeded."""
+        if exc_type is None:
+            self.run()
+
+    def type(  # noqa: A003
+        self,
+        element: TypeElement | WebElement | None = None,
+        text: str | None = None,
+        parent: TypeElement | WebElement | None = None,
+        *,
+        native: bool = False,
+        **query: str | None,
+    ) -> BatchStep:
+        """Record typing text at element."""
+        return self.__add("type", element, parent, query, {"text": text}, native)
+
+    def click(
+        self,
+        element: TypeElement | WebElement | None = None,
+        parent: TypeElement | WebElement | None = None,
+        *,
+        native: bool = False,
+        **query: str | None,
+    ) -> BatchStep:
+        """Record click on element."""
+        return self.__add("click", element, parent, query, {}, native)
+
+    def select_option_by_value_from_dropdown(
+        self,
+        element: TypeElement | WebElement | None = None,
+        value: str | None = None,
+        parent: TypeElement | WebElement | None = None,
+        *,
+        native: bool = False,
+        **query: str | None,
+    ) -> BatchStep:
+        """Record selection of option by value."""
+        assert value is not None, "value not specified"  # noqa: S101
+        return self.__add(
+            "select_option_by_value_from_dropdown",
+            element,
+            parent,
+            query,
+            {"value": value},
+            native,
+        )
+
+    def select_option_by_text_from_dropdown(
+        self,
+        element: TypeElement | WebElement | None = None,
+        text: str | None = None,
+        parent: TypeElement | WebElement | None = None,
+        *,
+        native: bool = False,
+        **query: str | None,
+    ) -> BatchStep:
+        """Record selection of option by text."""
+        return self.__add(
+            "select_option_by_text_from_dropdown",
+            element,
+            parent,
+            query,
+            {"text": text},
+            native,
+        )
+
+    def select_option_by_index_from_dropdown(
+        self,
+        element: TypeElement | WebElement | None = None,
+        index: int = 0,
+        parent: TypeElement | WebElement | None = None,
+        *,
+        native: bool = False,
+        **query: str | None,
+    ) -> BatchStep:
+        """Record selection of option by index."""
+        return self.__add(
+            "select_option_by_index_from_dropdown",
+            element,
+            parent,
+            query,
+            {"index": index},
+            native,
+        )
+
+    def get_text(
+        self,
+        element: TypeElement | WebElement | None = None,
+        parent: TypeElement | WebElement | None = None,
+        *,
+        visible: bool = True,
+        native: bool = False,
+        **query: str | None,
+    ) -> BatchStep:
+        """
+        Record reading of text of the element.
+
+        Text is rendered `innerText` of the element, like `WebElement.text`
+        it is empty for hidden element and non-breaking spaces are replaced
+        with spaces, but whitespace around line breaks can differ.
+        """
+        return self.__add(
+            "get_text",
+            element,
+            parent,
+            query,
+            {},
+            native,
+            visible=visible,
+        )
+
+    def get_attribute(  # noqa: PLR0913
+        self,
+        element: TypeElement | WebElement | None = None,
+        attr: str | None = None,
+        parent: TypeElement | WebElement | None = None,
+        *,
+        visible: bool = False,
+        native: bool = False,
+        **query: str | None,
+    ) -> BatchStep:
+        """Record reading of attribute of the element."""
+        assert attr is not None, "attr is not specified"  # noqa: S101
+        return self.__add(
+            "get_attribute",
+            element,
+            parent,
+            query,
+            {"attr": attr},
+            native,
+            visible=visible,
+        )
+
+    def __add(  # noqa: PLR0913
+        self,
+        method: str,
+        element: TypeElement | WebElement | None,
+        parent: TypeElement | WebElement | None,
+        query: dict[str, str | None],
+        args: dict[str, Any],
+        native: bool,  # noqa: FBT001
+        *,
+        visible: bool = True,
+    ) -> BatchStep:
+        step = BatchStep(
+            method,
+            self.browser._get_element(element, **query),  # noqa: SLF001
+            parent,
+            args,
+            visible=visible,
+            native=native,
+        )
+        self.steps.append(step)
+        return step
+
+    def run(self) -> list[Any]:
+        """Run recorded steps and return their values."""
+        script = (
+            f"var isDisplayed = {get_selenium_atom('isDisplayed')};\n"
+            f"var getAttribute = {get_selenium_atom('getAttribute')};\n"
+            + get_js_script("find_elements.js", "get_text.js", "batch.js")
+        )
+        self.browser.stats["batches"] += 1
+        index = 0
+        while index < len(self.steps):
+            if self.steps[index].native:
+                self.__run_natively(index)
+                index += 1
+                continue
+
+            steps = self.steps[index:]
+            native_steps = [i for i, step in enumerate(steps) if step.native]
+            if native_steps:
+                steps = steps[: native_steps[0]]
+
+            self.browser.stats["batch_scripts"] += 1
+            result = self.browser.execute_js(script, [s.to_js() for s in steps])
+            for i, value in enumerate(result["results"]):
+                self.__set_value(index + i, value)
+            index += len(result["results"])
+
+            stopped = result["stopped"]
+            if stopped and stopped.get("native"):
+                # value can't be set from the script
+                self.__run_natively(index)
+                index += 1
+            elif stopped:
+                raise BatchError(index, self.steps[index], stopped["error"])
+
+        return [step.value for step in self.steps]
+
+    def __run_natively(self, index: int) -> None:
+        step = self.steps[index]
+        self.browser.stats["batch_native_steps"] += 1
+        kwargs = dict(step.args)
+        if step.method in ("get_text", "get_attribute"):
+            kwargs["visible"] = step.visible
+        try:
+            value = getattr(self.browser, step.method)(
+                element=step.element,
+                parent=step.parent,
+                **kwargs,
+            )
+        except WebDriverException as e:
+            raise BatchError(index, step, e.msg or repr(e)) from e
+        step.value = value
+
+    def __set_value(self, index: int, value: Any) -> None:  # noqa: ANN401
+        step = self.steps[index]
+        step.value = value
+        self.browser._safe_log(  # noqa: SLF001
+            "Batch step {}: {} -> '{}'",
+            index,
+            step,
+            value,
+        )
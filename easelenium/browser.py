@@ -4,13 +4,20 @@ from __future__ import annotations
 import os
 import tempfile
 import traceback
+from collections import Counter, OrderedDict
+from contextlib import suppress
+from copy import deepcopy
 from functools import lru_cache
 from pathlib import Path
 from tempfile import gettempdir
-from typing import TYPE_CHECKING, Any, Final, Tuple, Union
+from time import monotonic
+from typing import TYPE_CHECKING, Any, Callable, Final, Tuple, Union
+from urllib.parse import urlsplit
 
 from selenium.common.exceptions import (
+    JavascriptException,
     NoSuchElementException,
+    StaleElementReferenceException,
     TimeoutException,
     WebDriverException,
 )
@@ -25,42 +32,72 @@ from selenium.webdriver.firefox.service import Service as FirefoxService
 from selenium.webdriver.ie.service import Service as IeService
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support.select import Select
-from selenium.webdriver.support.wait import WebDriverWait
 from webdriver_manager.chrome import ChromeDriverManager
+from webdriver_manager.core.os_manager import ChromeType, OperationSystemManager
 from webdriver_manager.firefox import GeckoDriverManager
 from webdriver_manager.microsoft import EdgeChromiumDriverManager, IEDriverManager
 
+from easelenium.batch import Batch
+from easelenium.driver_cache import DriverPathCache
+from easelenium.element_cache import ElementCache
 from easelenium.mouse import Mouse
-from easelenium.utils import Logger, get_random_value, get_timestamp
+from easelenium.utils import (
+    Logger,
+    get_js_script,
+    get_random_value,
+    get_selenium_atom,
+    get_timestamp,
+)
+from easelenium.wait_policy import WaitPolicy, WaitResult
 
 if TYPE_CHECKING:
+    from selenium.webdriver.remote.remote_connection import RemoteConnection
     from selenium.webdriver.remote.webdriver import WebDriver
 
+    from easelenium.browser_pool import BrowserPool
+    from easelenium.command_executor import CommandTimings
+
 TypeElement = Union[WebElement, Tuple[str, str]]
 
 
-def browser_decorator(
+def browser_decorator(  # noqa: PLR0913
     browser_name: str | None = None,
     timeout: float = 5,
     logger: Logger = None,
     *,
     headless: bool = False,
     webdriver_kwargs: dict[str, Any] | None = None,
+    pool: BrowserPool | bool | None = True,
 ) -> Any:  # noqa: ANN401
-    """Python decorator with Browser initialization."""
+    """
+    Python decorator with Browser initialization.
+
+    Browser is leased from `pool`, True means shared default pool and
+    None or False means that new browser is started and quit for every call.
+    """
 
     def func_decorator(func: callable) -> Any:  # noqa: ANN401
         def wrapper(*args: list[Any], **kwargs: dict[str, Any]) -> Any:  # noqa: ANN401
+            # imported here because browser_pool module imports Browser
+            from easelenium.browser_pool import (  # noqa: PLC0415
+                get_default_browser_pool,
+            )
+
+            browser_pool = get_default_browser_pool() if pool is True else pool
             browser = None
             return_value = None
             try:
-                browser = Browser(
-                    browser_name=browser_name,
-                    logger=logger,
-                    timeout=timeout,
-                    headless=headless,
-                    webdriver_kwargs=webdriver_kwargs,
-                )
+                browser_kwargs = {
+                    "browser_name": browser_name,
+                    "logger": logger,
+                    "timeout": timeout,
+                    "headless": headless,
+                    "webdriver_kwargs": webdriver_kwargs,
+                }
+                if browser_pool:
+                    browser = browser_pool.acquire(**browser_kwargs)
+                else:
+                    browser = Browser(**browser_kwargs)
 
                 kwargs["browser"] = browser
                 value = func(*args, **kwargs)
@@ -73,7 +110,9 @@ def browser_decorator(
                     pass
                 traceback.print_exc()
             finally:
-                if browser:
+                if browser and browser_pool:
+                    browser_pool.release(browser)
+                elif browser:
                     browser.quit()
 
             return return_value
@@ -93,6 +132,11 @@ class Browser:
     IE: Final = "ie"
     EDGE: Final = "edge"
     DEFAULT_BROWSER = None
+    WAIT_IN_PYTHON: Final = "python"
+    WAIT_IN_BROWSER: Final = "browser"
+
+    DESCRIBE_FULL: Final = "full"
+    DESCRIBE_CHEAP: Final = "cheap"
 
     __BROWSERS: Final = [
         FF,
@@ -111,6 +155,17 @@ class Browser:
         GC: ("chromedriver", Chrome, ChromeService),
         GC_HEADLESS: ("chromedriver", Chrome, ChromeService),
     }
+    __ELEMENT_PROPERTIES: Final = (
+        "text",
+        "tag_name",
+        "displayed",
+        "rect",
+        "location",
+        "size",
+    )
+    __ELEMENT_PROPERTY_KINDS: Final = ("attr", "prop", "css")
+    # origins of the most recently found elements which are kept
+    __MAX_ORIGINS: Final = 1000
     __LOCATOR_MAPPINGS: Final = {
         "by_name": By.NAME,
         "by_id": By.ID,
@@ -131,15 +186,76 @@ class Browser:
         headless: bool = False,
         maximize: bool = True,
         webdriver_kwargs: dict[str, Any] | None = None,
+        cache_elements: bool = False,
+        wait_engine: str = WAIT_IN_PYTHON,
+        wait_policy: WaitPolicy | None = None,
+        log_descriptions: str = DESCRIBE_FULL,
+        cache_descriptions: bool = False,
+        command_executor: Callable[[RemoteConnection], RemoteConnection] | None = None,
+        track_network: bool = False,
+        network_idle_gate: int | None = None,
+        network_idle_gate_timeout: float = 2,
     ) -> None:
-        """Initialize."""
+        """
+        Initialize.
+
+        If `cache_elements` is True then found elements are reused until
+        navigation is done, frame is switched or DOM is changed, DOM is
+        checked by the same script which finds elements on every lookup.
+        If `wait_engine` is WAIT_IN_BROWSER then wait_for_* conditions are
+        checked inside the page on every DOM mutation instead of polling
+        them from Python.
+        `wait_policy` sets poll intervals and ignored exceptions of waits done
+        in Python, by default polling starts at 25ms and backs off to 500ms.
+        Elements in log messages are described only when message is emitted.
+        If `log_descriptions` is DESCRIBE_CHEAP then they are described by
+        locators they were found with, without requests to the browser.
+        If `cache_descriptions` is True then full description of element is
+        requested once until navigation is done or frame is switched.
+        Elements which get stale during click, type, get_text, get_attribute
+        and dropdown operations are found again by locators they were found
+        with until timeout is reached, see `stale_*` counters in `stats`.
+        Locators are kept for the last 1000 found elements.
+        Element operations with `visible` argument wait until element is
+        visible if it is True, otherwise they act on element once it is found.
+        `command_executor` is called with connection created by WebDriver and
+        returns connection which is used instead, ex. PooledCommandExecutor
+        which keeps connections to the driver open and times commands.
+        If `track_network` is True then fetch and XHR requests are counted
+        from the start of every document in Chromium based browsers and
+        after `get` in other browsers, see `wait_for_network_idle`.
+        If `network_idle_gate` is set then click, type and select operations
+        wait until network is quiet for `network_idle_gate` milliseconds
+        before they act, operation is done anyway if network is not quiet
+        in `network_idle_gate_timeout` seconds.
+        """
+        # arguments are kept before options are changed, see get_init_kwargs
+        self.__init_kwargs = self.__copy_init_kwargs(locals())
         if webdriver_kwargs is None:
             webdriver_kwargs = {}
+        if wait_engine not in (self.WAIT_IN_PYTHON, self.WAIT_IN_BROWSER):
+            msg = f"Unsupported wait engine '{wait_engine}'"
+            raise ValueError(msg)
+        if log_descriptions not in (self.DESCRIBE_FULL, self.DESCRIBE_CHEAP):
+            msg = f"Unsupported elements description mode '{log_descriptions}'"
+            raise ValueError(msg)
 
         self.__browser_name = self.DEFAULT_BROWSER or browser_name or self.FF
 
         self.logger = logger
         self.__timeout = timeout
+        self.stats = Counter()
+        self.__wait_engine = wait_engine
+        self.__script_timeout = None
+        self.__wait_policy = wait_policy or WaitPolicy()
+        self.last_wait = None
+        self.__log_descriptions = log_descriptions
+        self.__descriptions = {} if cache_descriptions else None
+        # element id -> (locator, parent, index) it was found with
+        self.__origins = OrderedDict()
+        self.__track_network = track_network or network_idle_gate is not None
+        self.__network_idle_gate = network_idle_gate
+        self.__network_idle_gate_timeout = network_idle_gate_timeout
 
         headless = headless or "headless" in self.__browser_name
         if self.is_gc():
@@ -154,8 +270,19 @@ class Browser:
             )
 
         self._driver = self.__create_driver(self.__browser_name, webdriver_kwargs)
+        self.__element_cache = (
+            ElementCache(self._driver.execute_script, self.stats)
+            if cache_elements
+            else None
+        )
+        if command_executor:
+            self._driver.command_executor = command_executor(
+                self._driver.command_executor,
+            )
         if maximize:
             self._driver.maximize_window()
+        if self.__track_network:
+            self.__add_network_tracker()
 
         screenshot_path = Path(gettempdir()) / "easelenium_screenshots"
         self.__screenshot_path = str(screenshot_path)
@@ -165,6 +292,16 @@ class Browser:
 
         self.mouse = Mouse(self)
 
+    def __add_network_tracker(self) -> None:
+        if not hasattr(self._driver, "execute_cdp_cmd"):
+            return
+        # otherwise the tracker is added after `get`
+        with suppress(WebDriverException):
+            self._driver.execute_cdp_cmd(
+                "Page.addScriptToEvaluateOnNewDocument",
+                {"source": get_js_script("network_tracker.js")},
+            )
+
     def __set_chrome_kwargs(
         self,
         *,
@@ -198,30 +335,37 @@ class Browser:
     @classmethod
     @lru_cache(maxsize=None)
     def _find_driver_path(cls: type[Browser], browser_name: str) -> str | None:
-        """Return driver path."""
+        """Return driver path, it is cached on disk for installed browser version."""
         assert browser_name in cls.__BROWSERS  # noqa: S101
         assert browser_name in cls.__DRIVERS_MAPPING  # noqa: S101
 
-        service_klass = cls.__DRIVERS_MAPPING[browser_name][2]
+        driver_filename, _, service_klass = cls.__DRIVERS_MAPPING[browser_name]
 
         if service_klass == FirefoxService:
             geckodriver_snap = Path("/snap/bin/geckodriver")
             if geckodriver_snap.exists():
-                driver_path = geckodriver_snap.as_posix()
-            else:
-                driver_path = GeckoDriverManager().install()
-            return driver_path
-        if service_klass == ChromeService:
-            manager = ChromeDriverManager
+                return geckodriver_snap.as_posix()
+            manager, browser_type = GeckoDriverManager, "firefox"
+        elif service_klass == ChromeService:
+            manager, browser_type = ChromeDriverManager, ChromeType.GOOGLE
         elif service_klass == IeService:
-            manager = IEDriverManager
+            manager, browser_type = IEDriverManager, None
         elif service_klass == EdgeService:
-            manager = EdgeChromiumDriverManager
+            manager, browser_type = EdgeChromiumDriverManager, ChromeType.MSEDGE
 
-        try:
-            return manager().install()
-        except AttributeError:
-            return None
+        def install() -> str | None:
+            try:
+                return manager().install()
+            except AttributeError:
+                return None
+
+        browser_version = (
+            OperationSystemManager().get_browser_version_from_os(browser_type)
+            if browser_type
+            else None
+        )
+        key = f"{driver_filename}:{browser_version or 'unknown'}"
+        return DriverPathCache().get(key, install)
 
     @classmethod
     def get_supported_browsers(cls: type[Browser]) -> list[str]:
@@ -232,6 +376,42 @@ class Browser:
         """Return browser initials."""
         return self.__browser_name
 
+    def get_init_kwargs(self) -> dict[str, Any]:
+        """Return arguments browser was created with, ex. to start the same one."""
+        return self.__copy_init_kwargs(self.__init_kwargs)
+
+    @staticmethod
+    def __copy_init_kwargs(init_kwargs: dict[str, Any]) -> dict[str, Any]:
+        kwargs = {name: value for name, value in init_kwargs.items() if name != "self"}
+        if kwargs["webdriver_kwargs"]:
+            # options are changed by Browser, other values are shared
+            kwargs["webdriver_kwargs"] = {
+                name: deepcopy(value) if name == "options" else value
+                for name, value in kwargs["webdriver_kwargs"].items()
+            }
+        return kwargs
+
+    def clear_state(self) -> None:
+        """Forget stats, last wait, found elements and timings of commands."""
+        self.stats.clear()
+        self.last_wait = None
+        self.__forget_elements()
+        timings = self.get_command_timings()
+        if timings:
+            timings.clear()
+
+    def get_command_timings(self) -> CommandTimings | None:
+        """Return timings of WebDriver commands if command executor records them."""
+        return getattr(self._driver.command_executor, "timings", None)
+
+    def get_timeout(self) -> float:
+        """Return default timeout of waits."""
+        return self.__timeout
+
+    def get_wait_policy(self) -> WaitPolicy:
+        """Return policy of waits done in Python."""
+        return self.__wait_policy
+
     def __create_driver(self, name: str, webdriver_kwargs: dict[str, Any]) -> WebDriver:
         if os.environ.get("TMPDIR") is None:
             # fix TMPDIR if not exists
@@ -353,16 +533,118 @@ class Browser:
         if isinstance(element, WebElement):
             return [element]
 
+        if self.__element_cache:
+            try:
+                elements = self.__element_cache.find(element, parent)
+            except JavascriptException:
+                # invalid locators are reported by WebDriver with its exceptions
+                elements = self.__find_webelements(element, parent)
+        else:
+            elements = self.__find_webelements(element, parent)
+
+        for i, webelement in enumerate(elements):
+            self.__remember_origin(webelement, (element, parent, i))
+        return elements
+
+    def __remember_origin(
+        self,
+        webelement: WebElement,
+        origin: tuple[TypeElement, TypeElement | WebElement | None, int],
+    ) -> None:
+        self.__origins[webelement.id] = origin
+        self.__origins.move_to_end(webelement.id)
+        if len(self.__origins) > self.__MAX_ORIGINS:
+            self.__origins.popitem(last=False)
+
+    def __find_webelements(
+        self,
+        element: TypeElement,
+        parent: TypeElement | WebElement | None,
+    ) -> list[WebElement]:
         if parent:
             assert isinstance(element, (list, tuple))  # noqa: S101
-            if isinstance(parent, WebElement):
-                return parent.find_elements(*element)
-
-            parent = self._driver.find_element(*parent)
+            if not isinstance(parent, WebElement):
+                parent = self.find_element(parent)
             return parent.find_elements(*element)
 
         return self._driver.find_elements(*element)
 
+    def __forget_elements(self) -> None:
+        if self.__element_cache:
+            self.__element_cache.clear()
+        if self.__descriptions is not None:
+            self.__descriptions.clear()
+        self.__origins.clear()
+
+    def __run_on_element(
+        self,
+        element: TypeElement | WebElement,
+        parent: TypeElement | WebElement | None,
+        action: Callable[[WebElement], Any],
+        *,
+        visible: bool = True,
+    ) -> Any:  # noqa: ANN401
+        """
+        Find element and return result of action with it.
+
+        If element gets stale then it is found again by the locator and the
+        parents it was found with and action is repeated, until timeout of
+        the browser is over.
+        """
+        started_at = monotonic()
+        timeout = None
+        recovering = False
+        while True:
+            try:
+                if visible:
+                    webelement = self.wait_for_visible(
+                        element=element,
+                        parent=parent,
+                        timeout=timeout,
+                    )
+                else:
+                    webelement = self.find_element(element=element, parent=parent)
+                value = action(webelement)
+            except StaleElementReferenceException:
+                timeout = self.__timeout - (monotonic() - started_at)
+                if timeout <= 0 or not self.__is_recoverable(element):
+                    raise
+                self.stats["stale_elements"] += 1
+                recovering = True
+                if self.__element_cache:
+                    self.__element_cache.clear()
+                element = self.webdriver_wait(
+                    lambda _driver, e=element, p=parent: self.__find_again(e, p),
+                    f"Stale element is not found again for {timeout:.2f} seconds",
+                    timeout,
+                )
+                parent = None
+                timeout = max(self.__timeout - (monotonic() - started_at), 0.1)
+                continue
+
+            if recovering:
+                self.stats["stale_recoveries"] += 1
+            return value
+
+    def __is_recoverable(self, element: TypeElement | WebElement) -> bool:
+        return not isinstance(element, WebElement) or element.id in self.__origins
+
+    def __find_again(
+        self,
+        element: TypeElement | WebElement,
+        parent: TypeElement | WebElement | None = None,
+    ) -> WebElement | None:
+        index = 0
+        if isinstance(element, WebElement):
+            element, parent, index = self.__origins[element.id]
+        if isinstance(parent, WebElement) and parent.id in self.__origins:
+            # parent could be replaced together with the element
+            parent = self.__find_again(parent)
+            if parent is None:
+                return None
+        elements = self.__get_webelements(element=element, parent=parent)
+        return elements[index] if index < len(elements) else None
+
     def to_string(  # noqa: PLR0913
         self,
         element: TypeElement | WebElement | None = None,
@@ -389,26 +671,40 @@ class Browser:
             by_class=by_class,
         )
         if isinstance(element, WebElement):
-            string = "tag_name: '%s'" % element.tag_name
-            _id = element.get_attribute("id")
-            if _id:
-                string += ", id: '%s'" % _id
-            class_name = element.get_attribute("class")
-            if class_name:
-                string += ", class: '%s'" % class_name
-            text = element.text
-            if text:
-                string += ", text: '%s'" % text
-            value = element.get_attribute("value")
-            if value:
-                string += ", value: '%s'" % value
-            name = element.get_attribute("name")
-            if name and element.tag_name in ["frame", "iframe"]:
-                string += ", name: '%s'" % name
-            return "Element {%s}" % string
+            return self.describe_elements([element])[0]
 
         return f"Element {{By: '{element[0]}', value: '{element[1]}'}}"
 
+    def describe_elements(self, elements: list[TypeElement | WebElement]) -> list[str]:
+        """Return elements as strings, all WebElements are described in one call."""
+        webelements = [e for e in elements if isinstance(e, WebElement)]
+        properties = iter(
+            self._driver.execute_script(
+                f"var isDisplayed = {get_selenium_atom('isDisplayed')};\n"
+                f"var getAttribute = {get_selenium_atom('getAttribute')};\n"
+                + get_js_script("get_text.js", "describe_elements.js"),
+                webelements,
+            )
+            if webelements
+            else [],
+        )
+        return [
+            self.__format_description(next(properties))
+            if isinstance(element, WebElement)
+            else self.to_string(element)
+            for element in elements
+        ]
+
+    @staticmethod
+    def __format_description(properties: dict[str, str | None]) -> str:
+        string = f"tag_name: '{properties['tag_name']}'"
+        for name in ("id", "class", "text", "value"):
+            if properties[name]:
+                string += f", {name}: '{properties[name]}'"
+        if properties["name"] and properties["tag_name"] in ["frame", "iframe"]:
+            string += f", name: '{properties['name']}'"
+        return f"Element {{{string}}}"
+
     def is_ff(self) -> bool:
         """Return True if browser is Firefox."""
         return self.__browser_name.startswith(Browser.FF)
@@ -421,13 +717,31 @@ class Browser:
         """Return True if browser is Google Chrome."""
         return self.__browser_name.startswith(Browser.GC)
 
-    def _safe_log(self, *args: list[Any]) -> None:
+    def _safe_log(self, msg: str, *args: list[Any]) -> None:
         if self.logger:
+            # elements are described only if message is emitted by the logger,
+            # lazy message expects all arguments to be callables
             args = [
-                self.to_string(arg) if isinstance(arg, WebElement) else str(arg)
+                (lambda e=arg: self.__describe(e))
+                if isinstance(arg, WebElement)
+                else (lambda a=arg: a)
                 for arg in args
             ]
-            self.logger.info(*args)
+            self.logger.opt(lazy=True).info(msg, *args)
+
+    def __describe(self, element: WebElement) -> str:
+        if self.__log_descriptions == self.DESCRIBE_CHEAP:
+            origin = self.__origins.get(element.id)
+            if origin:
+                locator = origin[0]
+                return f"Element {{By: '{locator[0]}', value: '{locator[1]}'}}"
+            return f"Element {{id: '{element.id}'}}"
+
+        if self.__descriptions is None:
+            return self.to_string(element)
+        if element.id not in self.__descriptions:
+            self.__descriptions[element.id] = self.to_string(element)
+        return self.__descriptions[element.id]
 
     """
         WebElement's wrapped functions
@@ -446,6 +760,8 @@ class Browser:
         by_tag: str | None = None,
         by_css: str | None = None,
         by_class: str | None = None,
+        *,
+        visible: bool = True,
     ) -> None:
         """Type text at element."""
         element = self._get_element(
@@ -460,17 +776,24 @@ class Browser:
             by_class=by_class,
         )
 
-        self.wait_for_visible(element=element, parent=parent)
-        element = self.find_element(element=element, parent=parent)
-        try:
-            element.clear()
-        except WebDriverException as e:
-            if e.msg != "Element must be user-editable in order to clear it.":
-                raise
+        def type_text(webelement: WebElement) -> None:
+            try:
+                webelement.clear()
+            except WebDriverException as e:
+                if e.msg != "Element must be user-editable in order to clear it.":
+                    raise
 
-        self._safe_log("Typing '%s' at '%s'", text, element)
+            self._safe_log("Typing '{}' at '{}'", text, webelement)
 
-        element.send_keys(text)
+            webelement.send_keys(text)
+
+        self.__wait_for_network_idle_gate()
+        self.__run_on_element(
+            element,
+            parent,
+            type_text,
+            visible=visible,
+        )
 
     def click(  # noqa: PLR0913
         self,
@@ -484,6 +807,8 @@ class Browser:
         by_tag: str | None = None,
         by_css: str | None = None,
         by_class: str | None = None,
+        *,
+        visible: bool = True,
     ) -> None:
         """Click on element."""
         element = self._get_element(
@@ -497,12 +822,19 @@ class Browser:
             by_css=by_css,
             by_class=by_class,
         )
-        self.wait_for_visible(element=element, parent=parent)
-        element = self.find_element(element=element, parent=parent)
 
-        self._safe_log("Clicking at '%s'", element)
+        def click(webelement: WebElement) -> None:
+            self._safe_log("Clicking at '{}'", webelement)
+
+            webelement.click()
 
-        element.click()
+        self.__wait_for_network_idle_gate()
+        self.__run_on_element(
+            element,
+            parent,
+            click,
+            visible=visible,
+        )
 
     def get_parent(  # noqa: PLR0913
         self,
@@ -557,14 +889,15 @@ class Browser:
             by_css=by_css,
             by_class=by_class,
         )
-        if visible:
-            self.wait_for_visible(element=element, parent=parent)
-        element = self.find_element(element=element, parent=parent)
-        text = element.text
 
-        self._safe_log("Getting text from '%s' -> '%s'", element, text)
+        def get_text(webelement: WebElement) -> str:
+            text = webelement.text
+
+            self._safe_log("Getting text from '{}' -> '{}'", webelement, text)
 
-        return text
+            return text
+
+        return self.__run_on_element(element, parent, get_text, visible=visible)
 
     def get_attribute(  # noqa: PLR0913
         self,
@@ -595,14 +928,20 @@ class Browser:
             by_css=by_css,
             by_class=by_class,
         )
-        if visible:
-            self.wait_for_visible(element=element, parent=parent)
-        element = self.find_element(element=element, parent=parent)
-        value = element.get_attribute(attr)
 
-        self._safe_log(f"Getting attribute {attr} from {element} -> {value}")
+        def get_attribute(webelement: WebElement) -> str:
+            value = webelement.get_attribute(attr)
 
-        return value
+            self._safe_log(
+                "Getting attribute {} from {} -> {}",
+                attr,
+                webelement,
+                value,
+            )
+
+            return value
+
+        return self.__run_on_element(element, parent, get_attribute, visible=visible)
 
     def get_tag_name(  # noqa: PLR0913
         self,
@@ -749,7 +1088,7 @@ class Browser:
             by_class=by_class,
         ).location
 
-        self._safe_log(f"Getting location from {element} -> {location}")
+        self._safe_log("Getting location from {} -> {}", element, location)
 
         return int(location["x"]), int(location["y"])
 
@@ -778,10 +1117,159 @@ class Browser:
             by_class=by_class,
         ).size
 
-        self._safe_log(f"Getting dimensions from {element} -> {size}")
+        self._safe_log("Getting dimensions from {} -> {}", element, size)
 
         return size["width"], size["height"]
 
+    def get_rect(  # noqa: PLR0913
+        self,
+        element: TypeElement | WebElement | None = None,
+        by_id: str | None = None,
+        by_xpath: str | None = None,
+        by_link: str | None = None,
+        by_partial_link: str | None = None,
+        by_name: str | None = None,
+        by_tag: str | None = None,
+        by_css: str | None = None,
+        by_class: str | None = None,
+    ) -> tuple[int, int, int | float, int | float]:
+        """Return tuple like (x, y, width, height) requested with one call."""
+        rect = self.find_element(
+            element=element,
+            by_id=by_id,
+            by_xpath=by_xpath,
+            by_link=by_link,
+            by_partial_link=by_partial_link,
+            by_name=by_name,
+            by_tag=by_tag,
+            by_css=by_css,
+            by_class=by_class,
+        ).rect
+
+        self._safe_log("Getting rect from {} -> {}", element, rect)
+
+        return self.__rect_to_tuple(rect)
+
+    def get_rects(
+        self,
+        elements: list[TypeElement | WebElement] | TypeElement,
+        parent: TypeElement | WebElement | None = None,
+    ) -> list[tuple[int, int, int | float, int | float] | None]:
+        """Return list of tuples like (x, y, width, height), see get_properties."""
+        return [
+            p and self.__rect_to_tuple(p["rect"])
+            for p in self.get_properties(elements, ["rect"], parent)
+        ]
+
+    @staticmethod
+    def __rect_to_tuple(
+        rect: dict[str, int | float],
+    ) -> tuple[int, int, int | float, int | float]:
+        # location is rounded the same way as WebElement.location is
+        return round(rect["x"]), round(rect["y"]), rect["width"], rect["height"]
+
+    def get_properties(
+        self,
+        elements: list[TypeElement | WebElement] | TypeElement,
+        properties: list[str],
+        parent: TypeElement | WebElement | None = None,
+    ) -> list[dict[str, Any] | None]:
+        """
+        Return properties of elements with single browser call.
+
+        `elements` is a list of elements and locators, every locator is
+        replaced by the first element it finds, or a locator which is replaced
+        by all elements it finds. Supported properties are "text" (empty for
+        hidden element like in get_text), "tag_name", "displayed", "rect",
+        "location", "size", "attr:<name>" (the same as get_attribute),
+        "prop:<name>" (DOM property) and "css:<name>" (computed style). Result is a list of dicts like {property: value} or None for
+        locators which did not find any element.
+        """
+        for prop in properties:
+            kind, separator, name = prop.partition(":")
+            if separator:
+                supported = kind in self.__ELEMENT_PROPERTY_KINDS and bool(name)
+            else:
+                supported = prop in self.__ELEMENT_PROPERTIES
+            if not supported:
+                msg = f"Unsupported element property '{prop}'"
+                raise ValueError(msg)
+
+        find_all = self.__is_locator(elements)
+        targets = [
+            e if isinstance(e, WebElement) else list(e)
+            for e in ([elements] if find_all else elements)
+        ]
+        if not targets:
+            return []
+        if parent and not isinstance(parent, WebElement):
+            parent = list(parent)
+
+        found = self._driver.execute_script(
+            f"var isDisplayed = {get_selenium_atom('isDisplayed')};\n"
+            f"var getAttribute = {get_selenium_atom('getAttribute')};\n"
+            + get_js_script("find_elements.js", "get_text.js", "get_properties.js"),
+            targets,
+            parent,
+            list(properties),
+            find_all,
+        )
+        if found is None:
+            msg = f"Didn't find any elements for selector - {parent}"
+            raise NoSuchElementException(msg)
+        return found
+
+    @staticmethod
+    def __is_locator(element: Any) -> bool:  # noqa: ANN401
+        return (
+            isinstance(element, tuple)
+            and len(element) == 2  # noqa: PLR2004
+            and isinstance(element[0], str)
+        )
+
+    def get_elements_texts(
+        self,
+        elements: list[TypeElement | WebElement] | TypeElement,
+        parent: TypeElement | WebElement | None = None,
+    ) -> list[str | None]:
+        """Return texts of elements, see get_properties."""
+        return [
+            p and p["text"] for p in self.get_properties(elements, ["text"], parent)
+        ]
+
+    def get_elements_attributes(
+        self,
+        elements: list[TypeElement | WebElement] | TypeElement,
+        attr: str,
+        parent: TypeElement | WebElement | None = None,
+    ) -> list[str | None]:
+        """Return attribute of elements, see get_properties."""
+        prop = f"attr:{attr}"
+        return [p and p[prop] for p in self.get_properties(elements, [prop], parent)]
+
+    def get_elements_locations(
+        self,
+        elements: list[TypeElement | WebElement] | TypeElement,
+        parent: TypeElement | WebElement | None = None,
+    ) -> list[tuple[int, int] | None]:
+        """Return list of tuples like (x, y), see get_properties."""
+        # location is rounded the same way as WebElement.location is
+        return [
+            p and (round(p["location"]["x"]), round(p["location"]["y"]))
+            for p in self.get_properties(elements, ["location"], parent)
+        ]
+
+    def get_elements_dimensions(
+        self,
+        elements: list[TypeElement | WebElement] | TypeElement,
+        parent: TypeElement | WebElement | None = None,
+    ) -> list[tuple[int | float, int | float] | None]:
+        """Return list of tuples like (width, height), see get_properties."""
+        return [
+            p and (p["size"]["width"], p["size"]["height"])
+            for p in self.get_properties(elements, ["size"], parent)
+        ]
+
     """
         Dropdown list related methods
     """
@@ -798,6 +1286,8 @@ class Browser:
         by_tag: str | None = None,
         by_css: str | None = None,
         by_class: str | None = None,
+        *,
+        visible: bool = True,
     ) -> str:
         """Return value of the selected option."""
         element = self._get_element(
@@ -811,14 +1301,24 @@ class Browser:
             by_css=by_css,
             by_class=by_class,
         )
-        self.wait_for_visible(element=element, parent=parent)
 
-        element = self.find_element(element=element, parent=parent)
-        value = Select(element).first_selected_option.get_attribute("value")
+        def get_selected_value(webelement: WebElement) -> str:
+            value = Select(webelement).first_selected_option.get_attribute("value")
+
+            self._safe_log(
+                "Getting selected value from '{}' -> '{}'",
+                webelement,
+                value,
+            )
 
-        self._safe_log("Getting selected value from '%s' -> '%s'", element, value)
+            return value
 
-        return value
+        return self.__run_on_element(
+            element,
+            parent,
+            get_selected_value,
+            visible=visible,
+        )
 
     def get_selected_text_from_dropdown(  # noqa: PLR0913
         self,
@@ -832,6 +1332,8 @@ class Browser:
         by_tag: str | None = None,
         by_css: str | None = None,
         by_class: str | None = None,
+        *,
+        visible: bool = True,
     ) -> str:
         """Return text of the selected option."""
         element = self._get_element(
@@ -845,15 +1347,20 @@ class Browser:
             by_css=by_css,
             by_class=by_class,
         )
-        self.wait_for_visible(element=element, parent=parent)
 
-        element = self.find_element(element=element, parent=parent)
+        def get_selected_text(webelement: WebElement) -> str:
+            text = Select(webelement).first_selected_option.text
 
-        text = Select(element).first_selected_option.text
+            self._safe_log("Getting selected text from '{}' -> '{}'", webelement, text)
 
-        self._safe_log("Getting selected text from '%s' -> '%s'", element, text)
+            return text
 
-        return text
+        return self.__run_on_element(
+            element,
+            parent,
+            get_selected_text,
+            visible=visible,
+        )
 
     def select_option_by_value_from_dropdown(  # noqa: PLR0913
         self,
@@ -868,6 +1375,8 @@ class Browser:
         by_tag: str | None = None,
         by_css: str | None = None,
         by_class: str | None = None,
+        *,
+        visible: bool = True,
     ) -> None:
         """Select option by value."""
         element = self._get_element(
@@ -881,15 +1390,22 @@ class Browser:
             by_css=by_css,
             by_class=by_class,
         )
-        self.wait_for_visible(element=element, parent=parent)
-
-        element = self.find_element(element=element, parent=parent)
-        select = Select(element)
         assert value is not None, "value not specified"  # noqa: S101
 
-        self._safe_log(f"Selecting by value {value} from {element}")
+        def select_by_value(webelement: WebElement) -> None:
+            select = Select(webelement)
 
-        select.select_by_value(value)
+            self._safe_log("Selecting by value {} from {}", value, webelement)
+
+            select.select_by_value(value)
+
+        self.__wait_for_network_idle_gate()
+        self.__run_on_element(
+            element,
+            parent,
+            select_by_value,
+            visible=visible,
+        )
 
     def select_option_by_text_from_dropdown(  # noqa: PLR0913
         self,
@@ -904,6 +1420,8 @@ class Browser:
         by_tag: str | None = None,
         by_css: str | None = None,
         by_class: str | None = None,
+        *,
+        visible: bool = True,
     ) -> None:
         """Select option by text."""
         element = self._get_element(
@@ -917,14 +1435,21 @@ class Browser:
             by_css=by_css,
             by_class=by_class,
         )
-        self.wait_for_visible(element=element, parent=parent)
 
-        element = self.find_element(element=element, parent=parent)
-        select = Select(element)
+        def select_by_text(webelement: WebElement) -> None:
+            select = Select(webelement)
 
-        self._safe_log(f"Selecting by text {text} from {element}")
+            self._safe_log("Selecting by text {} from {}", text, webelement)
 
-        select.select_by_visible_text(text)
+            select.select_by_visible_text(text)
+
+        self.__wait_for_network_idle_gate()
+        self.__run_on_element(
+            element,
+            parent,
+            select_by_text,
+            visible=visible,
+        )
 
     def select_option_by_index_from_dropdown(  # noqa: PLR0913
         self,
@@ -939,6 +1464,8 @@ class Browser:
         by_tag: str | None = None,
         by_css: str | None = None,
         by_class: str | None = None,
+        *,
+        visible: bool = True,
     ) -> None:
         """Select option by index."""
         element = self._get_element(
@@ -953,14 +1480,20 @@ class Browser:
             by_class=by_class,
         )
 
-        self.wait_for_visible(element=element, parent=parent)
+        def select_by_index(webelement: WebElement) -> None:
+            select = Select(webelement)
 
-        element = self.find_element(element=element, parent=parent)
-        select = Select(element)
+            self._safe_log("Selecting by index {} from {}", index, webelement)
 
-        self._safe_log(f"Selecting by index {index} from {element}")
+            select.select_by_index(index)
 
-        select.select_by_index(index)
+        self.__wait_for_network_idle_gate()
+        self.__run_on_element(
+            element,
+            parent,
+            select_by_index,
+            visible=visible,
+        )
 
     def select_random_option_from_dropdown(  # noqa: PLR0913
         self,
@@ -975,6 +1508,8 @@ class Browser:
         by_tag: str | None = None,
         by_css: str | None = None,
         by_class: str | None = None,
+        *,
+        visible: bool = True,
     ) -> None:
         """Select random option from dropdown."""
         element = self._get_element(
@@ -988,17 +1523,22 @@ class Browser:
             by_css=by_css,
             by_class=by_class,
         )
-        self.wait_for_visible(element=element, parent=parent)
+        if visible:
+            element = self.wait_for_visible(element=element, parent=parent)
+        else:
+            element = self.find_element(element=element, parent=parent)
         texts_to_skip = texts_to_skip or []
 
         options = self.get_texts_from_dropdown(
             element=element,
+            visible=visible,
         )
         option_to_select = get_random_value(options, *texts_to_skip)
 
         self.select_option_by_text_from_dropdown(
             element=element,
             text=option_to_select,
+            visible=visible,
         )
 
     def get_texts_from_dropdown(  # noqa: PLR0913
@@ -1013,6 +1553,8 @@ class Browser:
         by_tag: str | None = None,
         by_css: str | None = None,
         by_class: str | None = None,
+        *,
+        visible: bool = True,
     ) -> list[str]:
         """Return list of texts from dropdown."""
         element = self._get_element(
@@ -1026,14 +1568,15 @@ class Browser:
             by_css=by_css,
             by_class=by_class,
         )
-        self.wait_for_visible(element=element, parent=parent)
 
-        element = self.find_element(element=element, parent=parent)
-        texts = [option.text for option in Select(element).options]
+        def get_texts(webelement: WebElement) -> list[str]:
+            texts = [option.text for option in Select(webelement).options]
 
-        self._safe_log("Getting texts from '%s' -> '%s'", element, str(texts))
+            self._safe_log("Getting texts from '{}' -> '{}'", webelement, str(texts))
 
-        return texts
+            return texts
+
+        return self.__run_on_element(element, parent, get_texts, visible=visible)
 
     def get_values_from_dropdown(  # noqa: PLR0913
         self,
@@ -1047,6 +1590,8 @@ class Browser:
         by_tag: str | None = None,
         by_css: str | None = None,
         by_class: str | None = None,
+        *,
+        visible: bool = True,
     ) -> list[str]:
         """Return list of values from dropdown."""
         element = self._get_element(
@@ -1060,14 +1605,17 @@ class Browser:
             by_css=by_css,
             by_class=by_class,
         )
-        self.wait_for_visible(element=element, parent=parent)
 
-        element = self.find_element(element=element, parent=parent)
-        values = [option.get_attribute("value") for option in Select(element).options]
+        def get_values(webelement: WebElement) -> list[str]:
+            values = [
+                option.get_attribute("value") for option in Select(webelement).options
+            ]
+
+            self._safe_log("Getting values from '{}' -> '{}'", webelement, str(values))
 
-        self._safe_log("Getting values from '%s' -> '%s'", element, str(values))
+            return values
 
-        return values
+        return self.__run_on_element(element, parent, get_values, visible=visible)
 
     """
         WebDriver's wrapped functions
@@ -1083,12 +1631,20 @@ class Browser:
 
     def get(self, url: str) -> None:
         """Open url."""
+        self.__forget_elements()
         self._driver.get(url)
+        if self.__track_network:
+            # the tracker is already added if it is run for every document
+            self.execute_js(get_js_script("network_tracker.js"))
 
     def execute_js(self, js_script: str, *args: list[str]) -> str:
         """Execute javascript."""
         return self._driver.execute_script(js_script, *args)
 
+    def batch(self) -> Batch:
+        """Return batch of actions and reads which are run with one script."""
+        return Batch(self)
+
     def find_element(  # noqa: PLR0913
         self,
         element: TypeElement | WebElement | None = None,
@@ -1225,7 +1781,20 @@ class Browser:
         if not msg:
             msg = f"{element} text was not changed for {timeout} seconds"
 
-        self.webdriver_wait(
+        self.__wait(
+            "text_changed",
+            self._get_element(
+                element=element,
+                by_id=by_id,
+                by_xpath=by_xpath,
+                by_link=by_link,
+                by_partial_link=by_partial_link,
+                by_name=by_name,
+                by_tag=by_tag,
+                by_css=by_css,
+                by_class=by_class,
+            ),
+            parent,
             lambda _driver: old_text
             != self.get_text(
                 element,
@@ -1241,6 +1810,7 @@ class Browser:
             ),
             msg,
             timeout,
+            {"text": old_text},
         )
 
     def wait_for_attribute_is_changed(  # noqa: PLR0913
@@ -1280,7 +1850,10 @@ class Browser:
                 f"was not changed for {timeout} seconds"
             )
 
-        self.webdriver_wait(
+        self.__wait(
+            "attribute_changed",
+            element,
+            parent,
             lambda _driver: old_value
             != self.get_attribute(
                 element=element,
@@ -1298,6 +1871,7 @@ class Browser:
             ),
             msg,
             timeout,
+            {"attr": attr, "value": old_value},
         )
 
     def wait_for_visible(  # noqa: PLR0913
@@ -1314,8 +1888,8 @@ class Browser:
         by_tag: str | None = None,
         by_css: str | None = None,
         by_class: str | None = None,
-    ) -> None:
-        """Wait until element is visible."""
+    ) -> WebElement:
+        """Wait until element is visible and return it."""
         element = self._get_element(
             element=element,
             by_id=by_id,
@@ -1331,8 +1905,11 @@ class Browser:
             timeout = self.__timeout
         if not msg:
             msg = f"{element} is not visible for {timeout} seconds"
-        self.webdriver_wait(
-            lambda _driver: self.is_visible(element=element, parent=parent),
+        return self.__wait(
+            "visible",
+            element,
+            parent,
+            lambda _driver: self.__get_visible_webelement(element, parent),
             msg,
             timeout,
         )
@@ -1369,7 +1946,10 @@ class Browser:
         if not msg:
             msg = f"{element} is visible for {timeout} seconds"
 
-        self.webdriver_wait(
+        self.__wait(
+            "not_visible",
+            element,
+            parent,
             lambda _driver: not self.is_visible(element=element, parent=parent),
             msg,
             timeout,
@@ -1389,24 +1969,28 @@ class Browser:
         by_tag: str | None = None,
         by_css: str | None = None,
         by_class: str | None = None,
-    ) -> None:
-        """Wait until element is present."""
+    ) -> WebElement:
+        """Wait until element is present and return it."""
         if not timeout:
             timeout = self.__timeout
             msg = f"{element} is not present for {timeout} seconds"
 
-        self.webdriver_wait(
-            lambda _driver: self.is_present(
-                element,
-                by_id=by_id,
-                by_xpath=by_xpath,
-                by_link=by_link,
-                by_partial_link=by_partial_link,
-                by_name=by_name,
-                by_tag=by_tag,
-                by_css=by_css,
-                by_class=by_class,
-            ),
+        element = self._get_element(
+            element=element,
+            by_id=by_id,
+            by_xpath=by_xpath,
+            by_link=by_link,
+            by_partial_link=by_partial_link,
+            by_name=by_name,
+            by_tag=by_tag,
+            by_css=by_css,
+            by_class=by_class,
+        )
+        return self.__wait(
+            "present",
+            element,
+            None,
+            lambda _driver: next(iter(self.find_elements(element)), None),
             msg,
             timeout,
         )
@@ -1431,22 +2015,160 @@ class Browser:
             timeout = self.__timeout
             msg = f"{element} is present for {timeout} seconds"
 
-        self.webdriver_wait(
-            lambda _driver: not self.is_present(
-                element,
-                by_id=by_id,
-                by_xpath=by_xpath,
-                by_link=by_link,
-                by_partial_link=by_partial_link,
-                by_name=by_name,
-                by_tag=by_tag,
-                by_css=by_css,
-                by_class=by_class,
-            ),
+        element = self._get_element(
+            element=element,
+            by_id=by_id,
+            by_xpath=by_xpath,
+            by_link=by_link,
+            by_partial_link=by_partial_link,
+            by_name=by_name,
+            by_tag=by_tag,
+            by_css=by_css,
+            by_class=by_class,
+        )
+        self.__wait(
+            "not_present",
+            element,
+            None,
+            lambda _driver: not self.is_present(element),
             msg,
             timeout,
         )
 
+    def wait_for_network_idle(
+        self,
+        quiet_ms: int = 500,
+        timeout: float | None = None,
+        msg: str | None = None,
+    ) -> None:
+        """
+        Wait until no fetch or XHR request is in flight for `quiet_ms`.
+
+        Requests are counted by script which is added to the page, if it
+        was not added before then requests which are already in flight are
+        not counted, see `track_network` of Browser. Only requests of the
+        window of the current frame are counted, requests of other frames
+        are not.
+        """
+        if not timeout:
+            timeout = self.__timeout
+        if not msg:
+            msg = f"Network was not idle for {quiet_ms}ms in {timeout} seconds"
+        script = get_js_script("network_tracker.js", "network_idle.js")
+        # quiet period should not be overslept by long polls
+        max_poll = max(quiet_ms / 1000 / 4, self.__wait_policy.initial_poll)
+        wait_policy = WaitPolicy(
+            initial_poll=self.__wait_policy.initial_poll,
+            backoff=self.__wait_policy.backoff,
+            max_poll=min(self.__wait_policy.max_poll, max_poll),
+            ignored_exceptions=self.__wait_policy.ignored_exceptions,
+        )
+
+        def is_idle(_driver: WebDriver) -> bool:
+            state = self._driver.execute_script(script)
+            return state["inFlight"] == 0 and state["quietFor"] >= quiet_ms
+
+        self.webdriver_wait(is_idle, msg, timeout, wait_policy=wait_policy)
+
+    def __wait_for_network_idle_gate(self) -> None:
+        if self.__network_idle_gate is None:
+            return
+        try:
+            self.wait_for_network_idle(
+                self.__network_idle_gate,
+                self.__network_idle_gate_timeout,
+            )
+        except TimeoutException:
+            # long polling requests should not break every operation
+            self.stats["network_idle_gate_timeouts"] += 1
+            self._safe_log(
+                "Network was not idle for {}ms, continuing",
+                self.__network_idle_gate,
+            )
+
+    def __wait(  # noqa: PLR0913
+        self,
+        condition: str,
+        element: TypeElement | WebElement,
+        parent: TypeElement | WebElement | None,
+        function: callable,
+        msg: str,
+        timeout: float,
+        options: dict[str, Any] | None = None,
+    ) -> Any:  # noqa: ANN401
+        if self.__wait_engine == self.WAIT_IN_BROWSER:
+            started_at = monotonic()
+            try:
+                result = self.__wait_in_browser(
+                    condition,
+                    element,
+                    parent,
+                    msg,
+                    timeout,
+                    options,
+                )
+            except TimeoutException:
+                self.__record_wait(WaitResult(None, monotonic() - started_at, 1))
+                raise
+            if result is not None:
+                if isinstance(result, WebElement) and not isinstance(
+                    element,
+                    WebElement,
+                ):
+                    self.__remember_origin(result, (element, parent, 0))
+                self.__record_wait(WaitResult(result, monotonic() - started_at, 1))
+                return result
+
+            # script was interrupted, ex. by navigation, wait for the rest
+            # of the time in Python
+            timeout = max(timeout - (monotonic() - started_at), 0.1)
+
+        return self.webdriver_wait(function, msg, timeout)
+
+    def __wait_in_browser(  # noqa: PLR0913
+        self,
+        condition: str,
+        element: TypeElement | WebElement,
+        parent: TypeElement | WebElement | None,
+        msg: str,
+        timeout: float,
+        options: dict[str, Any] | None,
+    ) -> WebElement | bool | None:
+        script_timeout = timeout + 1
+        if self.__script_timeout is None or self.__script_timeout < script_timeout:
+            self._driver.set_script_timeout(script_timeout)
+            self.__script_timeout = script_timeout
+
+        script = (
+            f"var isDisplayed = {get_selenium_atom('isDisplayed')};\n"
+            f"var getAttribute = {get_selenium_atom('getAttribute')};\n"
+            + get_js_script("find_elements.js", "wait_for.js")
+        )
+        if not isinstance(element, WebElement):
+            element = list(element)
+        if parent and not isinstance(parent, WebElement):
+            parent = list(parent)
+        try:
+            result = self._driver.execute_async_script(
+                script,
+                condition,
+                element,
+                parent,
+                options,
+                int(timeout * 1000),
+            )
+        except TimeoutException as exc:
+            raise TimeoutException(msg) from exc
+        except WebDriverException:
+            return None
+
+        if not result["ok"]:
+            if result.get("error"):
+                msg = f"{msg}: {result['error']}"
+            raise TimeoutException(msg)
+
+        return result.get("element") or True
+
     def is_visible(  # noqa: PLR0913
         self,
         element: TypeElement | WebElement | None = None,
@@ -1488,6 +2210,16 @@ class Browser:
             )
         return len(elements) > 0 and elements[0].is_displayed()
 
+    def __get_visible_webelement(
+        self,
+        element: TypeElement | WebElement,
+        parent: TypeElement | WebElement | None,
+    ) -> WebElement | None:
+        elements = self.__get_webelements(element=element, parent=parent)
+        if elements and elements[0].is_displayed():
+            return elements[0]
+        return None
+
     def is_present(  # noqa: PLR0913
         self,
         element: TypeElement | WebElement | None = None,
@@ -1534,7 +2266,7 @@ class Browser:
             filename = get_timestamp() + ".png"
         path_to_file = str((Path(saving_dir) / filename).absolute())
 
-        self._safe_log("Saving screenshot to '%s'", path_to_file)
+        self._safe_log("Saving screenshot to '{}'", path_to_file)
 
         self._driver.save_screenshot(path_to_file)
         return path_to_file
@@ -1566,6 +2298,18 @@ class Browser:
             ),
         )
 
+    def get_elements_counts(self, elements: list[TypeElement]) -> list[int]:
+        """
+        Return number of elements for every locator.
+
+        All locators are counted with single javascript call, count is -1 if
+        locator is not valid.
+        """
+        return self._driver.execute_script(
+            get_js_script("find_elements.js", "count_elements.js"),
+            [list(element) for element in elements],
+        )
+
     def switch_to_frame(  # noqa: PLR0913
         self,
         element: TypeElement | WebElement | None = None,
@@ -1591,8 +2335,9 @@ class Browser:
             by_class=by_class,
         )
 
-        self._safe_log("Switching to '%s' frame", element)
+        self._safe_log("Switching to '{}' frame", element)
 
+        self.__forget_elements()
         self._driver.switch_to.frame(element)
 
     def switch_to_new_window(  # noqa: PLR0913
@@ -1630,22 +2375,42 @@ class Browser:
         for handle in initial_handles:
             new_handles.remove(handle)
 
+        self.__forget_elements()
         self._driver.switch_to.window(new_handles[0])
 
-        self._safe_log("Switching to '%s' window", self._driver.title)
+        self._safe_log("Switching to '{}' window", self._driver.title)
 
     def switch_to_default_content(self) -> None:
         """Switch to default content."""
         self._safe_log("Switching to default content")
 
+        self.__forget_elements()
         self._driver.switch_to.default_content()
 
     def close_current_window_and_focus_to_previous_one(self) -> None:
         """Close current window and switch to previous one."""
         handles = self._driver.window_handles
         self.close()
+        self.__forget_elements()
         self._driver.switch_to.window(handles[-2])
 
+    def close_other_windows(self) -> None:
+        """Close all windows except the first one and switch to it."""
+        handles = self._driver.window_handles
+        for handle in handles[1:]:
+            self._driver.switch_to.window(handle)
+            self.close()
+        self.__forget_elements()
+        self._driver.switch_to.window(handles[0])
+
+    def is_alive(self) -> bool:
+        """Return True if browser session still responds to commands."""
+        try:
+            self._driver.current_window_handle  # noqa: B018
+        except WebDriverException:
+            return False
+        return True
+
     def get_page_source(self) -> str:
         """Return page source."""
         return self._driver.page_source
@@ -1660,15 +2425,59 @@ class Browser:
 
     def get_current_frame_url(self) -> str:
         """Return current frame url."""
-        return self.execute_js("return document.location.href")
+        return self._driver.execute_script("return document.location.href")
 
     def go_back(self) -> None:
         """Go back."""
+        self.__forget_elements()
         self._driver.back()
 
-    def delete_all_cookies(self) -> None:
-        """Delete all cookies."""
-        self._driver.delete_all_cookies()
+    def get_window_size(self) -> tuple[int, int]:
+        """Return tuple like (width, height)."""
+        size = self._driver.get_window_size()
+        return size["width"], size["height"]
+
+    def set_window_size(self, width: int, height: int) -> None:
+        """Set window size."""
+        self._driver.set_window_size(width, height)
+
+    def delete_all_cookies(self, *, all_domains: bool = False) -> None:
+        """
+        Delete all cookies of the current domain.
+
+        If `all_domains` is True then cookies of all domains are deleted in
+        Chromium based browsers.
+        """
+        if all_domains and hasattr(self._driver, "execute_cdp_cmd"):
+            self._driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        else:
+            self._driver.delete_all_cookies()
+
+    def clear_storage(self) -> None:
+        """
+        Clear local and session storage of the current page.
+
+        In Chromium based browsers local storage, IndexedDB and other site
+        data of all pages from history of the current window is cleared too,
+        session storage of the other pages is kept.
+        """
+        self._driver.execute_script(
+            "try { localStorage.clear(); sessionStorage.clear(); } catch (e) {}",
+        )
+        if not hasattr(self._driver, "execute_cdp_cmd"):
+            return
+
+        history = self._driver.execute_cdp_cmd("Page.getNavigationHistory", {})
+        origins = {
+            f"{url.scheme}://{url.netloc}"
+            for url in (urlsplit(entry["url"]) for entry in history["entries"])
+            if url.scheme in ("http", "https")
+        }
+        for origin in sorted(origins):
+            self._driver.execute_cdp_cmd(
+                "Storage.clearDataForOrigin",
+                {"origin": origin, "storageTypes": "all"},
+            )
 
     def alert_accept(self) -> None:
         """Accept modal window."""
@@ -1684,6 +2493,7 @@ class Browser:
 
     def refresh_page(self) -> None:
         """Refresh page."""
+        self.__forget_elements()
         self._driver.refresh()
 
     def webdriver_wait(
@@ -1691,14 +2501,66 @@ class Browser:
         function: callable,
         msg: str = "",
         timeout: float | None = None,
-    ) -> None:
-        """Wait for condition."""
+        *,
+        wait_policy: WaitPolicy | None = None,
+    ) -> Any:  # noqa: ANN401
+        """
+        Wait for condition and return its first truthy value.
+
+        Poll intervals and ignored exceptions are taken from `wait_policy` or
+        from the policy of the browser, other exceptions are propagated.
+        Elapsed time and number of polls are saved to `last_wait`.
+        """
         if not timeout:
             timeout = self.__timeout
+        wait_policy = wait_policy or self.__wait_policy
+        condition = self._wait_condition(function)
+
+        started_at = monotonic()
+        polls = 0
+
+        def poll() -> Any:  # noqa: ANN401
+            nonlocal polls
+            polls += 1
+            return condition(self._driver)
+
         try:
-            WebDriverWait(self._driver, timeout).until(function, msg)
-        except Exception as exc:  # noqa: BLE001
-            raise TimeoutException(msg) from exc
+            result = wait_policy.wait(poll, timeout)
+        except Exception:
+            self.__record_wait(WaitResult(None, monotonic() - started_at, polls))
+            raise
+
+        self.__record_wait(result)
+        if result.timed_out:
+            raise TimeoutException(msg)
+        return result.value
+
+    def _wait_condition(
+        self,
+        function: Callable[[WebDriver], Any],
+    ) -> Callable[[WebDriver], Any]:
+        """
+        Return condition of wait which checks stale elements once again.
+
+        If element gets stale then cached elements are dropped and condition
+        is checked again, so elements found by locators are found again and
+        element which was passed as WebElement is reported as stale.
+        """
+
+        def condition(driver: WebDriver) -> Any:  # noqa: ANN401
+            try:
+                return function(driver)
+            except StaleElementReferenceException:
+                if self.__element_cache:
+                    self.__element_cache.clear()
+                return function(driver)
+
+        return condition
+
+    def __record_wait(self, result: WaitResult) -> None:
+        self.last_wait = result
+        self.stats["waits"] += 1
+        self.stats["wait_polls"] += result.polls
 
     def close(self) -> None:
         """Close browser."""
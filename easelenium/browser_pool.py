@@ -0,0 +1,217 @@
+"""Browser pool."""
+from __future__ import annotations
+
+import atexit
+import json
+from collections import Counter, defaultdict
+from contextlib import contextmanager, suppress
+from copy import deepcopy
+from functools import lru_cache
+from hashlib import sha1
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Callable, Final
+
+from selenium.common.exceptions import WebDriverException
+
+from easelenium.browser import Browser
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+class BrowserPool:
+    """
+    Pool of warm browser sessions.
+
+    Sessions are kept by (browser_name, headless, options hash) and are reused
+    by callers which ask for browser with the same arguments. Returned session
+    is reset before it is handed out again, its stats, last wait and found
+    elements are always cleared. Session which fails reset or health check or
+    was used `max_uses` times is quit.
+
+    Cookies of all sites and storage of sites from history of the window are
+    cleared only in Chromium based browsers, other browsers keep cookies and
+    storage of all sites but the last opened one, see Browser.clear_storage.
+    """
+
+    CLOSE_OTHER_WINDOWS: Final = "close_other_windows"
+    CLEAR_STORAGE: Final = "clear_storage"
+    DELETE_COOKIES: Final = "delete_cookies"
+    RESTORE_WINDOW_SIZE: Final = "restore_window_size"
+    OPEN_BLANK_PAGE: Final = "open_blank_page"
+
+    DEFAULT_RESET: Final = (
+        CLOSE_OTHER_WINDOWS,
+        CLEAR_STORAGE,
+        DELETE_COOKIES,
+        RESTORE_WINDOW_SIZE,
+        OPEN_BLANK_PAGE,
+    )
+
+    def __init__(
+        self,
+        max_uses: int = 100,
+        reset: tuple[str, ...] = DEFAULT_RESET,
+        browser_factory: Callable[..., Browser] = Browser,
+    ) -> None:
+        """Initialize."""
+        unknown_steps = set(reset) - set(self.DEFAULT_RESET)
+        if unknown_steps:
+            msg = f"Unsupported reset steps {sorted(unknown_steps)}"
+            raise ValueError(msg)
+
+        self.max_uses = max_uses
+        self.reset = tuple(reset)
+        self.stats = Counter()
+        self.__browser_factory = browser_factory
+        self.__idle = defaultdict(list)
+        self.__keys = {}
+        self.__uses = Counter()
+        self.__window_sizes = {}
+        self.__lock = Lock()
+
+    @classmethod
+    def get_session_key(cls: type[BrowserPool], **browser_kwargs: Any) -> tuple:  # noqa: ANN401
+        """Return key of session which would be created by Browser(**kwargs)."""
+        browser_name = (
+            Browser.DEFAULT_BROWSER or browser_kwargs.get("browser_name") or Browser.FF
+        )
+        headless = bool(browser_kwargs.get("headless")) or "headless" in browser_name
+        options = {
+            name: cls.__describe(value)
+            for name, value in browser_kwargs.items()
+            if name not in ("browser_name", "headless", "logger")
+        }
+        options_hash = sha1(  # noqa: S324
+            json.dumps(options, sort_keys=True, default=repr).encode("utf-8"),
+        ).hexdigest()
+        return browser_name, headless, options_hash
+
+    @classmethod
+    def __describe(cls: type[BrowserPool], value: Any) -> Any:  # noqa: ANN401
+        if isinstance(value, dict):
+            # service is created by Browser from driver path
+            return {
+                str(k): cls.__describe(v) for k, v in value.items() if k != "service"
+            }
+        if hasattr(value, "arguments") and hasattr(value, "capabilities"):
+            # order and duplicates of arguments don't change the browser
+            return {
+                "type": type(value).__name__,
+                "arguments": sorted(set(value.arguments)),
+                "capabilities": value.capabilities,
+                "experimental_options": getattr(value, "experimental_options", None),
+            }
+        return value
+
+    def acquire(self, **browser_kwargs: Any) -> Browser:  # noqa: ANN401
+        """Return idle healthy session or start new one."""
+        # Browser adds arguments to passed options, so key and new session
+        # are made from a copy which is taken before the session is started
+        browser_kwargs = self.__copy_browser_kwargs(browser_kwargs)
+        key = self.get_session_key(**browser_kwargs)
+        while True:
+            with self.__lock:
+                browser = self.__idle[key].pop() if self.__idle[key] else None
+            if browser is None:
+                break
+            if browser.is_alive():
+                self.stats["reused"] += 1
+                browser.logger = browser_kwargs.get("logger")
+                return browser
+            self.stats["health_check_failures"] += 1
+            self.__retire(browser)
+
+        browser = self.__browser_factory(**browser_kwargs)
+        self.stats["created"] += 1
+        window_size = (
+            browser.get_window_size()
+            if self.RESTORE_WINDOW_SIZE in self.reset
+            else None
+        )
+        with self.__lock:
+            self.__keys[id(browser)] = key
+            self.__window_sizes[id(browser)] = window_size
+        return browser
+
+    @staticmethod
+    def __copy_browser_kwargs(browser_kwargs: dict[str, Any]) -> dict[str, Any]:
+        webdriver_kwargs = browser_kwargs.get("webdriver_kwargs")
+        if not webdriver_kwargs:
+            return browser_kwargs
+        return {
+            **browser_kwargs,
+            "webdriver_kwargs": {
+                name: deepcopy(value) if name == "options" else value
+                for name, value in webdriver_kwargs.items()
+            },
+        }
+
+    def release(self, browser: Browser, *, discard: bool = False) -> None:
+        """Return session to the pool, quit it if it should not be reused."""
+        with self.__lock:
+            key = self.__keys.get(id(browser))
+            if key is None:
+                msg = "Browser was not acquired from this pool"
+                raise ValueError(msg)
+            self.__uses[id(browser)] += 1
+            uses = self.__uses[id(browser)]
+
+        if discard or uses >= self.max_uses or not self.__reset(browser):
+            self.__retire(browser)
+            return
+
+        with self.__lock:
+            self.__idle[key].append(browser)
+
+    @contextmanager
+    def lease(self, **browser_kwargs: Any) -> Iterator[Browser]:  # noqa: ANN401
+        """Acquire session for the block and release it after."""
+        browser = self.acquire(**browser_kwargs)
+        try:
+            yield browser
+        finally:
+            self.release(browser)
+
+    def close(self) -> None:
+        """Quit all idle sessions."""
+        with self.__lock:
+            browsers = [b for browsers in self.__idle.values() for b in browsers]
+            self.__idle.clear()
+        for browser in browsers:
+            self.__retire(browser)
+
+    def __reset(self, browser: Browser) -> bool:
+        try:
+            if self.CLOSE_OTHER_WINDOWS in self.reset:
+                browser.close_other_windows()
+            if self.CLEAR_STORAGE in self.reset:
+                browser.clear_storage()
+            if self.DELETE_COOKIES in self.reset:
+                browser.delete_all_cookies(all_domains=True)
+            window_size = self.__window_sizes.get(id(browser))
+            if self.RESTORE_WINDOW_SIZE in self.reset and window_size:
+                browser.set_window_size(*window_size)
+            if self.OPEN_BLANK_PAGE in self.reset:
+                browser.get("about:blank")
+            browser.clear_state()
+        except WebDriverException:
+            return False
+        return True
+
+    def __retire(self, browser: Browser) -> None:
+        with self.__lock:
+            self.__keys.pop(id(browser), None)
+            self.__uses.pop(id(browser), None)
+            self.__window_sizes.pop(id(browser), None)
+        self.stats["retired"] += 1
+        with suppress(WebDriverException):
+            browser.quit()
+
+
+@lru_cache(maxsize=None)
+def get_default_browser_pool() -> BrowserPool:
+    """Return pool which is shared by BaseTest and browser_decorator."""
+    pool = BrowserPool()
+    atexit.register(pool.close)
+    return pool
@@ -0,0 +1,145 @@
+"""Command executor of WebDriver."""
+from __future__ import annotations
+
+import os
+from bisect import bisect_left
+from collections import Counter
+from threading import Lock
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Final
+
+from selenium.webdriver.remote.remote_connection import RemoteConnection
+
+if TYPE_CHECKING:
+    from urllib3 import PoolManager
+
+
+class CommandTimings:
+    """
+    Histograms of durations of WebDriver commands.
+
+    Every command has counts of durations in BUCKETS, the last count is for
+    durations longer than the last bucket. Timings can be recorded from many
+    threads.
+    """
+
+    BUCKETS: Final = (0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1, 2, 5)
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.__histograms = {}
+        self.__totals = Counter()
+        self.__maximums = Counter()
+        self.__lock = Lock()
+
+    def record(self, command: str, duration: float) -> None:
+        """Record duration of command in seconds."""
+        with self.__lock:
+            histogram = self.__histograms.get(command)
+            if histogram is None:
+                histogram = self.__histograms[command] = [0] * (len(self.BUCKETS) + 1)
+            histogram[bisect_left(self.BUCKETS, duration)] += 1
+            self.__totals[command] += duration
+            self.__maximums[command] = max(self.__maximums[command], duration)
+
+    def get_commands(self) -> list[str]:
+        """Return recorded commands."""
+        with self.__lock:
+            return list(self.__histograms)
+
+    def get_histogram(self, command: str) -> list[int]:
+        """Return counts of durations of command in every bucket."""
+        with self.__lock:
+            return list(self.__histograms.get(command, [0] * (len(self.BUCKETS) + 1)))
+
+    def get_count(self, command: str) -> int:
+        """Return number of recorded commands."""
+        return sum(self.get_histogram(command))
+
+    def get_total(self, command: str) -> float:
+        """Return duration of all recorded commands."""
+        with self.__lock:
+            return self.__totals[command]
+
+    def get_percentile(self, command: str, percent: float) -> float:
+        """Return upper bound of bucket where `percent` of commands is finished."""
+        histogram = self.get_histogram(command)
+        needed = sum(histogram) * percent / 100
+        finished = 0
+        for bucket, count in zip((*self.BUCKETS, float("inf")), histogram):
+            finished += count
+            if count and finished >= needed:
+                return bucket
+        return 0
+
+    def get_report(self) -> str:
+        """Return table with durations of commands, the slowest commands first."""
+        lines = []
+        for command in sorted(self.get_commands(), key=lambda c: -self.get_total(c)):
+            count = self.get_count(command)
+            total = self.get_total(command)
+            with self.__lock:
+                maximum = self.__maximums[command]
+            lines.append(
+                f"{command:30} {count:7} {total:8.3f}s "
+                f"mean {total / count * 1000:8.2f}ms "
+                f"p50 <= {self.get_percentile(command, 50) * 1000:6.0f}ms "
+                f"p95 <= {self.get_percentile(command, 95) * 1000:6.0f}ms "
+                f"max {maximum * 1000:8.2f}ms",
+            )
+        return os.linesep.join(lines)
+
+    def clear(self) -> None:
+        """Drop recorded timings."""
+        with self.__lock:
+            self.__histograms.clear()
+            self.__totals.clear()
+            self.__maximums.clear()
+
+
+class PooledCommandExecutor(RemoteConnection):
+    """
+    Connection to WebDriver which keeps connections open and times commands.
+
+    It takes place of connection created by WebDriver for the browser, all
+    commands of the browser are supported. Up to `pool_size` keep-alive
+    connections are open to the driver, if all of them are busy then
+    command waits for free connection instead of opening new one which is
+    dropped after single command. Duration of every command is recorded to
+    `timings`.
+    """
+
+    def __init__(
+        self,
+        connection: RemoteConnection,
+        pool_size: int = 4,
+        timings: CommandTimings | None = None,
+    ) -> None:
+        """Initialize with connection created by WebDriver."""
+        if pool_size < 1:
+            msg = f"Pool size should be positive, got {pool_size}"
+            raise ValueError(msg)
+
+        # connection is configured by WebDriver for the browser, ex. it has
+        # vendor commands, only its connection manager is replaced
+        self.__dict__.update(vars(connection))
+        self.browser_name = connection.browser_name
+        self._client_config.keep_alive = True
+        self.pool_size = pool_size
+        self.timings = timings if timings is not None else CommandTimings()
+        if hasattr(connection, "_conn"):
+            connection.close()
+        self._conn = self._get_connection_manager()
+
+    def _get_connection_manager(self) -> PoolManager:
+        manager = super()._get_connection_manager()
+        manager.connection_pool_kw.update(maxsize=self.pool_size, block=True)
+        return manager
+
+    def execute(self, command: str, params: dict[str, Any]) -> dict[str, Any]:
+        """Send command to the driver and record its duration."""
+        started_at = perf_counter()
+        try:
+            return super().execute(command, params)
+        finally:
+            self.timings.record(command, perf_counter() - started_at)
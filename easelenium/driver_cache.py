@@ -0,0 +1,112 @@
+"""Driver path cache."""
+from __future__ import annotations
+
+import json
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from time import monotonic, sleep
+from typing import TYPE_CHECKING, Callable
+
+from easelenium.utils import is_windows
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+if is_windows():
+    import msvcrt
+else:
+    import fcntl
+
+
+@contextmanager
+def lock_file(path: Path, timeout: float = 60) -> Iterator[None]:
+    """
+    Hold exclusive lock of file, lock is shared by all processes.
+
+    On Windows lock is tried every 0.1 seconds and OSError is raised if it
+    is not taken in `timeout` seconds.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a+") as f:
+        if is_windows():
+            f.seek(0)
+            deadline = monotonic() + timeout
+            while True:
+                try:
+                    msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+                    break
+                except OSError:
+                    if monotonic() >= deadline:
+                        raise
+                    sleep(0.1)
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+class DriverPathCache:
+    """
+    On-disk cache of driver paths shared by all processes.
+
+    Paths are stored by key like 'chrome:118.0.5993.70', so driver is
+    resolved again after browser update. Cached path is used only if driver
+    file still exists and is executable. Missing or stale path is resolved
+    under file lock and result is saved before lock is released, so
+    concurrent processes which wait for the lock reuse it.
+    """
+
+    DEFAULT_PATH = Path.home() / ".wdm" / "easelenium_driver_paths.json"
+
+    def __init__(self, path: Path | str | None = None) -> None:
+        """Initialize."""
+        self.path = Path(
+            path or os.environ.get("EASELENIUM_DRIVER_CACHE") or self.DEFAULT_PATH,
+        )
+        self.__lock_path = self.path.with_suffix(".lock")
+
+    def get(self, key: str, resolve: Callable[[], str | None]) -> str | None:
+        """Return cached driver path or resolve, save and return it."""
+        driver_path = self.__read().get(key)
+        if self.is_valid(driver_path):
+            return driver_path
+
+        with lock_file(self.__lock_path):
+            # other process could resolve path while this one was waiting
+            paths = self.__read()
+            driver_path = paths.get(key)
+            if self.is_valid(driver_path):
+                return driver_path
+
+            driver_path = resolve()
+            if driver_path:
+                paths[key] = driver_path
+                self.__write(paths)
+            return driver_path
+
+    @staticmethod
+    def is_valid(driver_path: str | None) -> bool:
+        """Return True if driver file exists and can be executed."""
+        return bool(driver_path) and (
+            Path(driver_path).is_file() and os.access(driver_path, os.X_OK)
+        )
+
+    def __read(self) -> dict[str, str]:
+        try:
+            return json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+    def __write(self, paths: dict[str, str]) -> None:
+        tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(paths, indent=2), encoding="utf-8")
+        # readers which do not take the lock never see partially written file
+        tmp_path.replace(self.path)
@@ -0,0 +1,89 @@
+"""Element cache."""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable, Final
+
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.remote.webelement import WebElement
+
+from easelenium.utils import get_js_script
+
+if TYPE_CHECKING:
+    from collections import Counter
+
+    from easelenium.browser import TypeElement
+
+
+class ElementCache:
+    """
+    Cache of found elements which is invalidated when DOM is changed.
+
+    MutationObserver installed in the page counts DOM mutations. On every
+    lookup the counter is checked and elements are found with single
+    javascript call: cached elements are used if DOM was not changed,
+    otherwise all elements are dropped and elements are found again by the
+    same call. Document replacement is detected by missing observer.
+    """
+
+    __SCRIPT: Final = get_js_script(
+        "find_elements.js",
+        "dom_version.js",
+        "find_cached_elements.js",
+    )
+
+    def __init__(
+        self,
+        execute_js: Callable[..., Any],
+        stats: Counter,
+    ) -> None:
+        """Initialize."""
+        self.__execute_js = execute_js
+        self.__stats = stats
+        self.__elements = {}
+        self.__dom_version = None
+
+    def find(
+        self,
+        element: TypeElement,
+        parent: TypeElement | WebElement | None = None,
+    ) -> list[WebElement]:
+        """Return cached elements for locator or find and cache them."""
+        if isinstance(parent, WebElement):
+            key = (*element, parent.id)
+        else:
+            parent = list(parent) if parent else None
+            key = (*element, tuple(parent) if parent else None)
+        cached = self.__elements.get(key)
+
+        result = self.__execute_js(
+            self.__SCRIPT,
+            self.__dom_version,
+            cached is not None,
+            list(element),
+            parent,
+        )
+        self.__stats["element_cache_checks"] += 1
+        if result["version"] != self.__dom_version:
+            self.clear()
+            self.__dom_version = max(result["version"], 0)
+        if not result["parentFound"]:
+            msg = f"Didn't find any elements for selector - {parent}"
+            raise NoSuchElementException(msg)
+
+        elements = result["elements"]
+        if elements is None:
+            self.__stats["element_cache_hits"] += 1
+            return cached
+
+        self.__stats["element_cache_misses"] += 1
+        # not found elements are not cached because they can appear later
+        if elements:
+            self.__elements[key] = elements
+        return elements
+
+    def clear(self) -> None:
+        """Drop all cached elements, ex. after navigation or frame switch."""
+        if self.__elements:
+            self.__stats["element_cache_invalidations"] += 1
+        self.__elements.clear()
+        self.__dom_version = None
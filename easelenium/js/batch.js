@@ -0,0 +1,122 @@
+// Runs recorded steps of batch one by one and returns their results.
+// Stops at the first step which fails or which needs trusted input, that
+// step is not run.
+// Expects `findElements`, `isDisplayed`, `getAttribute` and `getText`
+// functions to be defined before.
+//
+// arguments[0] - list of steps {method, element, parent, args, visible},
+//                `method` is name of Browser method, `element` and `parent`
+//                are elements or [by, value] locators, parent can be null
+//
+// Returns {results: [...], stopped: null}, stopped is {index, error: message}
+// if step failed or {index, native: true} if step needs trusted input.
+
+var steps = arguments[0];
+
+function find(locatorOrElement, root) {
+  if (!Array.isArray(locatorOrElement)) {
+    return locatorOrElement.isConnected ? [locatorOrElement] : [];
+  }
+  return findElements(locatorOrElement[0], locatorOrElement[1], root);
+}
+
+function findElement(step) {
+  var root = null;
+  if (step.parent) {
+    root = find(step.parent)[0];
+    if (!root) throw new Error("parent element is not found");
+  }
+  var element = find(step.element, root)[0];
+  if (!element) throw new Error("element is not found");
+  if (step.visible && !isDisplayed(element)) {
+    throw new Error("element is not visible");
+  }
+  return element;
+}
+
+function needsTrustedInput(step, element) {
+  // file inputs and rich text editors ignore value set from script
+  return (
+    step.method === "type" &&
+    (element.isContentEditable ||
+      (element.tagName === "INPUT" && element.type === "file"))
+  );
+}
+
+function fire(element, type) {
+  element.dispatchEvent(new Event(type, { bubbles: true }));
+}
+
+function setValue(element, value) {
+  // setter of the prototype is called, so frameworks which track value of
+  // the element see the change
+  var descriptor = Object.getOwnPropertyDescriptor(
+    Object.getPrototypeOf(element),
+    "value",
+  );
+  if (descriptor && descriptor.set) {
+    descriptor.set.call(element, value);
+  } else {
+    element.value = value;
+  }
+}
+
+function selectOption(element, matches) {
+  if (element.tagName !== "SELECT") throw new Error("element is not select");
+  var option = Array.prototype.filter.call(element.options, matches)[0];
+  if (!option) throw new Error("option is not found");
+  if (option.disabled) throw new Error("option is disabled");
+  element.focus();
+  option.selected = true;
+  fire(element, "input");
+  fire(element, "change");
+}
+
+function run(step, element) {
+  var args = step.args;
+  switch (step.method) {
+    case "type":
+      element.focus();
+      setValue(element, args.text === null ? "" : String(args.text));
+      fire(element, "input");
+      fire(element, "change");
+      return null;
+    case "click":
+      element.click();
+      return null;
+    case "select_option_by_value_from_dropdown":
+      selectOption(element, function (option) {
+        return option.value === args.value;
+      });
+      return null;
+    case "select_option_by_text_from_dropdown":
+      selectOption(element, function (option) {
+        return option.text.replace(/\s+/g, " ").trim() === args.text;
+      });
+      return null;
+    case "select_option_by_index_from_dropdown":
+      selectOption(element, function (option) {
+        return option.index === args.index;
+      });
+      return null;
+    case "get_text":
+      return getText(element);
+    case "get_attribute":
+      return getAttribute(element, args.attr);
+  }
+  throw new Error("Unsupported step " + step.method);
+}
+
+var results = [];
+for (var i = 0; i < steps.length; i++) {
+  try {
+    var element = findElement(steps[i]);
+    if (needsTrustedInput(steps[i], element)) {
+      return { results: results, stopped: { index: i, native: true } };
+    }
+    results.push(run(steps[i], element));
+  } catch (e) {
+    return { results: results, stopped: { index: i, error: e.message } };
+  }
+}
+return { results: results, stopped: null };
@@ -0,0 +1,12 @@
+// Returns number of elements for every [by, value] pair.
+// Count is -1 if selector is not valid.
+//
+// arguments[0] - list of [by, value] pairs
+
+return arguments[0].map(function (locator) {
+  try {
+    return findElements(locator[0], locator[1]).length;
+  } catch (e) {
+    return -1;
+  }
+});
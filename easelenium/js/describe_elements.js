@@ -0,0 +1,17 @@
+// Returns descriptive properties of every element, the same which
+// Browser.to_string used to get with separate WebDriver commands.
+// Expects `getAttribute` function (Selenium atom) and `getText` function to
+// be defined before.
+//
+// arguments[0] - list of elements
+
+return arguments[0].map(function (element) {
+  return {
+    tag_name: element.tagName.toLowerCase(),
+    id: getAttribute(element, "id"),
+    class: getAttribute(element, "class"),
+    text: getText(element),
+    value: getAttribute(element, "value"),
+    name: getAttribute(element, "name"),
+  };
+});
@@ -0,0 +1,21 @@
+// Defines `getDomVersion()` function which returns number of DOM mutations
+// in current document which were observed by MutationObserver. It installs
+// observer and returns -1 if it was not installed yet, this means that
+// document is new(ex. after navigation).
+
+function getDomVersion() {
+  var win = window;
+  if (win.__easeleniumDomVersion === undefined) {
+    win.__easeleniumDomVersion = 0;
+    new MutationObserver(function () {
+      win.__easeleniumDomVersion++;
+    }).observe(document, {
+      childList: true,
+      subtree: true,
+      attributes: true,
+      characterData: true,
+    });
+    return -1;
+  }
+  return win.__easeleniumDomVersion;
+}
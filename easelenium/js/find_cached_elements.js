@@ -0,0 +1,28 @@
+// Checks DOM version and finds elements if cached elements can't be used.
+// Expects `findElements` and `getDomVersion` functions to be defined before.
+//
+// arguments[0] - DOM version cached elements were found at or null
+// arguments[1] - true if elements for the locator are cached
+// arguments[2] - [by, value] locator of elements
+// arguments[3] - parent element, [by, value] locator of it or null
+//
+// Returns {version, elements, parentFound}, elements is null if DOM was not
+// changed and cached elements should be used.
+
+var version = getDomVersion();
+if (arguments[1] && version === arguments[0]) {
+  return { version: version, elements: null, parentFound: true };
+}
+
+var locator = arguments[2];
+var parent = arguments[3];
+var root = null;
+if (parent) {
+  root = Array.isArray(parent) ? findElements(parent[0], parent[1])[0] : parent;
+  if (!root) return { version: version, elements: [], parentFound: false };
+}
+return {
+  version: version,
+  elements: findElements(locator[0], locator[1], root),
+  parentFound: true,
+};
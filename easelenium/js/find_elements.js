@@ -0,0 +1,55 @@
+// Finds elements the same way as WebDriver does for every `By` strategy.
+// Defines `findElements(by, value, root)` function, `root` is optional.
+
+function findElements(by, value, root) {
+  root = root || document;
+  var doc = root.ownerDocument || root;
+
+  function toArray(elements) {
+    return Array.prototype.slice.call(elements);
+  }
+
+  function findLinks(matches) {
+    return toArray(root.getElementsByTagName("a")).filter(function (link) {
+      return matches((link.innerText || "").trim());
+    });
+  }
+
+  switch (by) {
+    case "id":
+      return toArray(root.querySelectorAll('[id="' + CSS.escape(value) + '"]'));
+    case "name":
+      return toArray(
+        root.querySelectorAll('[name="' + CSS.escape(value) + '"]'),
+      );
+    case "class name":
+      return toArray(root.querySelectorAll("." + CSS.escape(value)));
+    case "tag name":
+      return toArray(root.getElementsByTagName(value));
+    case "css selector":
+      return toArray(root.querySelectorAll(value));
+    case "xpath":
+      var snapshot = doc.evaluate(
+        value,
+        root,
+        null,
+        XPathResult.ORDERED_NODE_SNAPSHOT_TYPE,
+        null,
+      );
+      var elements = [];
+      for (var i = 0; i < snapshot.snapshotLength; i++) {
+        var node = snapshot.snapshotItem(i);
+        if (node.nodeType == 1) elements.push(node);
+      }
+      return elements;
+    case "link text":
+      return findLinks(function (text) {
+        return text === value;
+      });
+    case "partial link text":
+      return findLinks(function (text) {
+        return text.indexOf(value) !== -1;
+      });
+  }
+  throw new Error("Unsupported locator strategy: " + by);
+}
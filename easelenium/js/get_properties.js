@@ -0,0 +1,84 @@
+// Returns requested properties of every element as {property: value}.
+// Expects `findElements`, `isDisplayed`, `getAttribute` and `getText`
+// functions to be defined before.
+//
+// arguments[0] - list of elements or [by, value] locators
+// arguments[1] - parent element or [by, value] locator, can be null
+// arguments[2] - list of properties: "text", "tag_name", "displayed", "rect",
+//                "location", "size", "attr:<name>", "prop:<name>", "css:<name>"
+// arguments[3] - if true then single locator in arguments[0] is replaced by
+//                all elements it finds, otherwise every locator is replaced by
+//                the first found element or null
+
+var targets = arguments[0];
+var parent = arguments[1];
+var properties = arguments[2];
+var findAll = arguments[3];
+
+function find(locatorOrElement, root) {
+  if (!Array.isArray(locatorOrElement)) return [locatorOrElement];
+  return findElements(locatorOrElement[0], locatorOrElement[1], root);
+}
+
+var root = parent ? find(parent)[0] : null;
+if (parent && !root) return null;
+
+var elements = findAll
+  ? find(targets[0], root)
+  : targets.map(function (target) {
+      return find(target, root)[0] || null;
+    });
+
+function getRect(element) {
+  var rect = element.getBoundingClientRect();
+  return {
+    x: rect.left + window.pageXOffset,
+    y: rect.top + window.pageYOffset,
+    width: rect.width,
+    height: rect.height,
+  };
+}
+
+function getProperty(element, property, rect) {
+  switch (property) {
+    case "text":
+      return getText(element);
+    case "tag_name":
+      return element.tagName.toLowerCase();
+    case "displayed":
+      return isDisplayed(element);
+    case "rect":
+      return rect();
+    case "location":
+      return { x: rect().x, y: rect().y };
+    case "size":
+      return { width: rect().width, height: rect().height };
+  }
+  var separator = property.indexOf(":");
+  var kind = property.slice(0, separator);
+  var name = property.slice(separator + 1);
+  switch (kind) {
+    case "attr":
+      return getAttribute(element, name);
+    case "prop":
+      var value = element[name];
+      return value === undefined ? null : value;
+    case "css":
+      return window.getComputedStyle(element).getPropertyValue(name);
+  }
+  throw new Error("Unsupported property " + property);
+}
+
+return elements.map(function (element) {
+  if (!element) return null;
+  var cachedRect = null;
+  function rect() {
+    cachedRect = cachedRect || getRect(element);
+    return cachedRect;
+  }
+  var result = {};
+  for (var i = 0; i < properties.length; i++) {
+    result[properties[i]] = getProperty(element, properties[i], rect);
+  }
+  return result;
+});
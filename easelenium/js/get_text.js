@@ -0,0 +1,11 @@
+// Defines `getText(element)` function which returns text of element close
+// to WebElement.text. Expects `isDisplayed` function to be defined before.
+//
+// Selenium's getVisibleText atom is not available, innerText is close to
+// it, but innerText of not rendered element is its whole text while
+// WebElement.text is empty, whitespace around line breaks can differ.
+
+function getText(element) {
+  if (!isDisplayed(element)) return "";
+  return (element.innerText || "").replace(/\u00a0/g, " ").trim();
+}
@@ -0,0 +1,8 @@
+// Returns number of requests in flight and how long network was quiet in
+// milliseconds. Expects network_tracker.js to be run before.
+
+var state = window.__easeleniumNetwork;
+return {
+  inFlight: state.inFlight,
+  quietFor: Date.now() - state.lastActivity,
+};
@@ -0,0 +1,57 @@
+// Counts fetch and XMLHttpRequest requests in flight in the window. It is
+// installed once, `window.__easeleniumNetwork` is {inFlight, lastActivity}
+// where lastActivity is time of the last started or finished request.
+// Requests which were started before installation are not counted.
+
+(function () {
+  if (window.__easeleniumNetwork) return;
+  var state = (window.__easeleniumNetwork = {
+    inFlight: 0,
+    lastActivity: Date.now(),
+  });
+
+  function start() {
+    state.inFlight++;
+    state.lastActivity = Date.now();
+  }
+
+  function finish() {
+    state.inFlight = Math.max(state.inFlight - 1, 0);
+    state.lastActivity = Date.now();
+  }
+
+  var originalFetch = window.fetch;
+  if (originalFetch) {
+    window.fetch = function () {
+      start();
+      try {
+        return originalFetch.apply(this, arguments).then(
+          function (response) {
+            finish();
+            return response;
+          },
+          function (error) {
+            finish();
+            throw error;
+          },
+        );
+      } catch (e) {
+        finish();
+        throw e;
+      }
+    };
+  }
+
+  var originalSend = XMLHttpRequest.prototype.send;
+  XMLHttpRequest.prototype.send = function () {
+    start();
+    this.addEventListener("loadend", finish);
+    try {
+      return originalSend.apply(this, arguments);
+    } catch (e) {
+      this.removeEventListener("loadend", finish);
+      finish();
+      throw e;
+    }
+  };
+})();
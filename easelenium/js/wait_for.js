@@ -0,0 +1,117 @@
+// Waits in the page until condition is true and calls WebDriver callback
+// with {ok: true, element: element} or with {ok: false} after timeout.
+// Condition is checked after every DOM mutation and periodically for
+// changes which are not visible for MutationObserver(ex. layout).
+// Expects `findElements`, `isDisplayed` and `getAttribute` functions to be
+// defined before.
+//
+// arguments[0] - condition: 'visible', 'not_visible', 'present',
+//                'not_present', 'text_changed' or 'attribute_changed'
+// arguments[1] - element or [by, value] locator
+// arguments[2] - parent element or [by, value] locator, can be null
+// arguments[3] - {text: old text} or {attr: name, value: old value}
+// arguments[4] - timeout in milliseconds
+
+var condition = arguments[0];
+var target = arguments[1];
+var parent = arguments[2];
+var options = arguments[3] || {};
+var timeout = arguments[4];
+var callback = arguments[arguments.length - 1];
+var FALLBACK_INTERVAL = 100;
+
+function normalizeText(text) {
+  return (text || "").replace(/\s+/g, " ").trim();
+}
+
+function find(locatorOrElement, root) {
+  if (locatorOrElement instanceof Element) {
+    return locatorOrElement.isConnected ? [locatorOrElement] : [];
+  }
+  return findElements(locatorOrElement[0], locatorOrElement[1], root);
+}
+
+function findTarget() {
+  var root = document;
+  if (parent) {
+    root = find(parent)[0];
+    if (!root) return [];
+  }
+  return find(target, root);
+}
+
+function check() {
+  var elements = findTarget();
+  var element = elements[0];
+  var visible = !!element && isDisplayed(element);
+  switch (condition) {
+    case "visible":
+      return visible ? { element: element } : null;
+    case "not_visible":
+      return visible ? null : {};
+    case "present":
+      return element ? { element: element } : null;
+    case "not_present":
+      return element ? null : {};
+    case "text_changed":
+      return visible &&
+        normalizeText(element.innerText) !== normalizeText(options.text)
+        ? { element: element }
+        : null;
+    case "attribute_changed":
+      return element && getAttribute(element, options.attr) !== options.value
+        ? { element: element }
+        : null;
+  }
+  throw new Error("Unsupported condition: " + condition);
+}
+
+var observer = null;
+var interval = null;
+var timer = null;
+var finished = false;
+
+function finish(result) {
+  if (finished) return;
+  finished = true;
+  if (observer) observer.disconnect();
+  clearInterval(interval);
+  clearTimeout(timer);
+  callback(result);
+}
+
+function checkAndFinish() {
+  if (finished) return;
+  try {
+    var result = check();
+    if (result) {
+      result.ok = true;
+      finish(result);
+    }
+  } catch (e) {
+    finish({ ok: false, error: String(e) });
+  }
+}
+
+checkAndFinish();
+if (!finished) {
+  var scheduled = false;
+  observer = new MutationObserver(function () {
+    if (scheduled) return;
+    scheduled = true;
+    requestAnimationFrame(function () {
+      scheduled = false;
+      checkAndFinish();
+    });
+  });
+  observer.observe(document, {
+    childList: true,
+    subtree: true,
+    attributes: true,
+    characterData: true,
+  });
+  interval = setInterval(checkAndFinish, FALLBACK_INTERVAL);
+  timer = setTimeout(function () {
+    finish({ ok: false });
+  }, timeout);
+}
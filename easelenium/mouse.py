@@ -70,17 +70,12 @@ class Mouse:
             by_css=by_css,
             by_class=by_class,
         )
-        self.browser.wait_for_visible(
+        element = self.browser.wait_for_visible(
             element=element,
         )
 
-        if type(element) == tuple:
-            element = self.browser.find_element(
-                element=element,
-            )
-
         self.browser._safe_log(  # noqa: SLF001
-            "Click at '%s' by offset(%s,%s)",
+            "Click at '{}' by offset({},{})",
             element,
             xoffset,
             yoffset,
@@ -104,7 +99,7 @@ class Mouse:
         by_class: str | None = None,
     ) -> None:
         """Mouse hover."""
-        self.browser._safe_log("Hover at '%s'", element)  # noqa: SLF001
+        self.browser._safe_log("Hover at '{}'", element)  # noqa: SLF001
 
         self.hover_by_offset(
             element,
@@ -147,16 +142,12 @@ class Mouse:
             by_css=by_css,
             by_class=by_class,
         )
-        self.browser.wait_for_visible(
-            element=element,
-        )
-
-        element = self.browser.find_element(
+        element = self.browser.wait_for_visible(
             element=element,
         )
 
         self.browser._safe_log(  # noqa: SLF001
-            "Mouse over '%s' by offset(%s,%s)",
+            "Mouse over '{}' by offset({},{})",
             element,
             xoffset,
             yoffset,
@@ -189,17 +180,12 @@ class Mouse:
             by_css=by_css,
             by_class=by_class,
         )
-        self.browser.wait_for_visible(
+        element = self.browser.wait_for_visible(
             element=element,
         )
 
-        if type(element) == tuple:
-            element = self.browser.find_element(
-                element=element,
-            )
-
         self.browser._safe_log(  # noqa: SLF001
-            "Right click at '%s'",
+            "Right click at '{}'",
             element,
         )
 
@@ -232,17 +218,12 @@ class Mouse:
             by_css=by_css,
             by_class=by_class,
         )
-        self.browser.wait_for_visible(
+        element = self.browser.wait_for_visible(
             element=element,
         )
 
-        if type(element) == tuple:
-            element = self.browser.find_element(
-                element=element,
-            )
-
         self.browser._safe_log(  # noqa: SLF001
-            "Right click at '%s' by offset(%s,%s)",
+            "Right click at '{}' by offset({},{})",
             element,
             xoffset,
             yoffset,
@@ -0,0 +1,204 @@
+"""Parallel test execution helpers of easelenium command line tool."""
+from __future__ import annotations
+
+import heapq
+import json
+import subprocess
+import sys
+from html import escape
+from typing import TYPE_CHECKING
+from xml.etree import ElementTree as ET
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+DEFAULT_DURATION = 1.0
+JUNIT_COUNTERS = ("tests", "errors", "failures", "skipped")
+
+
+def get_test_group(nodeid: str, *, in_class: bool) -> str:
+    """Return test class node id or module path for module level test."""
+    parts = nodeid.split("::")
+    return "::".join(parts[:2]) if in_class and len(parts) > 2 else parts[0]  # noqa: PLR2004
+
+
+def schedule(
+    groups: Iterable[str],
+    durations: dict[str, float],
+    workers: int,
+) -> list[list[str]]:
+    """
+    Split test groups between workers so they finish at the same time.
+
+    Longest groups are scheduled first, each to the least loaded worker.
+    Groups without history are expected to take average known duration.
+    """
+    groups = list(dict.fromkeys(groups))
+    known = [durations[g] for g in groups if g in durations]
+    default = sum(known) / len(known) if known else DEFAULT_DURATION
+
+    buckets = [[] for _ in range(max(workers, 1))]
+    loads = [(0.0, i) for i in range(len(buckets))]
+    for group in sorted(groups, key=lambda g: (-durations.get(g, default), g)):
+        load, i = heapq.heappop(loads)
+        buckets[i].append(group)
+        heapq.heappush(loads, (load + durations.get(group, default), i))
+    return [bucket for bucket in buckets if bucket]
+
+
+def get_worker_args(args: list[str], options: Iterable[str]) -> list[str]:
+    """Return command line arguments without given options and their values."""
+    options = tuple(options)
+    worker_args = []
+    skip_value = False
+    for arg in args:
+        if skip_value:
+            skip_value = False
+        elif arg in options:
+            skip_value = True
+        elif not arg.startswith(tuple(f"{option}=" for option in options)):
+            worker_args.append(arg)
+    return worker_args
+
+
+def get_worker_html_path(html_path: Path, worker: int) -> Path:
+    """Return path of HTML report of worker which is saved next to main one."""
+    return html_path.with_name(f"{html_path.stem}_worker_{worker}{html_path.suffix}")
+
+
+def run_workers(
+    args: list[str],
+    buckets: list[list[str]],
+    folder: Path,
+    html_path: Path | None = None,
+) -> list[int]:
+    """
+    Run every bucket of test groups in separate easelenium_cli process.
+
+    Each worker writes JUnit report and durations of test groups to `folder`
+    and HTML report next to `html_path` if it is passed. Return exit codes of
+    workers.
+    """
+    processes = []
+    for i, bucket in enumerate(buckets):
+        tests_file = folder / f"worker_{i}_tests.json"
+        tests_file.write_text(json.dumps(bucket), encoding="utf-8")
+        cmd = [
+            sys.executable,
+            "-m",
+            "easelenium.scripts.easelenium_cli",
+            *args,
+            f"--junitxml={folder / f'worker_{i}.xml'}",
+            f"--easelenium-tests-file={tests_file}",
+            f"--easelenium-durations-file={folder / f'worker_{i}_durations.json'}",
+        ]
+        if html_path:
+            cmd.append(f"--html={get_worker_html_path(html_path, i)}")
+        processes.append(subprocess.Popen(cmd))  # noqa: S603
+
+    return [process.wait() for process in processes]
+
+
+def get_exit_code(exit_codes: list[int]) -> int:
+    """Return exit code of whole run from worker exit codes."""
+    errors = [code for code in exit_codes if code not in (0, 1)]
+    if errors:
+        return errors[0]
+    return max(exit_codes, default=0)
+
+
+def load_durations(paths: Iterable[Path]) -> dict[str, float]:
+    """Merge test group durations written by workers."""
+    durations = {}
+    for path in paths:
+        if path.exists():
+            durations.update(json.loads(path.read_text(encoding="utf-8")))
+    return durations
+
+
+def merge_junit_reports(paths: Iterable[Path], output_path: Path) -> None:
+    """
+    Merge JUnit reports of workers into single test suite.
+
+    Counters are recalculated from test cases, test cases which are reported
+    by several workers (ex. skipped modules) are taken once. Time of merged
+    suite is time of the longest worker, i.e. wall time of parallel run.
+    """
+    merged = ET.Element("testsuite", name="pytest")
+    testcases = {}
+    time = 0.0
+    for path in paths:
+        if not path.exists():
+            continue
+        for suite in ET.parse(path).getroot().iter("testsuite"):  # noqa: S314
+            time = max(time, float(suite.get("time", 0)))
+            for testcase in suite.iter("testcase"):
+                key = testcase.get("classname"), testcase.get("name")
+                testcases.setdefault(key, testcase)
+            for attr in ("timestamp", "hostname"):
+                if attr not in merged.attrib and suite.get(attr):
+                    merged.set(attr, suite.get(attr))
+
+    merged.extend(testcases.values())
+    merged.set("tests", str(len(testcases)))
+    for counter, tag in (
+        ("errors", "error"),
+        ("failures", "failure"),
+        ("skipped", "skipped"),
+    ):
+        count = sum(1 for t in testcases.values() if t.find(tag) is not None)
+        merged.set(counter, str(count))
+    merged.set("time", f"{time:.3f}")
+
+    root = ET.Element("testsuites")
+    root.append(merged)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    ET.ElementTree(root).write(
+        output_path,
+        encoding="utf-8",
+        xml_declaration=True,
+    )
+
+
+def write_html_report(
+    junit_path: Path,
+    output_path: Path,
+    worker_reports: list[Path],
+) -> None:
+    """Write HTML summary of merged JUnit report with links to worker reports."""
+    suite = ET.parse(junit_path).getroot().find("testsuite")  # noqa: S314
+    rows = []
+    for testcase in suite.iter("testcase"):
+        outcome, message = "passed", ""
+        for tag in ("failure", "error", "skipped"):
+            child = testcase.find(tag)
+            if child is not None:
+                outcome, message = tag, child.get("message", "")
+                break
+        rows.append(
+            f'<tr class="{outcome}"><td>{escape(testcase.get("classname", ""))}</td>'
+            f'<td>{escape(testcase.get("name", ""))}</td>'
+            f'<td>{float(testcase.get("time", 0)):.2f}</td>'
+            f"<td>{outcome}</td><td>{escape(message)}</td></tr>",
+        )
+
+    summary = ", ".join(f"{c}: {suite.get(c)}" for c in JUNIT_COUNTERS)
+    links = "".join(
+        f'<li><a href="{escape(p.name)}">{escape(p.name)}</a></li>'
+        for p in worker_reports
+        if p.exists()
+    )
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(
+        "<!DOCTYPE html><html><head><meta charset='utf-8'>"
+        "<title>easelenium report</title><style>"
+        ".failure, .error {background: #fdd} .skipped {background: #ffd}"
+        "</style></head><body>"
+        f"<h1>easelenium report</h1><p>{summary}, time: {suite.get('time')}s</p>"
+        f"<ul>{links}</ul><table border='1'>"
+        "<tr><th>Class</th><th>Test</th><th>Time</th><th>Outcome</th>"
+        "<th>Message</th></tr>"
+        f"{''.join(rows)}</table></body></html>",
+        encoding="utf-8",
+    )
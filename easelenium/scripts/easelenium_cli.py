@@ -1,8 +1,14 @@
 #!/usr/bin/env python3
 
 """Easelenium command line tool."""
+from __future__ import annotations
 
+import json
+import subprocess
 import sys
+import tempfile
+from argparse import SUPPRESS, ArgumentParser
+from collections import Counter
 from pathlib import Path
 from typing import Any
 
@@ -11,11 +17,35 @@ import pytest
 sys.path.append((Path(__file__).parent / "../..").as_posix())
 
 from easelenium.browser import Browser  # noqa: E402
+from easelenium.parallel_runner import (  # noqa: E402
+    get_exit_code,
+    get_test_group,
+    get_worker_args,
+    get_worker_html_path,
+    load_durations,
+    merge_junit_reports,
+    run_workers,
+    schedule,
+    write_html_report,
+)
+from easelenium.ui.generator.batch_generator import (  # noqa: E402
+    BatchGenerator,
+    get_timing_report,
+    load_manifest,
+    write_timing_report,
+)
 
 
 class EaseleniumPlugin:
     """easelenium pytest plugin."""
 
+    DURATIONS_FILE_NAME = "easelenium_durations.json"
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.__groups = {}
+        self.__durations = Counter()
+
     def pytest_addoption(self, parser: Any) -> None:  # noqa: D102, ANN401
         group = parser.getgroup("easelenium")
         group.addoption(
@@ -25,13 +55,195 @@ class EaseleniumPlugin:
             "If value was not passed then 'ff' will be used. ",
             choices=Browser.get_supported_browsers(),
         )
+        group.addoption(
+            "--workers",
+            dest="WORKERS",
+            type=int,
+            default=0,
+            help="Run test classes in N worker processes, each with its own "
+            "browser. Test classes are distributed by their previous durations "
+            "and JUnit/HTML reports of workers are merged.",
+        )
+        # options used internally by workers
+        group.addoption("--easelenium-tests-file", dest="TESTS_FILE", help=SUPPRESS)
+        group.addoption("--easelenium-collect-file", dest="COLLECT_FILE", help=SUPPRESS)
+        group.addoption(
+            "--easelenium-durations-file",
+            dest="DURATIONS_FILE",
+            help=SUPPRESS,
+        )
 
     def pytest_configure(self, config: Any) -> None:  # noqa: D102, ANN401
         Browser.DEFAULT_BROWSER = config.option.BROWSER
 
+    def pytest_cmdline_main(self, config: Any) -> Any:  # noqa: D102, ANN401
+        is_worker = config.option.TESTS_FILE or config.option.COLLECT_FILE
+        if config.option.WORKERS > 1 and not is_worker:
+            return self.__run_in_parallel(config)
+        return None
+
+    def pytest_collection_modifyitems(  # noqa: D102
+        self,
+        config: Any,  # noqa: ANN401
+        items: list[Any],
+    ) -> None:
+        for item in items:
+            self.__groups[item.nodeid] = get_test_group(
+                item.nodeid,
+                in_class=item.cls is not None,
+            )
+
+        if config.option.TESTS_FILE:
+            tests_file = Path(config.option.TESTS_FILE)
+            groups = set(json.loads(tests_file.read_text(encoding="utf-8")))
+            selected = [i for i in items if self.__groups[i.nodeid] in groups]
+            deselected = [i for i in items if self.__groups[i.nodeid] not in groups]
+            if deselected:
+                config.hook.pytest_deselected(items=deselected)
+            items[:] = selected
+
+    def pytest_collection_finish(self, session: Any) -> None:  # noqa: D102, ANN401
+        if session.config.option.COLLECT_FILE:
+            groups = [self.__groups[item.nodeid] for item in session.items]
+            Path(session.config.option.COLLECT_FILE).write_text(
+                json.dumps(list(dict.fromkeys(groups))),
+                encoding="utf-8",
+            )
+
+    def pytest_runtest_logreport(self, report: Any) -> None:  # noqa: D102, ANN401
+        group = self.__groups.get(report.nodeid)
+        if group:
+            # setUpClass time is included in setup of the first test of class
+            self.__durations[group] += report.duration
+
+    def pytest_sessionfinish(self, session: Any) -> None:  # noqa: D102, ANN401
+        if session.config.option.DURATIONS_FILE:
+            Path(session.config.option.DURATIONS_FILE).write_text(
+                json.dumps(self.__durations),
+                encoding="utf-8",
+            )
+
+    def __run_in_parallel(self, config: Any) -> int:  # noqa: ANN401
+        args = get_worker_args(
+            list(config.invocation_params.args),
+            ("--workers", "--junitxml", "--junit-xml", "--html"),
+        )
+        xml_path = getattr(config.option, "xmlpath", None)
+        html_path = getattr(config.option, "htmlpath", None)
+        html_path = Path(html_path).absolute() if html_path else None
+        # plugins are not configured yet, so pytest cache is not available
+        try:
+            cache_dir = config.getini("cache_dir")
+        except ValueError:
+            # option is registered by cacheprovider plugin which is disabled,
+            # ex. with `-p no:cacheprovider`
+            cache_dir = ".pytest_cache"
+        durations_path = config.rootpath / cache_dir / self.DURATIONS_FILE_NAME
+
+        with tempfile.TemporaryDirectory() as tmp_folder:
+            folder = Path(tmp_folder)
+            collect_file = folder / "groups.json"
+            exit_code = subprocess.call(  # noqa: S603
+                [
+                    sys.executable,
+                    "-m",
+                    "easelenium.scripts.easelenium_cli",
+                    *args,
+                    "--collect-only",
+                    "-qq",
+                    f"--easelenium-collect-file={collect_file}",
+                ],
+                stdout=subprocess.DEVNULL,
+            )
+            if exit_code:
+                return exit_code
+
+            groups = json.loads(collect_file.read_text(encoding="utf-8"))
+            durations = load_durations([durations_path])
+            buckets = schedule(groups, durations, config.option.WORKERS)
+            print(  # noqa: T201
+                f"Running {len(groups)} test classes in {len(buckets)} workers",
+            )
+
+            exit_codes = run_workers(args, buckets, folder, html_path)
+
+            worker_indexes = range(len(buckets))
+            durations.update(
+                load_durations(
+                    folder / f"worker_{i}_durations.json" for i in worker_indexes
+                ),
+            )
+            durations_path.parent.mkdir(parents=True, exist_ok=True)
+            durations_path.write_text(json.dumps(durations), encoding="utf-8")
+
+            junit_path = Path(xml_path) if xml_path else folder / "merged.xml"
+            merge_junit_reports(
+                (folder / f"worker_{i}.xml" for i in worker_indexes),
+                junit_path,
+            )
+            if html_path:
+                write_html_report(
+                    junit_path,
+                    html_path,
+                    [get_worker_html_path(html_path, i) for i in worker_indexes],
+                )
+
+        return get_exit_code(exit_codes)
+
+
+def generate(args: list[str]) -> int:
+    """Generate page object classes for urls from manifest."""
+    parser = ArgumentParser(
+        prog="easelenium_cli generate",
+        description="Generate page object classes for urls from JSON or YAML "
+        "manifest without UI. Manifest is a list of urls or objects with 'url', "
+        "'class_name' and 'area' keys. Interrupted generation is resumed from "
+        "checkpoint in output folder.",
+    )
+    parser.add_argument("manifest", help="Path to JSON or YAML manifest.")
+    parser.add_argument(
+        "-o",
+        "--output",
+        default=".",
+        help="Folder where page objects folder is created, default is current.",
+    )
+    parser.add_argument(
+        "--browser",
+        default=Browser.GC_HEADLESS,
+        choices=Browser.get_supported_browsers(),
+        help="Browser initials, default is headless Chrome.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of urls which are generated concurrently, "
+        "browser sessions are reused by workers.",
+    )
+    parser.add_argument(
+        "--restart",
+        action="store_true",
+        help="Ignore checkpoint and generate all urls again.",
+    )
+    parser.add_argument("--report", help="Save duration of every url to JSON file.")
+    options = parser.parse_args(args)
+
+    tasks = load_manifest(options.manifest)
+    results = BatchGenerator(
+        options.output,
+        workers=options.workers,
+        browser_kwargs={"browser_name": options.browser},
+    ).generate(tasks, on_result=print, resume=not options.restart)
+    print(get_timing_report(results))  # noqa: T201
+    if options.report:
+        write_timing_report(results, options.report)
+    return 0 if all(result.succeeded for result in results) else 1
+
 
 def main() -> None:
-    """Run pytest with easelenium plugin."""
+    """Run pytest with easelenium plugin or `generate` command."""
+    if sys.argv[1:2] == ["generate"]:
+        sys.exit(generate(sys.argv[2:]))
     sys.exit(pytest.main(plugins=[EaseleniumPlugin()]))
 
 
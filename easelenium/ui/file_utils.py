@@ -4,6 +4,10 @@ from __future__ import annotations
 import codecs
 import os
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
 
 __ENCODING = "utf8"
 __WRITE_MODE = "wb"
@@ -56,6 +60,25 @@ def save_file(path: str, content: str, *, is_text: bool = True) -> None:
             f.write(content)
 
 
+def save_file_chunks(path: str, chunks: Iterable[str]) -> None:
+    """
+    Save text file chunk by chunk while chunks are produced.
+
+    Chunks are written to temporary file in the same folder which replaces
+    the file when all chunks are written, so if producing of chunks fails
+    then the file is left as it was.
+    """
+    tmp_path = Path(path).with_name(f".{Path(path).name}.{os.getpid()}.tmp")
+    try:
+        with codecs.open(str(tmp_path), __WRITE_MODE, encoding=__ENCODING) as f:
+            for chunk in chunks:
+                f.write(chunk)
+        tmp_path.replace(path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
 def read_file(path: str) -> str:
     """Read file."""
     with codecs.open(path, __READ_MODE, encoding=__ENCODING) as f:
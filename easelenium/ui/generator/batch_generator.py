@@ -0,0 +1,361 @@
+"""Generation of page object classes for many urls."""
+from __future__ import annotations
+
+import json
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from queue import Empty, Queue
+from threading import Lock
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Callable
+
+from easelenium.browser_pool import BrowserPool
+from easelenium.ui.generator.page_object_generator import PageObjectGenerator
+from easelenium.ui.string_utils import StringUtils
+
+if TYPE_CHECKING:
+    from loguru import Logger
+
+    from easelenium.browser import Browser
+    from easelenium.ui.utils import TypeArea
+
+
+def get_class_name_from_url(url: str) -> str:
+    """Return page object class name like 'ExampleComLoginPage' for url."""
+    address = re.sub(r"^https?://(www\.)?", "", url).split("?")[0].split("#")[0]
+    name = "".join(w.capitalize() for w in re.findall(r"[a-zA-Z0-9]+", address))
+    if not name or name[0].isdigit():
+        name = "Page" + name
+    return name + "Page"
+
+
+class GenerationTask:
+    """Url for which page object class should be generated."""
+
+    def __init__(
+        self,
+        url: str,
+        class_name: str | None = None,
+        area: TypeArea | None = None,
+    ) -> None:
+        """Initialize, class name is made from url if it is not passed."""
+        class_name = class_name or get_class_name_from_url(url)
+        if not StringUtils.is_url_correct(url):
+            msg = f"Bad url '{url}'"
+            raise ValueError(msg)
+        if not StringUtils.is_class_name_correct(class_name):
+            msg = f"Bad class name '{class_name}'"
+            raise ValueError(msg)
+        if area is not None and len(area) != 4:  # noqa: PLR2004
+            msg = f"Bad area data '{area}'"
+            raise ValueError(msg)
+
+        self.url = url
+        self.class_name = class_name
+        self.area = tuple(area) if area is not None else None
+
+    @classmethod
+    def from_manifest_entry(
+        cls: type[GenerationTask],
+        entry: str | dict[str, Any],
+    ) -> GenerationTask:
+        """Create task from url or dict with 'url', 'class_name' and 'area'."""
+        if isinstance(entry, str):
+            return cls(entry)
+        unknown_keys = set(entry) - {"url", "class_name", "area"}
+        if unknown_keys or "url" not in entry:
+            msg = f"Bad manifest entry {entry}"
+            raise ValueError(msg)
+        return cls(entry["url"], entry.get("class_name"), entry.get("area"))
+
+    @property
+    def key(self) -> str:
+        """Return key of task in checkpoint."""
+        return json.dumps([self.url, self.class_name, self.area])
+
+    def __repr__(self) -> str:
+        """Return a string representation of the object."""
+        return f"GenerationTask({self.url!r}, {self.class_name!r}, {self.area!r})"
+
+
+def load_manifest(path: str | Path) -> list[GenerationTask]:
+    """
+    Return tasks from manifest which is a list of manifest entries.
+
+    Manifest is JSON file or YAML file with '.yaml' or '.yml' extension,
+    PyYAML should be installed to load YAML manifest.
+    """
+    text = Path(path).read_text(encoding="utf-8")
+    if Path(path).suffix.lower() in (".yaml", ".yml"):
+        try:
+            # PyYAML is optional, it is needed only for YAML manifests
+            import yaml  # noqa: PLC0415
+        except ModuleNotFoundError as e:
+            msg = "PyYAML should be installed to load YAML manifest"
+            raise ModuleNotFoundError(msg) from e
+        entries = yaml.safe_load(text)
+    else:
+        entries = json.loads(text)
+    if not isinstance(entries, list):
+        msg = f"Manifest '{path}' should contain a list of urls"
+        raise ValueError(msg)  # noqa: TRY004
+    return [GenerationTask.from_manifest_entry(entry) for entry in entries]
+
+
+class GenerationResult:
+    """Result of generation of page object class for single task."""
+
+    def __init__(  # noqa: PLR0913
+        self,
+        task: GenerationTask,
+        duration: float,
+        file_path: str | None = None,
+        img_path: str | None = None,
+        fields_count: int = 0,
+        error: str | None = None,
+        *,
+        resumed: bool = False,
+    ) -> None:
+        """Initialize, `resumed` result is loaded from checkpoint."""
+        self.task = task
+        self.duration = duration
+        self.file_path = file_path
+        self.img_path = img_path
+        self.fields_count = fields_count
+        self.error = error
+        self.resumed = resumed
+
+    @property
+    def succeeded(self) -> bool:
+        """Return True if class was saved."""
+        return self.error is None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return result as dict which can be saved to JSON."""
+        return {
+            "url": self.task.url,
+            "class_name": self.task.class_name,
+            "area": self.task.area,
+            "duration": self.duration,
+            "file_path": self.file_path,
+            "img_path": self.img_path,
+            "fields_count": self.fields_count,
+            "error": self.error,
+            "resumed": self.resumed,
+        }
+
+    def __str__(self) -> str:
+        """Return single line report."""
+        if self.resumed:
+            return f"RESUMED {self.task.url} -> {self.file_path}"
+        if self.succeeded:
+            return (
+                f"OK {self.task.url} -> {self.file_path} "
+                f"({self.fields_count} fields, {self.duration:.2f}s)"
+            )
+        return f"FAILED {self.task.url} ({self.duration:.2f}s): {self.error}"
+
+
+def get_timing_report(results: list[GenerationResult], slowest: int = 5) -> str:
+    """Return summary of generation with the slowest urls."""
+    generated = [r for r in results if r.succeeded and not r.resumed]
+    failed = [r for r in results if not r.succeeded]
+    lines = [
+        (
+            f"Generated: {len(generated)}, resumed: "
+            f"{sum(1 for r in results if r.resumed)}, failed: {len(failed)}, "
+            f"time of all urls: {sum(r.duration for r in generated + failed):.2f}s"
+        ),
+    ]
+    timed = sorted(generated + failed, key=lambda r: -r.duration)[:slowest]
+    if timed:
+        lines.append("Slowest urls:")
+        lines += [f"  {r.duration:8.2f}s {r.task.url}" for r in timed]
+    return os.linesep.join(lines)
+
+
+def write_timing_report(results: list[GenerationResult], path: str | Path) -> None:
+    """Save results with duration of every url to JSON file."""
+    Path(path).write_text(
+        json.dumps([result.to_dict() for result in results], indent=2),
+        encoding="utf-8",
+    )
+
+
+class BatchGenerator:
+    """
+    Generator of page object classes for many urls without UI.
+
+    Tasks are shared by `workers` threads, every task is generated in browser
+    session which is leased from `pool`, so sessions are reused for many
+    urls. Class and screenshot are saved to `folder` as soon as page is
+    scanned and task is recorded in checkpoint file. Class of url which
+    failed is left as it was, ex. from the previous generation. Tasks from
+    checkpoint are not generated again, so interrupted generation is resumed
+    when it is started again. Checkpoint is removed when all tasks succeeded.
+    """
+
+    CHECKPOINT_FILE_NAME = ".easelenium_generate_checkpoint.json"
+
+    def __init__(  # noqa: PLR0913
+        self,
+        folder: str | Path,
+        *,
+        workers: int = 1,
+        pool: BrowserPool | None = None,
+        browser_kwargs: dict[str, Any] | None = None,
+        generator_factory: Callable[[Browser], PageObjectGenerator] | None = None,
+        logger: Logger | None = None,
+        checkpoint_path: str | Path | None = None,
+    ) -> None:
+        """
+        Initialize.
+
+        `browser_kwargs` are passed to Browser when pool starts new session.
+        If `pool` is not passed then own pool is used and closed after
+        generation.
+        """
+        if workers < 1:
+            msg = f"Number of workers should be positive, got {workers}"
+            raise ValueError(msg)
+        self.folder = Path(folder)
+        self.workers = workers
+        self.pool = pool
+        self.browser_kwargs = browser_kwargs or {}
+        self.generator_factory = generator_factory or (
+            lambda browser: PageObjectGenerator(browser, logger)
+        )
+        self.logger = logger
+        self.checkpoint_path = Path(
+            checkpoint_path or self.folder / self.CHECKPOINT_FILE_NAME,
+        )
+        self.__checkpoint = {}
+        self.__lock = Lock()
+
+    def generate(
+        self,
+        tasks: list[GenerationTask],
+        on_result: Callable[[GenerationResult], None] | None = None,
+        *,
+        resume: bool = True,
+    ) -> list[GenerationResult]:
+        """
+        Generate classes for tasks, return results in order of tasks.
+
+        `on_result` is called with every result as soon as it is ready. If
+        `resume` is False then checkpoint is ignored and all tasks are
+        generated.
+        """
+        self.folder.mkdir(parents=True, exist_ok=True)
+        self.__checkpoint = self.__load_checkpoint() if resume else {}
+
+        results = [None] * len(tasks)
+        queue = Queue()
+        for i, task in enumerate(tasks):
+            done = self.__checkpoint.get(task.key)
+            if done and Path(done["file_path"]).exists():
+                results[i] = GenerationResult(
+                    task,
+                    done["duration"],
+                    done["file_path"],
+                    done["img_path"],
+                    done["fields_count"],
+                    resumed=True,
+                )
+                if on_result:
+                    on_result(results[i])
+            else:
+                queue.put((i, task))
+
+        pool = self.pool or BrowserPool()
+        workers = min(self.workers, queue.qsize())
+        try:
+            if workers:
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    futures = [
+                        executor.submit(
+                            self.__run_worker,
+                            pool,
+                            queue,
+                            results,
+                            on_result,
+                        )
+                        for _ in range(workers)
+                    ]
+                    for future in futures:
+                        future.result()
+        finally:
+            if pool is not self.pool:
+                pool.close()
+
+        if all(result.succeeded for result in results):
+            self.checkpoint_path.unlink(missing_ok=True)
+        return results
+
+    def __run_worker(
+        self,
+        pool: BrowserPool,
+        queue: Queue,
+        results: list[GenerationResult | None],
+        on_result: Callable[[GenerationResult], None] | None,
+    ) -> None:
+        while True:
+            try:
+                i, task = queue.get_nowait()
+            except Empty:
+                return
+
+            # pool checks health of session before it is handed out and
+            # quits session which can't be reset after failure
+            with pool.lease(**self.browser_kwargs) as browser:
+                result = self.__generate(browser, task)
+            if result.succeeded:
+                self.__save_to_checkpoint(result)
+            results[i] = result
+            if on_result:
+                on_result(result)
+
+    def __generate(self, browser: Browser, task: GenerationTask) -> GenerationResult:
+        start = perf_counter()
+        try:
+            po_class = self.generator_factory(browser).get_po_class_for_url(
+                task.url,
+                task.class_name,
+                str(self.folder),
+                task.area,
+                stream=True,
+            )
+            po_class.save()
+        except Exception as e:  # noqa: BLE001
+            # single broken page should not stop generation of other pages
+            if self.logger:
+                self.logger.warn(  # noqa: G010, PLE1205
+                    "Failed to generate class for {}: {}",
+                    task.url,
+                    e,
+                )
+            return GenerationResult(task, perf_counter() - start, error=repr(e))
+
+        return GenerationResult(
+            task,
+            perf_counter() - start,
+            po_class.file_path,
+            po_class.img_path,
+            len(po_class.fields),
+        )
+
+    def __load_checkpoint(self) -> dict[str, dict[str, Any]]:
+        try:
+            return json.loads(self.checkpoint_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+    def __save_to_checkpoint(self, result: GenerationResult) -> None:
+        with self.__lock:
+            self.__checkpoint[result.task.key] = result.to_dict()
+            tmp_path = self.checkpoint_path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(self.__checkpoint), encoding="utf-8")
+            # checkpoint is never partially written if process is killed
+            tmp_path.replace(self.checkpoint_path)
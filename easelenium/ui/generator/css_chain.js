@@ -0,0 +1,27 @@
+// Defines `getCssChain(element)` function which returns simple css selectors
+// of element and its ancestors: '#id' if element has id otherwise
+// '.class1.class2'. Chain stops before HTML/BODY tag or before element
+// without id and class.
+
+function getSimpleCssSelector(element) {
+  var selector = "";
+  var id = (element.getAttribute("id") || "").trim();
+  if (id) {
+    selector = "#" + id;
+  } else {
+    var className = (element.getAttribute("class") || "").trim();
+    if (className) selector = "." + className.replace(/\s+/g, ".");
+  }
+  return selector.replace(/:/g, "\\:");
+}
+
+function getCssChain(element) {
+  var chain = [];
+  for (; element && element.nodeType == 1; element = element.parentNode) {
+    var tagName = element.nodeName.toLowerCase();
+    var selector = getSimpleCssSelector(element);
+    if (tagName == "body" || tagName == "html" || !selector) break;
+    chain.push(selector);
+  }
+  return chain;
+}
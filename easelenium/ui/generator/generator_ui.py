@@ -147,12 +147,13 @@ class GeneratorTab(Panel):
     def __get_frames(self) -> list[tuple[str, str]] | None:
         browser = self.main_frame.get_browser()
         if browser:
-            frames = []
-            for e in browser.find_elements((By.CSS_SELECTOR, "frame, iframe")):
-                name = browser.get_attribute(e, "name")
-                src = browser.get_attribute(e, "src")
-                frames.append((name, src))
-            return frames
+            return [
+                (p["attr:name"], p["attr:src"])
+                for p in browser.get_properties(
+                    (By.CSS_SELECTOR, "frame, iframe"),
+                    ["attr:name", "attr:src"],
+                )
+            ]
 
         return None
 
@@ -0,0 +1,64 @@
+"""Geometry of page elements used by generator."""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from easelenium.ui.utils import TypeArea, TypePoint
+
+    TypeRect = tuple[float, float, float, float]
+
+
+def check_area(area: TypeArea) -> None:
+    """Raise ValueError if area is not (x, y, width, height)."""
+    if type(area) not in (tuple, list) or len(area) != 4:  # noqa: PLR2004
+        msg = f"Bad area data '{area}'"
+        raise ValueError(msg)
+
+
+def check_areas(area: TypeArea | None, regions: list[TypeArea] | None) -> None:
+    """Raise ValueError if area or any of regions is not correct."""
+    for checked_area in [area, *(regions or [])]:
+        if checked_area:
+            check_area(checked_area)
+
+
+def get_center(rect: TypeRect, location_offset: TypePoint | None = None) -> TypePoint:
+    """Return center of (x, y, width, height) rect moved by location offset."""
+    x, y, w, h = rect
+    if location_offset:
+        # fixing location because it is located inside frame
+        x += location_offset[0]
+        y += location_offset[1]
+    return int(x + w / 2), int(y + h / 2)
+
+
+def contains(area: TypeArea, point: TypePoint) -> bool:
+    """Return True if point is inside area, right and bottom edges excluded."""
+    x, y, w, h = area
+    return x <= point[0] < x + w and y <= point[1] < y + h
+
+
+def get_inside_mask(
+    rects: Iterable[TypeRect],
+    area: TypeArea | None = None,
+    regions: list[TypeArea] | None = None,
+    location_offset: TypePoint | None = None,
+) -> list[bool]:
+    """
+    Return for every rect if its center is inside area and any of regions.
+
+    Area and regions are not checked if they are not passed.
+    """
+    check_areas(area, regions)
+
+    mask = []
+    for rect in rects:
+        center = get_center(rect, location_offset)
+        mask.append(
+            (not area or contains(area, center))
+            and (not regions or any(contains(r, center) for r in regions)),
+        )
+    return mask
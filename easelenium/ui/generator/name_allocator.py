@@ -0,0 +1,46 @@
+"""NameAllocator class."""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+
+class NameAllocator:
+    """
+    Allocator of unique field names.
+
+    Name which is already taken gets first free suffix like 'NAME_0',
+    'NAME_1'. Next suffix to try is kept for every name, so suffixes which
+    were given before are not checked again and every allocation takes
+    constant time on average.
+    """
+
+    def __init__(self, taken_names: Iterable[str] = ()) -> None:
+        """Initialize with names which should not be allocated."""
+        self.__taken_names = set(taken_names)
+        self.__next_suffixes = {}
+
+    def allocate(self, name: str) -> str:
+        """Return unique name for `name` and mark it as taken."""
+        if name in self.__taken_names:
+            i = self.__next_suffixes.get(name, 0)
+            while f"{name}_{i}" in self.__taken_names:
+                i += 1
+            self.__next_suffixes[name] = i + 1
+            name = f"{name}_{i}"
+        self.__taken_names.add(name)
+        return name
+
+    def reserve(self, name: str) -> None:
+        """Mark name as taken without changing it."""
+        self.__taken_names.add(name)
+
+    def __contains__(self, name: str) -> bool:
+        """Return True if name is taken."""
+        return name in self.__taken_names
+
+    def __len__(self) -> int:
+        """Return number of taken names."""
+        return len(self.__taken_names)
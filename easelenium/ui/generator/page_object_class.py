@@ -3,12 +3,16 @@ from __future__ import annotations
 
 import ast
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from selenium.webdriver.common.by import By
 
-from easelenium.ui.file_utils import safe_create_path, save_file
+from easelenium.ui.file_utils import save_file, save_file_chunks
 from easelenium.utils import LINESEP, get_match
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
 
 def get_by_as_code_str(by: str) -> str:
     """Get the By enum literal as a Python code string."""
@@ -109,7 +113,7 @@ class {name}(BasePageObject):
         self,
         name: str,
         url: str,
-        fields: list[str],
+        fields: Iterable[PageObjectClassField],
         area: tuple[int, int] | None = None,
         file_path: str | None = None,
         img_path: str | None = None,
@@ -125,7 +129,14 @@ class {name}(BasePageObject):
         self.img_path = img_path
 
     def save(self, new_folder: str | None = None) -> None:
-        """Save the class to a file."""
+        """
+        Save the class to a file.
+
+        Fields are written one by one, so if `fields` is an iterator then
+        every field is saved as soon as it is produced. File is replaced only
+        if all fields were produced. After saving `fields` is a list of saved
+        fields.
+        """
         if new_folder:
             py_filename = Path(self.file_path).name
             img_filename = Path(self.img_path).name
@@ -133,33 +144,45 @@ class {name}(BasePageObject):
             self.img_path = str(
                 (Path(new_folder) / self.IMAGE_FOLDER / img_filename),
             )
-        safe_create_path(self.file_path)
-        safe_create_path(self.img_path)
-        save_file(self.file_path, self._get_file_content())
+        Path(self.file_path).parent.mkdir(parents=True, exist_ok=True)
+        save_file_chunks(self.file_path, self._iter_file_content())
+        Path(self.img_path).parent.mkdir(parents=True, exist_ok=True)
         save_file(self.img_path, self.img_as_png, is_text=False)
 
     def _get_file_content(self) -> str:
         """Get formatted file content."""
+        return "".join(self._iter_file_content())
+
+    def _iter_file_content(self) -> Iterator[str]:
         kwargs = self.__dict__.copy()
-        fields_as_code = self._get_fields_as_code()
-        if len(fields_as_code.strip()) == 0:
-            fields_as_code = "    pass" + LINESEP
-        kwargs["fields_as_code"] = fields_as_code
-        return self.TEMPLATE.format(**kwargs)
+        header, footer = self.TEMPLATE.split("{fields_as_code}")
+        yield header.format(**kwargs)
+
+        # iterator of fields can be consumed only once, so consumed fields
+        # are kept
+        fields, self.fields = self.fields, []
+        for field in fields:
+            if self.fields:
+                yield LINESEP
+            self.fields.append(field)
+            yield self._get_field_as_code(field)
+        if not self.fields:
+            yield "    pass" + LINESEP
+
+        yield footer.format(**kwargs)
 
     def _get_fields_as_code(self) -> str:
-        single_line = "    {name} = ({by_as_code}, u'{selector}') # {comment}"
-        lines = [
-            single_line.format(
-                name=field.name,
-                by_as_code=get_by_as_code_str(field.by),
-                selector=field.selector.replace("'", "\\'"),
-                comment=f"location: {field.location} dimensions: {field.dimensions}",
-            )
-            for field in self.fields
-        ]
+        return LINESEP.join(self._get_field_as_code(field) for field in self.fields)
 
-        return LINESEP.join(lines)
+    @staticmethod
+    def _get_field_as_code(field: PageObjectClassField) -> str:
+        single_line = "    {name} = ({by_as_code}, u'{selector}') # {comment}"
+        return single_line.format(
+            name=field.name,
+            by_as_code=get_by_as_code_str(field.by),
+            selector=field.selector.replace("'", "\\'"),
+            comment=f"location: {field.location} dimensions: {field.dimensions}",
+        )
 
     @classmethod
     def parse_string_to_po_class(
@@ -221,3 +244,44 @@ class {name}(BasePageObject):
     def __str__(self) -> None:
         """Return a string representation of the object."""
         return f"PageObjectClass({self.__dict__})"
+
+
+class PageObjectClassDiff:
+    """Difference between saved page object class and current page."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.kept = []
+        self.moved = []
+        self.removed = []
+        self.added = []
+
+    def has_changes(self) -> bool:
+        """Return True if any field was moved, removed or added."""
+        return bool(self.moved or self.removed or self.added)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the object."""
+        return (
+            f"PageObjectClassDiff(kept={len(self.kept)}, moved={len(self.moved)}, "
+            f"removed={len(self.removed)}, added={len(self.added)})"
+        )
+
+    def __str__(self) -> str:
+        """Return report with a line for every changed field."""
+        lines = [repr(self)]
+        lines += [
+            f"~ {new.name}: location {old.location} -> {new.location}, "
+            f"dimensions {old.dimensions} -> {new.dimensions}"
+            for old, new in self.moved
+        ]
+        lines += [
+            f"- {field.name} = ({get_by_as_code_str(field.by)}, '{field.selector}'): "
+            f"{reason}"
+            for field, reason in self.removed
+        ]
+        lines += [
+            f"+ {field.name} = ({get_by_as_code_str(field.by)}, '{field.selector}')"
+            for field in self.added
+        ]
+        return LINESEP.join(lines)
@@ -2,25 +2,36 @@
 from __future__ import annotations
 
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Callable
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webelement import WebElement
-from wx import Point, Rect
 
+from easelenium.browser import Browser
 from easelenium.ui.file_utils import check_if_path_exists, read_file
+from easelenium.ui.generator.geometry import check_areas, get_inside_mask
+from easelenium.ui.generator.name_allocator import NameAllocator
 from easelenium.ui.generator.page_object_class import (
     PageObjectClass,
+    PageObjectClassDiff,
     PageObjectClassField,
 )
+from easelenium.ui.generator.uniqueness_oracle import UniquenessOracle
 from easelenium.ui.root_folder import RootFolder
-from easelenium.utils import get_py_file_name_from_class_name
+from easelenium.utils import (
+    get_js_script,
+    get_py_file_name_from_class_name,
+    get_selenium_atom,
+)
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from loguru import Logger
 
-    from easelenium.browser import Browser, TypeElement
+    from easelenium.browser import TypeElement
     from easelenium.ui.utils import TypeArea, TypeBy, TypePoint
 
 # TODO: when generating link_text - escape new lines  # noqa: TD003, TD002, FIX002
@@ -39,11 +50,49 @@ class PageObjectGenerator:
         "frame, iframe, .btn",
     )
     FRAMES_SELECTOR = (By.CSS_SELECTOR, "frame, iframe")
+    BAD_ELEMENT_TAGS = ("option", "script")
+    IS_DISPLAYED_JS = get_selenium_atom("isDisplayed")
+    CSS_CHAIN_JS = read_file(str(Path(__file__).parent / "css_chain.js"))
+    GET_SELECTOR_CANDIDATES_USING_JS = (
+        f"var isDisplayed = {IS_DISPLAYED_JS};\n"
+        + get_js_script("get_text.js")
+        + CSS_CHAIN_JS
+        + read_file(str(Path(__file__).parent / "selector_candidates.js"))
+    )
+    SCAN_PAGE_USING_JS = (
+        f"var getXPath = function() {{{GET_XPATH_USING_JS}}};\n"
+        f"var isDisplayed = {IS_DISPLAYED_JS};\n"
+        + get_js_script("get_text.js")
+        + CSS_CHAIN_JS
+        + read_file(str(Path(__file__).parent / "scan_page.js"))
+    )
+    VALIDATE_SELECTORS_USING_JS = get_js_script(
+        "find_elements.js",
+    ) + read_file(str(Path(__file__).parent / "validate_selectors.js"))
 
-    def __init__(self, browser: Browser, logger: Logger = None) -> None:
-        """Initialize."""
+    def __init__(
+        self,
+        browser: Browser,
+        logger: Logger = None,
+        *,
+        use_js_scan: bool = False,
+        browser_factory: Callable[[], Browser] | None = None,
+    ) -> None:
+        """
+        Initialize.
+
+        If `use_js_scan` is True then page is scanned with single injected
+        javascript call instead of querying every element separately.
+        `browser_factory` creates worker browsers for parallel frames scan,
+        by default browser is started with the same arguments and window size
+        as `browser` has.
+        """
         self.browser = browser
         self.logger = logger
+        self.use_js_scan = use_js_scan
+        self.browser_factory = browser_factory or self.__create_worker_browser
+        self.__scan_oracle = None
+        self.__selector_candidates = {}
 
     def __log(self, *msgs: list[str]) -> None:
         if self.logger:
@@ -66,57 +115,142 @@ class PageObjectGenerator:
             name = "BAD_NAME"
         return name
 
-    def __is_correct_element(
+    def __get_correct_elements_mask(
         self,
-        element: TypeElement,
-        area: TypeArea,
-        location_offset: TypePoint,
-    ) -> bool:
-        bad_element_tags = ("option", "script")
-
-        if area:
-            if type(area) not in (tuple, list) or len(area) != 4:  # noqa: PLR2004
-                msg = f"Bad area data '{area}'"
-                raise ValueError(msg)
-            area = Rect(*area)
-            x, y = self.browser.get_location(element)
-            if location_offset:
-                # fixing location because it is located inside frame
-                x += location_offset[0]
-                y += location_offset[1]
-            w, h = self.browser.get_dimensions(element)
-            element_center = Point(int(x + w / 2), int(y + h / 2))
-            is_element_inside = area.Contains(element_center)
-        else:
-            is_element_inside = True
-
-        return (
-            self.browser.is_visible(element)
-            and element.tag_name not in bad_element_tags
-            and is_element_inside
+        properties: list[dict[str, Any]],
+        area: TypeArea | None,
+        location_offset: TypePoint | None,
+        regions: list[TypeArea] | None = None,
+    ) -> list[bool]:
+        # area is checked for all elements at once before any selector is
+        # requested, so elements outside of area cost nothing more
+        rects = (props["rect"] for props in properties)
+        inside_mask = get_inside_mask(
+            ((round(r["x"]), round(r["y"]), r["width"], r["height"]) for r in rects),
+            area,
+            regions,
+            location_offset,
         )
+        return [
+            props["displayed"]
+            and props["tag_name"] not in self.BAD_ELEMENT_TAGS
+            and is_inside
+            for props, is_inside in zip(properties, inside_mask)
+        ]
 
     def __get_po_fields_from_page(
         self,
         area: TypeArea,
         location_offset: TypePoint | None = None,
-    ) -> list[PageObjectClassField]:
-        fields = []
+        regions: list[TypeArea] | None = None,
+    ) -> Iterator[PageObjectClassField]:
+        if self.use_js_scan:
+            yield from self.__get_po_fields_from_scan(area, location_offset, regions)
+            return
+
         elements = self.browser.find_elements(self.ELEMENTS_SELECTOR)
+        # geometry is requested once per element together with the rest of
+        # properties which are needed to filter elements
+        properties = self.browser.get_properties(
+            elements,
+            ["tag_name", "displayed", "rect"],
+        )
+        correct_mask = self.__get_correct_elements_mask(
+            properties,
+            area,
+            location_offset,
+            regions,
+        )
+        # counts are valid only for current document so they are kept
+        # only during scan
+        self.__scan_oracle = UniquenessOracle(self.browser)
+        try:
+            self.__prefetch_selectors(
+                [e for e, is_correct in zip(elements, correct_mask) if is_correct],
+            )
+            yield from self.__get_po_fields_from_elements(
+                elements,
+                properties,
+                correct_mask,
+                location_offset,
+            )
+        finally:
+            self.__scan_oracle = None
+            self.__selector_candidates = {}
+
+    def __prefetch_selectors(self, elements: list[WebElement]) -> None:
+        if not elements:
+            return
+
+        by_and_selectors = []
+        candidates = self.browser.execute_js(
+            self.GET_SELECTOR_CANDIDATES_USING_JS,
+            elements,
+        )
+        for element, candidate in zip(elements, candidates):
+            self.__selector_candidates[element.id] = candidate
+
+            if candidate["id"]:
+                by_and_selectors.append((By.ID, candidate["id"]))
+            if len(candidate["text"]) > 1:
+                by_and_selectors.append((By.LINK_TEXT, candidate["text"]))
+            if candidate["class"] and " " not in candidate["class"]:
+                by_and_selectors.append((By.CLASS_NAME, candidate["class"]))
+            by_and_selectors += [
+                (By.CSS_SELECTOR, selector) for selector in candidate["css_chain"]
+            ]
+
+        self.__scan_oracle.prefetch(by_and_selectors)
+
+    def _get_uniqueness_oracle(self) -> UniquenessOracle:
+        return self.__scan_oracle or UniquenessOracle(self.browser)
+
+    def __get_selector_candidate(self, element: TypeElement) -> dict[str, Any]:
+        # id, class, text and css chain of element, text is the same as
+        # WebElement.text, candidates of scanned elements are prefetched
+        element = self.browser.find_element(element)
+        candidate = self.__selector_candidates.get(element.id)
+        if candidate is None:
+            candidate = self.browser.execute_js(
+                self.GET_SELECTOR_CANDIDATES_USING_JS,
+                [element],
+            )[0]
+        return candidate
+
+    def __get_po_fields_from_elements(
+        self,
+        elements: list[WebElement],
+        properties: list[dict[str, Any]],
+        correct_mask: list[bool],
+        location_offset: TypePoint | None,
+    ) -> Iterator[PageObjectClassField]:
+        fields_count = 0
         i = 1
         log_prefix = " " * 10
-        for e in elements:
+        # all elements are described with single browser call
+        descriptions = (
+            self.browser.describe_elements(elements)
+            if self.logger
+            else [None] * len(elements)
+        )
+        for e, description, props, is_correct in zip(
+            elements,
+            descriptions,
+            properties,
+            correct_mask,
+        ):
             if self.logger:
                 self.__log(
                     "%5d/%d Trying to get PageObjectField for element %s"
-                    % (i, len(elements), self.browser.to_string(e)),
+                    % (i, len(elements), description),
                 )
 
-            if self.__is_correct_element(e, area, location_offset):
-                field = self.__get_pageobject_field(e, location_offset)
+            if is_correct:
+                field = self.__get_pageobject_field(e, props, location_offset)
                 if field:
                     self.__log(log_prefix, "PageObjectField:", field)
-                    fields.append(field)
+                    fields_count += 1
+                    yield field
                 else:
                     self.__log(log_prefix, "Failed to unique selector")
             else:
@@ -126,62 +260,257 @@ class PageObjectGenerator:
                 )
             i += 1
 
-        self.__log("Number of fields:", len(fields))
-        return fields
+        self.__log("Number of fields:", fields_count)
 
-    def get_all_po_fields(
+    def __get_po_fields_from_scan(
+        self,
+        area: TypeArea,
+        location_offset: TypePoint | None = None,
+        regions: list[TypeArea] | None = None,
+    ) -> Iterator[PageObjectClassField]:
+        check_areas(area, regions)
+        fields_count = 0
+        # elements outside of area and regions are skipped by the script
+        scanned = self.browser.execute_js(
+            self.SCAN_PAGE_USING_JS,
+            self.ELEMENTS_SELECTOR[1],
+            list(self.BAD_ELEMENT_TAGS),
+            list(area) if area else None,
+            [list(region) for region in regions] if regions else None,
+            list(location_offset) if location_offset else None,
+        )
+        log_prefix = " " * 10
+        for i, item in enumerate(scanned, start=1):
+            self.__log(
+                "%5d/%d Trying to get PageObjectField for element %s"
+                % (i, len(scanned), self.__scanned_item_to_string(item)),
+            )
+
+            rect = item["rect"]
+            location = (round(rect["x"]), round(rect["y"]))
+            dimensions = (rect["width"], rect["height"])
+            if not item["displayed"]:
+                self.__log(
+                    log_prefix,
+                    "Skipped - element is not supported/visible",
+                )
+                continue
+
+            by_and_selector = next(
+                ((by, selector) for by, selector, uniq in item["selectors"] if uniq),
+                None,
+            )
+            if by_and_selector:
+                field = self.__create_field(
+                    by_and_selector,
+                    item["tag"],
+                    location,
+                    dimensions,
+                    location_offset,
+                )
+                self.__log(log_prefix, "PageObjectField:", field)
+                fields_count += 1
+                yield field
+            else:
+                self.__log(log_prefix, "Failed to unique selector")
+
+        self.__log("Number of fields:", fields_count)
+
+    @staticmethod
+    def __scanned_item_to_string(item: dict) -> str:
+        string = "tag_name: '%s'" % item["tag"]
+        for key in ("id", "class", "text"):
+            if item[key]:
+                string += f", {key}: '{item[key]}'"
+        return "Element {%s}" % string
+
+    def __create_worker_browser(self) -> Browser:
+        kwargs = self.browser.get_init_kwargs()
+        kwargs["maximize"] = False
+        browser = Browser(**kwargs)
+        browser.set_window_size(*self.browser.get_window_size())
+        return browser
+
+    def __get_po_fields_from_frames_in_worker(
+        self,
+        url: str,
+        area: TypeArea | None,
+        frames_offsets: list[tuple[int, TypePoint]],
+        regions: list[TypeArea] | None = None,
+    ) -> list[tuple[int, list[PageObjectClassField]]]:
+        browser = self.browser_factory()
+        try:
+            browser.get(url)
+            generator = PageObjectGenerator(
+                browser,
+                self.logger,
+                use_js_scan=self.use_js_scan,
+            )
+            results = []
+            for index, location_offset in frames_offsets:
+                browser.switch_to_default_content()
+                frames = browser.find_elements(self.FRAMES_SELECTOR)
+                if index >= len(frames):
+                    self.__log("Frame", index, "was not found in worker browser")
+                    continue
+
+                self.__log("Getting fields for frame", index, "in worker browser")
+                browser.switch_to_frame(frames[index])
+                results.append(
+                    (
+                        index,
+                        list(
+                            generator.__get_po_fields_from_page(
+                                area,
+                                location_offset,
+                                regions,
+                            ),
+                        ),
+                    ),
+                )
+            return results
+        finally:
+            browser.quit()
+
+    def __get_po_fields_from_frames_in_parallel(
+        self,
+        url: str,
+        area: TypeArea | None,
+        frames_offsets: list[TypePoint],
+        workers: int,
+        regions: list[TypeArea] | None = None,
+    ) -> Iterator[PageObjectClassField]:
+        workers = min(workers, len(frames_offsets))
+        indexed_offsets = list(enumerate(frames_offsets))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(
+                    self.__get_po_fields_from_frames_in_worker,
+                    url,
+                    area,
+                    indexed_offsets[i::workers],
+                    regions,
+                )
+                for i in range(workers)
+            ]
+            results = sorted(
+                (result for future in futures for result in future.result()),
+                key=lambda result: result[0],
+            )
+
+        known_fields = set()
+        for _, frame_fields in results:
+            for field in frame_fields:
+                key = (field.by, field.selector, tuple(field.location))
+                if key not in known_fields:
+                    known_fields.add(key)
+                    yield field
+
+    def iter_po_fields(
         self,
         url: str,
         area: TypeArea | None = None,
-    ) -> list[PageObjectClassField]:
-        """Get all PO fields for page."""
+        *,
+        frame_workers: int = 0,
+    ) -> Iterator[PageObjectClassField]:
+        """
+        Yield PO fields for page as soon as they are found.
+
+        Fields of main content are yielded first and then fields of frames.
+        Names are made unique on the fly, so yielded field keeps its name.
+        Browser is switched between frames while fields are yielded, so it
+        should not be used until iteration is finished.
+        If `frame_workers` is set then frames are scanned concurrently by
+        that many worker browsers which open same url.
+        """
         if self.browser.get_current_url() != url:
             self.browser.get(url)
 
-        fields = []
+        names = NameAllocator()
+        fields_count = 0
+        for field in self.__iter_po_fields_from_documents(url, area, frame_workers):
+            field.name = names.allocate(field.name)
+            fields_count += 1
+            yield field
+
+        self.__log("Total number of fields:", fields_count)
+
+    def __iter_po_fields_from_documents(
+        self,
+        url: str,
+        area: TypeArea | None,
+        frame_workers: int,
+        regions: list[TypeArea] | None = None,
+    ) -> Iterator[PageObjectClassField]:
+        # if regions are passed then only elements inside any of them are checked
         self.browser.switch_to_default_content()
         self.__log("Getting fields for main content")
-        fields += self.__get_po_fields_from_page(area)
+        yield from self.__get_po_fields_from_page(area, regions=regions)
 
-        for frame in self.browser.find_elements(self.FRAMES_SELECTOR):
+        self.browser.switch_to_default_content()
+        frames = self.browser.find_elements(self.FRAMES_SELECTOR)
+        frames_offsets = [(x, y) for x, y, _, _ in self.browser.get_rects(frames)]
+        if frame_workers and frames:
+            self.__log("Getting fields for", len(frames), "frames in parallel")
+            yield from self.__get_po_fields_from_frames_in_parallel(
+                url,
+                area,
+                frames_offsets,
+                frame_workers,
+                regions,
+            )
+            return
+
+        descriptions = (
+            self.browser.describe_elements(frames)
+            if self.logger
+            else [None] * len(frames)
+        )
+        for frame, description, location_offset in zip(
+            frames,
+            descriptions,
+            frames_offsets,
+        ):
             self.browser.switch_to_default_content()
-            location_offset = self.browser.get_location(frame)
 
             if self.logger:
-                self.__log(
-                    "Getting fields for frame",
-                    self.browser.to_string(frame),
-                )
+                self.__log("Getting fields for frame", description)
 
             self.browser.switch_to_frame(frame)
 
-            fields += self.__get_po_fields_from_page(area, location_offset)
-
-        self.__log("Total number of fields:", len(fields))
+            yield from self.__get_po_fields_from_page(area, location_offset, regions)
 
-        names = []
-        for field in fields:
-            if field.name in names:
-                uniq_name = False
-                i = 0
-                while not uniq_name:
-                    new_name = "_".join([field.name, str(i)])
-                    if new_name not in names:
-                        uniq_name = True
-                        field.name = new_name
-                    i += 1
-            names.append(field.name)
+    def get_all_po_fields(
+        self,
+        url: str,
+        area: TypeArea | None = None,
+        *,
+        frame_workers: int = 0,
+    ) -> list[PageObjectClassField]:
+        """
+        Get all PO fields for page.
 
-        return fields
+        If `frame_workers` is set then frames are scanned concurrently by
+        that many worker browsers which open same url.
+        """
+        return list(self.iter_po_fields(url, area, frame_workers=frame_workers))
 
-    def get_po_class_for_url(
+    def get_po_class_for_url(  # noqa: PLR0913
         self,
         url: str,
         class_name: str,
         folder_path: str,
         area: TypeArea | None = None,
+        *,
+        frame_workers: int = 0,
+        stream: bool = False,
     ) -> PageObjectClass:
-        """Get PageObjectClass for url."""
+        """
+        Get PageObjectClass for url.
+
+        If `stream` is True then fields of returned class are not collected
+        yet, they are found while `PageObjectClass.save` writes them to file.
+        """
         po_folder = str(Path(folder_path) / RootFolder.PO_FOLDER)
         img_folder = str(
             Path(folder_path) / RootFolder.PO_FOLDER / PageObjectClass.IMAGE_FOLDER,
@@ -191,8 +520,16 @@ class PageObjectGenerator:
         self.__log(
             f"Generating PageObjectClass for url {url} with area {area}",
         )
-        fields = self.get_all_po_fields(url, area)
-        img_as_png = self.browser.get_screenshot_as_png()
+        if stream:
+            # screenshot is taken first because browser is busy while fields
+            # are saved
+            if self.browser.get_current_url() != url:
+                self.browser.get(url)
+            img_as_png = self.browser.get_screenshot_as_png()
+            fields = self.iter_po_fields(url, area, frame_workers=frame_workers)
+        else:
+            fields = self.get_all_po_fields(url, area, frame_workers=frame_workers)
+            img_as_png = self.browser.get_screenshot_as_png()
 
         filename = get_py_file_name_from_class_name(class_name)
         file_path = str(Path(po_folder) / filename)
@@ -210,37 +547,212 @@ class PageObjectGenerator:
             img_as_png,
         )
 
+    def update_po_class(
+        self,
+        po_class: PageObjectClass,
+        *,
+        tolerance: int = 10,
+        frame_workers: int = 0,
+    ) -> tuple[PageObjectClass, PageObjectClassDiff]:
+        """
+        Update existing PageObjectClass for changed page.
+
+        `po_class` is usually loaded by PageObjectClass.parse_string_to_po_class.
+        Selectors of all fields are checked with single browser call, field is
+        kept if its selector still finds single element and the element moved
+        or resized by no more than `tolerance` pixels. Only regions of fields
+        which moved or were not found are scanned again, new elements outside
+        of them are not added. Fields of frames are not found in main content,
+        so frames are scanned in their regions. Return updated class and its
+        diff with `po_class`.
+        """
+        url = po_class.url
+        if self.browser.get_current_url() != url:
+            self.browser.get(url)
+        self.browser.switch_to_default_content()
+        self.__log(f"Updating PageObjectClass {po_class.name} for url {url}")
+
+        old_fields = list(po_class.fields)
+        current_fields, removed_fields, regions = self.__check_po_fields(
+            old_fields,
+            tolerance,
+        )
+
+        added_fields = []
+        if regions:
+            self.__log("Scanning", len(regions), "changed regions")
+            names = NameAllocator(field.name for field in old_fields)
+            known_selectors = {(f.by, f.selector) for f in current_fields.values()}
+            for field in self.__iter_po_fields_from_documents(
+                url,
+                po_class.area,
+                frame_workers,
+                regions,
+            ):
+                key = (field.by, field.selector)
+                if key in known_selectors:
+                    continue
+                known_selectors.add(key)
+
+                if key in removed_fields:
+                    # field is inside frame or was hidden during check
+                    old_field, _ = removed_fields.pop(key)
+                    field.name = old_field.name
+                    current_fields[field.name] = field
+                else:
+                    field.name = names.allocate(field.name)
+                    added_fields.append(field)
+            self.browser.switch_to_default_content()
+
+        diff = PageObjectClassDiff()
+        fields = []
+        for old_field in old_fields:
+            field = current_fields.get(old_field.name)
+            if field is None:
+                continue
+            fields.append(field)
+            if self.__is_same_rect(old_field, field, tolerance):
+                diff.kept.append(field)
+            else:
+                diff.moved.append((old_field, field))
+        diff.removed = list(removed_fields.values())
+        diff.added = added_fields
+        fields += added_fields
+        self.__log("PageObjectClass changes:", diff)
+
+        return (
+            PageObjectClass(
+                po_class.name,
+                url,
+                fields,
+                po_class.area,
+                po_class.file_path,
+                po_class.img_path,
+                self.browser.get_screenshot_as_png(),
+            ),
+            diff,
+        )
+
+    def __check_po_fields(
+        self,
+        fields: list[PageObjectClassField],
+        tolerance: int,
+    ) -> tuple[
+        dict[str, PageObjectClassField],
+        dict[TypeBy, tuple[PageObjectClassField, str]],
+        list[TypeArea],
+    ]:
+        """
+        Check selectors of all fields with single browser call.
+
+        Return fields with current location and dimensions by name, removed
+        fields with reason by selector and regions which should be scanned.
+        """
+        checks = (
+            self.browser.execute_js(
+                self.VALIDATE_SELECTORS_USING_JS,
+                [[field.by, field.selector] for field in fields],
+            )
+            if fields
+            else []
+        )
+        current_fields = {}
+        removed_fields = {}
+        regions = []
+        for field, check in zip(fields, checks):
+            if check["count"] != 1:
+                reason = {-1: "invalid selector", 0: "not found"}.get(
+                    check["count"],
+                    f"found {check['count']} elements",
+                )
+                removed_fields[field.by, field.selector] = (field, reason)
+                regions.append(self.__get_region(field, tolerance))
+                continue
+
+            rect = check["rect"]
+            current_field = PageObjectClassField(
+                field.name,
+                field.by,
+                field.selector,
+                (round(rect["x"]), round(rect["y"])),
+                (rect["width"], rect["height"]),
+            )
+            current_fields[field.name] = current_field
+            if not self.__is_same_rect(field, current_field, tolerance):
+                regions.append(self.__get_region(field, tolerance))
+                regions.append(self.__get_region(current_field, tolerance))
+
+        return current_fields, removed_fields, regions
+
+    @staticmethod
+    def __get_region(field: PageObjectClassField, padding: int) -> TypeArea:
+        x, y = field.location
+        w, h = field.dimensions
+        return (
+            int(x - padding),
+            int(y - padding),
+            int(w + 2 * padding),
+            int(h + 2 * padding),
+        )
+
+    @staticmethod
+    def __is_same_rect(
+        field: PageObjectClassField,
+        other: PageObjectClassField,
+        tolerance: int,
+    ) -> bool:
+        return all(
+            abs(a - b) <= tolerance
+            for a, b in zip(
+                (*field.location, *field.dimensions),
+                (*other.location, *other.dimensions),
+            )
+        )
+
     def __get_pageobject_field(
         self,
         element: TypeElement,
+        properties: dict[str, Any],
         location_offset: TypePoint,
     ) -> PageObjectClassField | None:
         by_and_selector = self._get_selector(element)
         if by_and_selector:
-            by, selector = by_and_selector
-
-            name = self._get_name_for_field(by_and_selector)
-            is_frame = self.browser.find_element(element).tag_name in [
-                "frame",
-                "iframe",
-            ]
-            if is_frame:
-                name = "FRAME_" + name
-            name_starts_with_number = re.match(r"^\d+.+$", name)
-            if name_starts_with_number:
-                name = "N" + name
-
-            location = self.browser.get_location(element)
-            if location_offset:
-                # fix location because it is inside frame
-                location = (
-                    location[0] + location_offset[0],
-                    location[1] + location_offset[1],
-                )
-            dimensions = self.browser.get_dimensions(element)
-            return PageObjectClassField(name, by, selector, location, dimensions)
+            rect = properties["rect"]
+            return self.__create_field(
+                by_and_selector,
+                properties["tag_name"],
+                (round(rect["x"]), round(rect["y"])),
+                (rect["width"], rect["height"]),
+                location_offset,
+            )
         return None
 
+    def __create_field(  # noqa: PLR0913
+        self,
+        by_and_selector: TypeBy,
+        tag_name: str,
+        location: TypePoint,
+        dimensions: tuple[int | float, int | float],
+        location_offset: TypePoint | None,
+    ) -> PageObjectClassField:
+        by, selector = by_and_selector
+
+        name = self._get_name_for_field(by_and_selector)
+        is_frame = tag_name in ["frame", "iframe"]
+        if is_frame:
+            name = "FRAME_" + name
+        name_starts_with_number = re.match(r"^\d+.+$", name)
+        if name_starts_with_number:
+            name = "N" + name
+
+        if location_offset:
+            # fix location because it is inside frame
+            location = (
+                location[0] + location_offset[0],
+                location[1] + location_offset[1],
+            )
+        return PageObjectClassField(name, by, selector, location, dimensions)
+
     def _get_selector(self, element: TypeElement) -> TypeBy | None:
         for selector_func in (
             self._get_id_selector,
@@ -256,50 +768,31 @@ class PageObjectGenerator:
         return None
 
     def _get_id_selector(self, element: TypeElement) -> TypeBy | None:
-        _id = self.browser.get_id(element)
-        if _id and len(self.browser.find_elements(by_id=_id)) == 1:
+        _id = self.__get_selector_candidate(element)["id"]
+        if _id and self._get_uniqueness_oracle().is_unique((By.ID, _id)):
             return By.ID, _id
 
         return None
 
     def _get_css_selector(self, element: TypeElement) -> TypeBy | None:
         """
-        Recursively tries to find unique CSS selector for given element.
+        Try to find unique CSS selector for given element.
 
         Goes up through DOM tree until HTML or BODY tag is found. If
         doesn't find unique selector returns None.
 
         """
-        element = self.browser.find_element(element)
-        cur_css_selector = ""
-        _id = element.get_attribute("id").strip()
-
-        if _id:
-            cur_css_selector += "#%s" % _id
-        else:
-            class_name = element.get_attribute("class").strip()
-
-            if class_name:
-                class_name = re.sub(r"\s+", ".", class_name)
-                cur_css_selector += ".%s" % class_name
-
-        cur_css_selector = cur_css_selector.replace(":", r"\:")
-        cur_el_tag = element.tag_name
-        if cur_el_tag in ("body", "html") or len(cur_css_selector) == 0:
-            return None
-
-        by_and_css_selector = By.CSS_SELECTOR, cur_css_selector
-        elements_count = self.browser.get_elements_count(by_and_css_selector)
-        if elements_count == 1:
-            return by_and_css_selector
-
-        parent = self.browser.get_parent(element)
-        css_parent_selector = self._get_css_selector(parent)
-        if css_parent_selector:
-            new_css_selector = " > ".join(
-                (css_parent_selector[1], cur_css_selector),
-            )
-            return By.CSS_SELECTOR, new_css_selector
+        chain = self.__get_selector_candidate(element)["css_chain"]
+
+        oracle = self._get_uniqueness_oracle()
+        oracle.prefetch([(By.CSS_SELECTOR, selector) for selector in chain])
+        for i, selector in enumerate(chain):
+            elements_count = oracle.count((By.CSS_SELECTOR, selector))
+            if elements_count == 1:
+                return By.CSS_SELECTOR, " > ".join(reversed(chain[: i + 1]))
+            if elements_count < 0:
+                # invalid selector
+                return None
 
         return None
 
@@ -307,18 +800,20 @@ class PageObjectGenerator:
         return By.XPATH, self.browser.execute_js(self.GET_XPATH_USING_JS, element)
 
     def _get_link_text_selector(self, element: TypeBy) -> TypeBy | None:
-        text = self.browser.get_text(element)
-        if len(self.browser.find_elements((By.LINK_TEXT, text))) == 1 and len(text) > 1:
+        text = self.__get_selector_candidate(element)["text"]
+        if len(text) > 1 and self._get_uniqueness_oracle().is_unique(
+            (By.LINK_TEXT, text),
+        ):
             return By.LINK_TEXT, text
 
         return None
 
     def _get_class_name_selector(self, element: TypeBy) -> TypeBy | None:
-        class_name = self.browser.get_class(element)
+        class_name = self.__get_selector_candidate(element)["class"]
         if (
             len(class_name) > 0
             and " " not in class_name
-            and len(self.browser.find_elements((By.CLASS_NAME, class_name))) == 1
+            and self._get_uniqueness_oracle().is_unique((By.CLASS_NAME, class_name))
         ):
             return By.CLASS_NAME, class_name
 
@@ -0,0 +1,141 @@
+// Scans current document in one round trip and returns everything
+// PageObjectGenerator needs to build PageObjectClassField objects.
+// Expects `getXPath`, `isDisplayed`, `getText` and `getCssChain` functions
+// to be defined before.
+//
+// arguments[0] - css selector of candidate elements
+// arguments[1] - list of tag names which should be skipped
+// arguments[2] - [x, y, width, height] area or null, elements which centers
+//                are outside of it are not returned
+// arguments[3] - list of areas or null, elements which centers are outside
+//                of all of them are not returned
+// arguments[4] - [x, y] offset of current frame which is added to location
+//                of elements before their centers are checked
+
+var BY_ID = "id";
+var BY_LINK_TEXT = "link text";
+var BY_CLASS_NAME = "class name";
+var BY_CSS_SELECTOR = "css selector";
+var BY_XPATH = "xpath";
+
+var candidatesSelector = arguments[0];
+var badTags = arguments[1];
+var area = arguments[2];
+var regions = arguments[3];
+var offset = arguments[4] || [0, 0];
+var counts = {};
+
+// Same check as PageObjectGenerator does with geometry.contains
+function contains(area, x, y) {
+  return (
+    area[0] <= x && x < area[0] + area[2] && area[1] <= y && y < area[1] + area[3]
+  );
+}
+
+function isInside(rect) {
+  var x = Math.trunc(Math.round(rect.x) + offset[0] + rect.width / 2);
+  var y = Math.trunc(Math.round(rect.y) + offset[1] + rect.height / 2);
+  if (area && !contains(area, x, y)) return false;
+  if (!regions || !regions.length) return true;
+  return regions.some(function (region) {
+    return contains(region, x, y);
+  });
+}
+
+function count(key, callback) {
+  if (!(key in counts)) {
+    try {
+      counts[key] = callback();
+    } catch (e) {
+      // invalid selector
+      counts[key] = -1;
+    }
+  }
+  return counts[key];
+}
+
+var linkTexts = {};
+var links = document.getElementsByTagName("a");
+for (var i = 0; i < links.length; i++) {
+  var linkText = getText(links[i]);
+  linkTexts[linkText] = (linkTexts[linkText] || 0) + 1;
+}
+
+function getIdSelector(element) {
+  var id = element.getAttribute("id") || "";
+  if (!id) return null;
+  var n = count(BY_ID + id, function () {
+    return document.querySelectorAll('[id="' + CSS.escape(id) + '"]').length;
+  });
+  return [BY_ID, id, n === 1];
+}
+
+function getLinkTextSelector(element) {
+  var text = getText(element);
+  return [BY_LINK_TEXT, text, text.length > 1 && linkTexts[text] === 1];
+}
+
+function getClassNameSelector(element) {
+  var className = element.getAttribute("class") || "";
+  if (!className || className.indexOf(" ") !== -1) return null;
+  var n = count(BY_CLASS_NAME + className, function () {
+    return document.getElementsByClassName(className).length;
+  });
+  return [BY_CLASS_NAME, className, n === 1];
+}
+
+// Same algorithm as PageObjectGenerator._get_css_selector: first unique
+// selector in chain of ancestors is joined with selectors of its descendants.
+function getCssSelector(element) {
+  var chain = getCssChain(element);
+  for (var i = 0; i < chain.length; i++) {
+    var selector = chain[i];
+    var n = count(BY_CSS_SELECTOR + selector, function () {
+      return document.querySelectorAll(selector).length;
+    });
+    if (n === 1) {
+      return [BY_CSS_SELECTOR, chain.slice(0, i + 1).reverse().join(" > "), true];
+    }
+    if (n === -1) return null;
+  }
+  return null;
+}
+
+var scanned = [];
+var elements = document.querySelectorAll(candidatesSelector);
+for (var i = 0; i < elements.length; i++) {
+  var element = elements[i];
+  var tagName = element.tagName.toLowerCase();
+  var rect = element.getBoundingClientRect();
+  var pageRect = {
+    x: rect.left + window.pageXOffset,
+    y: rect.top + window.pageYOffset,
+    width: rect.width,
+    height: rect.height,
+  };
+  if (!isInside(pageRect)) continue;
+
+  var item = {
+    tag: tagName,
+    id: element.getAttribute("id") || "",
+    class: element.getAttribute("class") || "",
+    text: getText(element),
+    rect: pageRect,
+    displayed: badTags.indexOf(tagName) === -1 && isDisplayed(element),
+    selectors: [],
+  };
+  if (item.displayed) {
+    var selectors = [
+      getIdSelector(element),
+      getLinkTextSelector(element),
+      getClassNameSelector(element),
+      getCssSelector(element),
+      [BY_XPATH, getXPath(element), true],
+    ];
+    for (var j = 0; j < selectors.length; j++) {
+      if (selectors[j]) item.selectors.push(selectors[j]);
+    }
+  }
+  scanned.push(item);
+}
+return scanned;
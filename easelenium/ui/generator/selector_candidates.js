@@ -0,0 +1,13 @@
+// Returns data needed to build selector candidates for every element.
+// Expects `getCssChain` and `getText` functions to be defined before.
+//
+// arguments[0] - list of elements
+
+return arguments[0].map(function (element) {
+  return {
+    id: element.getAttribute("id") || "",
+    class: element.getAttribute("class") || "",
+    text: getText(element),
+    css_chain: getCssChain(element),
+  };
+});
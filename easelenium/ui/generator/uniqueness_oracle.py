@@ -0,0 +1,45 @@
+"""UniquenessOracle class."""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from easelenium.browser import Browser
+    from easelenium.ui.utils import TypeBy
+
+
+class UniquenessOracle:
+    """Memoized counter of elements found by selectors in current document."""
+
+    def __init__(self, browser: Browser) -> None:
+        """Initialize."""
+        self.browser = browser
+        self.__counts = {}
+
+    def prefetch(self, by_and_selectors: list[TypeBy]) -> None:
+        """Count all not yet counted selectors with single browser call."""
+        missing = list(
+            dict.fromkeys(
+                tuple(by_and_selector)
+                for by_and_selector in by_and_selectors
+                if tuple(by_and_selector) not in self.__counts
+            ),
+        )
+        if missing:
+            counts = self.browser.get_elements_counts(missing)
+            self.__counts.update(zip(missing, counts))
+
+    def count(self, by_and_selector: TypeBy) -> int:
+        """Return number of elements found by selector, -1 if it is invalid."""
+        by_and_selector = tuple(by_and_selector)
+        if by_and_selector not in self.__counts:
+            self.prefetch([by_and_selector])
+        return self.__counts[by_and_selector]
+
+    def is_unique(self, by_and_selector: TypeBy) -> bool:
+        """Return True if selector finds exactly one element."""
+        return self.count(by_and_selector) == 1
+
+    def clear(self) -> None:
+        """Forget all counts, should be called when document is changed."""
+        self.__counts.clear()
@@ -0,0 +1,26 @@
+// Returns number of found elements and rect of the first one for every
+// [by, value] pair. Count is -1 and rect is null if selector is not valid.
+// Expects `findElements` function to be defined before.
+//
+// arguments[0] - list of [by, value] pairs
+
+return arguments[0].map(function (locator) {
+  var elements;
+  try {
+    elements = findElements(locator[0], locator[1]);
+  } catch (e) {
+    return { count: -1, rect: null };
+  }
+  if (!elements.length) return { count: 0, rect: null };
+
+  var rect = elements[0].getBoundingClientRect();
+  return {
+    count: elements.length,
+    rect: {
+      x: rect.left + window.pageXOffset,
+      y: rect.top + window.pageYOffset,
+      width: rect.width,
+      height: rect.height,
+    },
+  };
+});
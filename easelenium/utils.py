@@ -3,9 +3,11 @@ from __future__ import annotations
 
 import logging
 import os
+import pkgutil
 import re
 import sys
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from random import choice
 from typing import Any
@@ -13,6 +15,7 @@ from typing import Any
 from loguru import logger
 
 LINESEP = os.linesep
+JS_FOLDER = Path(__file__).parent / "js"
 
 
 def get_match(
@@ -53,6 +56,20 @@ def get_random_value(values: list[Any], *val_to_skip: str[Any]) -> Any:  # noqa:
     return choice(tmp_values)  # noqa: S311
 
 
+@lru_cache(maxsize=None)
+def get_js_script(*names: str) -> str:
+    """Return joined content of javascript files from 'js' folder."""
+    return LINESEP.join(
+        (JS_FOLDER / name).read_text(encoding="utf8") for name in names
+    )
+
+
+@lru_cache(maxsize=None)
+def get_selenium_atom(name: str) -> str:
+    """Return javascript function which is used by Selenium, ex. 'isDisplayed'."""
+    return pkgutil.get_data("selenium.webdriver.remote", f"{name}.js").decode("utf8")
+
+
 class Logger:
     """Logger class."""
 
@@ -89,6 +106,10 @@ class Logger:
         """Log warning message."""
         self.__logger.warning(msg, *args, **kwargs)
 
+    def opt(self, **options: dict[str, Any]) -> Any:  # noqa: ANN401
+        """Return loguru logger with options, ex. `opt(lazy=True)`."""
+        return self.__logger.opt(**options)
+
 
 def get_class_name_from_file(path: str) -> str:
     """Return class name from file."""
@@ -0,0 +1,110 @@
+"""Wait policy."""
+from __future__ import annotations
+
+from time import monotonic, sleep
+from typing import TYPE_CHECKING, Any, Callable
+
+from selenium.common.exceptions import NoSuchElementException
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+class WaitResult:
+    """Result of single wait: last value of condition and how it was obtained."""
+
+    def __init__(
+        self,
+        value: Any,  # noqa: ANN401
+        elapsed: float,
+        polls: int,
+    ) -> None:
+        """Initialize."""
+        self.value = value
+        self.elapsed = elapsed
+        self.polls = polls
+
+    @property
+    def timed_out(self) -> bool:
+        """Return True if condition was not met in time."""
+        return not self.value
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        return (
+            f"WaitResult(value={self.value!r}, elapsed={self.elapsed:.3f}, "
+            f"polls={self.polls})"
+        )
+
+
+class WaitPolicy:
+    """
+    Polling policy of waits.
+
+    Condition is checked right away, then after `initial_poll` seconds and
+    every next interval is `backoff` times longer but not longer than
+    `max_poll`. Exceptions from `ignored_exceptions` raised by condition are
+    treated as not met condition, all other exceptions are propagated.
+    """
+
+    def __init__(
+        self,
+        initial_poll: float = 0.025,
+        backoff: float = 2,
+        max_poll: float = 0.5,
+        ignored_exceptions: tuple[type[Exception], ...] = (
+            NoSuchElementException,
+        ),
+    ) -> None:
+        """Initialize."""
+        if initial_poll <= 0 or max_poll < initial_poll:
+            msg = (
+                f"Poll intervals should be 0 < initial_poll <= max_poll, "
+                f"got {initial_poll} and {max_poll}"
+            )
+            raise ValueError(msg)
+        if backoff < 1:
+            msg = f"Backoff should not be less than 1, got {backoff}"
+            raise ValueError(msg)
+
+        self.initial_poll = initial_poll
+        self.backoff = backoff
+        self.max_poll = max_poll
+        self.ignored_exceptions = tuple(ignored_exceptions)
+
+    def intervals(self) -> Iterator[float]:
+        """Yield sleep intervals between polls."""
+        interval = self.initial_poll
+        while True:
+            yield interval
+            interval = min(interval * self.backoff, self.max_poll)
+
+    def wait(self, condition: Callable[[], Any], timeout: float) -> WaitResult:
+        """Poll condition until it returns truthy value or timeout is reached."""
+        started_at = monotonic()
+        deadline = started_at + timeout
+        polls = 0
+        value = None
+        for interval in self.intervals():
+            polls += 1
+            try:
+                value = condition()
+            except self.ignored_exceptions:
+                value = None
+            if value:
+                break
+
+            remaining = deadline - monotonic()
+            if remaining <= 0:
+                break
+            sleep(min(interval, remaining))
+
+        return WaitResult(value, monotonic() - started_at, polls)
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        ignored = ", ".join(e.__name__ for e in self.ignored_exceptions)
+        return (
+            f"WaitPolicy(initial_poll={self.initial_poll}, backoff={self.backoff}, "
+            f"max_poll={self.max_poll}, ignored_exceptions=({ignored}))"
+        )
@@ -0,0 +1,78 @@
+"""Browser batch tests."""
+from __future__ import annotations
+
+import pytest
+
+from easelenium.base_test import BaseTest
+from easelenium.batch import BatchError
+from easelenium.browser import Browser
+
+PAGE = (
+    "data:text/html,"
+    "<form onsubmit=\"document.getElementById('result').innerText = "
+    "this.name.value + ' ' + this.color.value; return false;\">"
+    "<input id='name' name='name'><input id='photo' type='file'>"
+    "<select id='color' name='color'><option value='r'>Red</option>"
+    "<option value='g'>Green</option></select>"
+    "<button id='send'>Send</button></form><div id='result'></div>"
+    "<div id='hidden' style='display: none'>Hidden</div>"
+    "<div id='spaced'>Non&nbsp;breaking </div>"
+)
+
+
+@pytest.mark.skipif(not Browser.supports("gc"), reason="Browser not supported")
+class BrowserBatchTest(BaseTest):
+    """Browser batch tests."""
+
+    BROWSER_NAME = "gc"
+    LOGGER = None
+
+    def setUp(self) -> None:
+        """Set up."""
+        BaseTest.setUp(self)
+        self.browser.get(PAGE)
+        self.browser.stats.clear()
+
+    def test_form_is_filled_with_one_script(self) -> None:
+        """Check that form is filled and submitted with one script."""
+        with self.browser.batch() as batch:
+            batch.type(by_id="name", text="John")
+            batch.select_option_by_text_from_dropdown(by_id="color", text="Green")
+            batch.click(by_id="send")
+            result = batch.get_text(by_id="result")
+            value = batch.get_attribute(by_id="color", attr="value")
+
+        assert result.value == "John g"
+        assert value.value == "g"
+        assert self.browser.stats["batch_scripts"] == 1
+
+    def test_file_input_is_typed_natively(self) -> None:
+        """Check that file path is typed with WebDriver."""
+        with self.browser.batch() as batch:
+            batch.type(by_id="photo", text=__file__)
+            batch.type(by_id="name", text="John")
+
+        assert self.browser.get_attribute(by_id="photo", attr="value").endswith(
+            "browser_batch_test.py",
+        )
+        assert self.browser.stats["batch_native_steps"] == 1
+
+    def test_text_is_like_element_text(self) -> None:
+        """Check that text is the same as text of WebElement."""
+        with self.browser.batch() as batch:
+            hidden = batch.get_text(by_id="hidden", visible=False)
+            spaced = batch.get_text(by_id="spaced")
+
+        assert hidden.value == self.browser.get_text(by_id="hidden", visible=False)
+        assert spaced.value == self.browser.get_text(by_id="spaced")
+        assert spaced.value == "Non breaking"
+
+    def test_error_position(self) -> None:
+        """Check that not found element is reported with its step."""
+        batch = self.browser.batch()
+        batch.type(by_id="name", text="John")
+        batch.click(by_id="missing")
+
+        with pytest.raises(BatchError, match="step 1 click") as e:
+            batch.run()
+        assert e.value.index == 1
@@ -133,3 +133,28 @@ class ChromeTest(BrowserConstrutorTest):
             browser_name="gc",
             webdriver_kwargs={"executable_path": new_driver_path},
         )
+
+    def test_get_init_kwargs(self) -> None:
+        """Test that the same browser can be started from constructor arguments."""
+        options = webdriver.ChromeOptions()
+        options.add_argument("window-size=1366,768")
+
+        self.browser = Browser(
+            browser_name="gc",
+            headless=True,
+            timeout=3,
+            webdriver_kwargs={"options": options},
+        )
+        kwargs = self.browser.get_init_kwargs()
+        assert kwargs["headless"]
+        assert kwargs["timeout"] == 3  # noqa: PLR2004
+        assert kwargs["webdriver_kwargs"]["options"].arguments == [
+            "window-size=1366,768",
+        ]
+
+        browser = Browser(**kwargs)
+        try:
+            assert browser.execute_js("return window.chrome") is None
+            assert browser.get_window_size() == self.browser.get_window_size()
+        finally:
+            browser.quit()
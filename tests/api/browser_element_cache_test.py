@@ -0,0 +1,112 @@
+"""Browser element cache tests."""
+from __future__ import annotations
+
+import pytest
+from selenium.webdriver.common.by import By
+
+from easelenium.base_test import BaseTest
+from easelenium.browser import Browser
+from easelenium.command_executor import PooledCommandExecutor
+
+FORM = (
+    "data:text/html,"
+    "<input id='name'><button id='send' onclick=\"document.getElementById"
+    "('greeting').innerText = 'Hello ' + document.getElementById('name').value\">"
+    "Send</button><div id='greeting'>Hello</div>"
+)
+
+
+@pytest.mark.skipif(not Browser.supports("gc"), reason="Browser not supported")
+class BrowserElementCacheTest(BaseTest):
+    """Browser with element cache tests."""
+
+    BROWSER_NAME = "gc"
+    LOGGER = None
+
+    @classmethod
+    def setUpClass(cls: type[BrowserElementCacheTest]) -> None:
+        """Set up class."""
+        super().setUpClass(cache_elements=True)
+
+    def setUp(self) -> None:
+        """Set up."""
+        BaseTest.setUp(self)
+        self.browser.get("https://duckduckgo.com/")
+        self.browser.stats.clear()
+
+    def test_element_is_reused(self) -> None:
+        """Check that element is found once for repeated operations."""
+        text_field = "searchbox_input"
+
+        self.browser.wait_for_visible(by_id=text_field)
+        element = self.browser.find_element(by_id=text_field)
+        assert self.browser.find_element(by_id=text_field) == element
+        assert self.browser.stats["element_cache_hits"] > 0
+
+    def test_element_is_found_again_after_dom_change(self) -> None:
+        """Check that cached element is dropped after DOM mutation."""
+        text_field = "searchbox_input"
+
+        element = self.browser.find_element(by_id=text_field)
+        self.browser.execute_js(
+            "var e = arguments[0]; e.parentNode.replaceChild(e.cloneNode(), e);",
+            element,
+        )
+        self.browser.wait_for_visible(by_id=text_field)
+        assert self.browser.find_element(by_id=text_field) != element
+
+    def test_elements_are_dropped_after_navigation(self) -> None:
+        """Check that cached element is dropped after navigation."""
+        text_field = "searchbox_input"
+
+        element = self.browser.find_element(by_id=text_field)
+        self.browser.get("https://duckduckgo.com/")
+        assert self.browser.find_element(by_id=text_field) != element
+
+    def test_dom_changed_by_page_is_noticed(self) -> None:
+        """Check that elements added by page scripts are found."""
+        self.browser.get(FORM)
+        assert not self.browser.is_present(by_id="added")
+        self.browser.execute_js(
+            "setTimeout(function () {"
+            " var e = document.createElement('div'); e.id = 'added';"
+            " document.body.appendChild(e); }, 100);",
+        )
+        self.browser.wait_for_present(by_id="added")
+        assert self.browser.is_present(by_id="added")
+        assert self.browser.get_elements_count(by_tag="div") == 2  # noqa: PLR2004
+
+    def test_commands_are_saved(self) -> None:
+        """Check that elements in parents are found with one command."""
+
+        def count_commands(*, cache_elements: bool) -> int:
+            browser = Browser(
+                self.BROWSER_NAME,
+                headless=True,
+                cache_elements=cache_elements,
+                command_executor=PooledCommandExecutor,
+            )
+            try:
+                browser.get(FORM)
+                timings = browser.get_command_timings()
+                commands_before = sum(map(timings.get_count, timings.get_commands()))
+
+                browser.wait_for_visible(by_id="name")
+                browser.type(by_id="name", text="John")
+                browser.click(by_id="send")
+                for _ in range(3):
+                    text = browser.get_text(
+                        by_id="greeting",
+                        parent=(By.TAG_NAME, "body"),
+                    )
+                    assert text == "Hello John"
+                    assert browser.is_present(by_id="send")
+
+                commands = sum(map(timings.get_count, timings.get_commands()))
+                return commands - commands_before
+            finally:
+                browser.quit()
+
+        assert count_commands(cache_elements=True) < count_commands(
+            cache_elements=False,
+        )
@@ -0,0 +1,100 @@
+"""Browser network tracking tests."""
+from __future__ import annotations
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+from time import sleep
+
+import pytest
+
+from easelenium.base_test import BaseTest
+from easelenium.browser import Browser
+
+PAGE = b"""<html><body>
+<button id='load' onclick="fetch('/slow').then(function (r) { return r.text(); })
+  .then(function (text) { document.getElementById('result').innerText = text; })">
+Load</button>
+<button id='copy' onclick="document.getElementById('copied').innerText =
+  document.getElementById('result').innerText">Copy</button>
+<div id='result'></div><div id='copied'></div>
+</body></html>"""
+
+
+class SlowHandler(BaseHTTPRequestHandler):
+    """Handler which serves page and answers '/slow' after delay."""
+
+    def do_GET(self) -> None:
+        """Answer request."""
+        if self.path == "/slow":
+            sleep(0.5)
+            body = b"done"
+        else:
+            body = PAGE
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args: object) -> None:
+        """Don't log requests."""
+
+
+@pytest.mark.skipif(not Browser.supports("gc"), reason="Browser not supported")
+class BrowserNetworkTest(BaseTest):
+    """Browser network tracking tests."""
+
+    BROWSER_NAME = "gc"
+    LOGGER = None
+
+    @classmethod
+    def setUpClass(cls: type[BrowserNetworkTest]) -> None:
+        """Set up class."""
+        super().setUpClass(track_network=True)
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), SlowHandler)
+        cls.server.daemon_threads = True
+        Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.url = f"http://127.0.0.1:{cls.server.server_port}/"
+
+    @classmethod
+    def tearDownClass(cls: type[BrowserNetworkTest]) -> None:
+        """Tear down class."""
+        cls.server.shutdown()
+        cls.server.server_close()
+        super().tearDownClass()
+
+    def test_wait_for_network_idle(self) -> None:
+        """Check that wait is over when request is finished."""
+        self.browser.get(self.url)
+        self.browser.click(by_id="load")
+        self.browser.wait_for_network_idle(quiet_ms=100)
+
+        assert self.browser.get_text(by_id="result", visible=False) == "done"
+
+    def test_network_idle_gate(self) -> None:
+        """Check that action waits for requests started by previous action."""
+        browser = Browser(self.BROWSER_NAME, headless=True, network_idle_gate=100)
+        try:
+            browser.get(self.url)
+            browser.click(by_id="load")
+            browser.click(by_id="copy")
+            assert browser.get_text(by_id="copied") == "done"
+        finally:
+            browser.quit()
+
+    def test_network_idle_gate_timeout(self) -> None:
+        """Check that action is done when network is not quiet in gate timeout."""
+        browser = Browser(
+            self.BROWSER_NAME,
+            headless=True,
+            network_idle_gate=100,
+            network_idle_gate_timeout=0.1,
+        )
+        try:
+            browser.get(self.url)
+            browser.click(by_id="load")
+            browser.click(by_id="copy")
+            assert not browser.get_text(by_id="copied", visible=False)
+            assert browser.stats["network_idle_gate_timeouts"] == 1
+        finally:
+            browser.quit()
@@ -1,8 +1,22 @@
 """New Browser API tests."""
 import pytest
+from loguru import logger
+from selenium.common.exceptions import InvalidSelectorException, TimeoutException
+from selenium.webdriver.common.by import By
 
 from easelenium.base_test import BaseTest
 from easelenium.browser import Browser
+from easelenium.utils import Logger
+from easelenium.wait_policy import WaitPolicy
+
+HIDDEN_TEXT = (
+    "data:text/html,<div id='hidden' style='display: none'>Hidden</div>"
+    "<div id='spaced'>Non&nbsp;breaking </div>"
+)
+FRACTIONAL_BOX = (
+    "data:text/html,<div id='box' style='position: absolute; left: 10.6px; "
+    "top: 20.7px; width: 5px; height: 5px'></div>"
+)
 
 
 @pytest.mark.skipif(not Browser.supports("gc"), reason="Browser not supported")
@@ -255,3 +269,192 @@ class BrowserTest(BaseTest):
             parent=parent,
         )
         assert old_value != new_value
+
+    def test_get_elements_counts(self) -> None:
+        """Check get elements counts."""
+        self.browser.get("https://duckduckgo.com/")
+
+        locators = [
+            (By.ID, "searchbox_input"),
+            (By.TAG_NAME, "a"),
+            (By.XPATH, "//a"),
+            (By.CSS_SELECTOR, "#not_existing_element"),
+            (By.CSS_SELECTOR, "#1invalid"),
+        ]
+        counts = self.browser.get_elements_counts(locators)
+
+        assert counts[0] == 1
+        assert counts[1] == self.browser.get_elements_count(by_tag="a")
+        assert counts[2] == counts[1]
+        assert counts[3] == 0
+        assert counts[4] == -1
+
+    def test_waits_return_found_element(self) -> None:
+        """Check that waits return element which was found."""
+        self.browser.get("https://duckduckgo.com/")
+
+        text_field = "searchbox_input"
+        visible_element = self.browser.wait_for_visible(by_id=text_field)
+        present_element = self.browser.wait_for_present(by_id=text_field)
+
+        assert visible_element == self.browser.find_element(by_id=text_field)
+        assert present_element == visible_element
+        assert self.browser.wait_for_visible(visible_element) == visible_element
+
+    def test_webdriver_wait_reports_elapsed_time_and_polls(self) -> None:
+        """Check that webdriver_wait uses wait policy and reports polls."""
+        self.browser.get("https://duckduckgo.com/")
+
+        self.browser.wait_for_visible(by_id="searchbox_input")
+        assert self.browser.last_wait.polls >= 1
+        assert self.browser.last_wait.elapsed < 5  # noqa: PLR2004
+
+        policy = WaitPolicy(initial_poll=0.05, backoff=1, max_poll=0.05)
+        with pytest.raises(TimeoutException):
+            self.browser.webdriver_wait(
+                lambda driver: driver.find_element(By.ID, "not_existing_element"),
+                timeout=0.5,
+                wait_policy=policy,
+            )
+        assert self.browser.last_wait.timed_out
+        assert self.browser.last_wait.polls > 5  # noqa: PLR2004
+
+    def test_webdriver_wait_propagates_not_ignored_exceptions(self) -> None:
+        """Check that errors which are not ignored by policy are not timeouts."""
+        self.browser.get("https://duckduckgo.com/")
+
+        with pytest.raises(InvalidSelectorException):
+            self.browser.webdriver_wait(
+                lambda driver: driver.find_element(By.XPATH, "//["),
+            )
+        assert self.browser.last_wait.polls == 1
+
+    def test_cheap_element_descriptions_in_log(self) -> None:
+        """Check that elements are described by locators in cheap mode."""
+        messages = []
+        browser = Browser(
+            self.BROWSER_NAME,
+            logger=Logger(
+                name="easelenium",
+                log_to_console=False,
+                handler=messages.append,
+            ),
+            headless=True,
+            log_descriptions=Browser.DESCRIBE_CHEAP,
+        )
+        try:
+            browser.get("https://duckduckgo.com/")
+            browser.click(by_id="searchbox_input")
+        finally:
+            browser.quit()
+
+        assert any(
+            "Clicking at 'Element {By: 'id', value: 'searchbox_input'}'" in m
+            for m in messages
+        )
+
+    def test_plain_loguru_logger(self) -> None:
+        """Check that elements are described lazily with loguru logger."""
+        messages = []
+        handler_id = logger.add(messages.append, filter="easelenium")
+        browser = Browser(self.BROWSER_NAME, logger=logger, headless=True)
+        try:
+            browser.get("https://duckduckgo.com/")
+            browser.click(by_id="searchbox_input")
+        finally:
+            browser.quit()
+            logger.remove(handler_id)
+
+        assert any(
+            "Clicking at 'Element {tag_name: 'input'" in m for m in messages
+        )
+
+    def test_describe_elements(self) -> None:
+        """Check that elements are described with one call."""
+        self.browser.get("https://duckduckgo.com/")
+
+        element = self.browser.find_element(by_id="searchbox_input")
+        locator = (By.CSS_SELECTOR, "form")
+        descriptions = self.browser.describe_elements([element, locator])
+
+        assert descriptions[0].startswith("Element {tag_name: 'input'")
+        assert "id: 'searchbox_input'" in descriptions[0]
+        assert descriptions[0] == self.browser.to_string(element)
+        assert descriptions[1] == "Element {By: 'css selector', value: 'form'}"
+
+    def test_describe_hidden_element(self) -> None:
+        """Check that text of hidden element is not described like in get_text."""
+        self.browser.get(HIDDEN_TEXT)
+
+        hidden, spaced = self.browser.find_elements(by_tag="div")
+        assert self.browser.describe_elements([hidden, spaced]) == [
+            "Element {tag_name: 'div', id: 'hidden'}",
+            "Element {tag_name: 'div', id: 'spaced', text: 'Non breaking'}",
+        ]
+
+    def test_get_properties(self) -> None:
+        """Check that properties of many elements are returned at once."""
+        self.browser.get("https://duckduckgo.com/")
+
+        text_field = (By.ID, "searchbox_input")
+        element = self.browser.find_element(text_field)
+        missing = (By.ID, "not_existing_element")
+        properties = self.browser.get_properties(
+            [element, text_field, missing],
+            ["tag_name", "displayed", "attr:id", "rect", "css:display"],
+        )
+
+        assert properties[0] == properties[1]
+        assert properties[2] is None
+        assert properties[0]["tag_name"] == "input"
+        assert properties[0]["displayed"]
+        assert properties[0]["attr:id"] == "searchbox_input"
+        assert properties[0]["rect"]["width"] > 0
+
+        links = (By.TAG_NAME, "a")
+        texts = self.browser.get_elements_texts(links)
+        assert [" ".join(t.split()) for t in texts] == [
+            " ".join(e.text.split()) for e in self.browser.find_elements(links)
+        ]
+        assert self.browser.get_elements_attributes([element], "id") == [
+            "searchbox_input",
+        ]
+        assert self.browser.get_elements_locations([element]) == [
+            self.browser.get_location(element),
+        ]
+        assert self.browser.get_elements_dimensions([element]) == [
+            self.browser.get_dimensions(element),
+        ]
+
+        with pytest.raises(ValueError, match="Unsupported element property"):
+            self.browser.get_properties([element], ["attr"])
+
+    def test_get_elements_texts_of_hidden_element(self) -> None:
+        """Check that texts are the same as in get_text."""
+        self.browser.get(HIDDEN_TEXT)
+
+        elements = [(By.ID, "hidden"), (By.ID, "spaced")]
+        assert self.browser.get_elements_texts(elements) == [
+            self.browser.get_text(element, visible=False) for element in elements
+        ]
+        assert self.browser.get_elements_texts(elements) == ["", "Non breaking"]
+
+    def test_get_elements_locations_with_fractional_offset(self) -> None:
+        """Check that fractional location is rounded like in get_location."""
+        self.browser.get(FRACTIONAL_BOX)
+
+        box = (By.ID, "box")
+        assert self.browser.get_location(box) == (11, 21)
+        assert self.browser.get_elements_locations([box]) == [(11, 21)]
+        assert self.browser.get_rect(box)[:2] == (11, 21)
+        assert self.browser.get_rects([box])[0][:2] == (11, 21)
+
+    def test_get_rect(self) -> None:
+        """Check that rect is the same as location and dimensions."""
+        self.browser.get("https://duckduckgo.com/")
+
+        text_field = (By.ID, "searchbox_input")
+        x, y, width, height = self.browser.get_rect(text_field)
+        assert (x, y) == self.browser.get_location(text_field)
+        assert (width, height) == self.browser.get_dimensions(text_field)
+        assert self.browser.get_rects([text_field]) == [(x, y, width, height)]
@@ -0,0 +1,79 @@
+"""Browser stale element recovery tests."""
+from __future__ import annotations
+
+import pytest
+from selenium.common.exceptions import TimeoutException
+
+from easelenium.base_test import BaseTest
+from easelenium.browser import Browser
+
+PAGE = (
+    "data:text/html,"
+    "<div id='form'><input id='name'><button id='send'>Send</button>"
+    "<select id='color'><option value='r'>Red</option>"
+    "<option value='g'>Green</option></select></div>"
+)
+RENDER_AGAIN = (
+    "var form = document.getElementById('form');"
+    "form.parentNode.replaceChild(form.cloneNode(true), form);"
+)
+
+
+@pytest.mark.skipif(not Browser.supports("gc"), reason="Browser not supported")
+class BrowserStaleElementTest(BaseTest):
+    """Browser stale element recovery tests."""
+
+    BROWSER_NAME = "gc"
+    LOGGER = None
+
+    def setUp(self) -> None:
+        """Set up."""
+        BaseTest.setUp(self)
+        self.browser.get(PAGE)
+        self.browser.stats.clear()
+
+    def test_element_is_found_again(self) -> None:
+        """Check that stale element is found again by its locator."""
+        button = self.browser.find_element(by_id="send")
+        self.browser.execute_js(RENDER_AGAIN)
+
+        assert self.browser.get_text(button) == "Send"
+        self.browser.click(button)
+        assert self.browser.stats["stale_elements"] == 2  # noqa: PLR2004
+        assert self.browser.stats["stale_recoveries"] == 2  # noqa: PLR2004
+
+    def test_element_is_found_again_in_parent(self) -> None:
+        """Check that stale parent is found again together with element."""
+        form = self.browser.find_element(by_id="form")
+        select = self.browser.find_descendant(parent=form, by_id="color")
+        self.browser.execute_js(RENDER_AGAIN)
+
+        self.browser.type(parent=form, by_id="name", text="text")
+        self.browser.select_option_by_value_from_dropdown(select, value="g")
+        assert self.browser.get_selected_text_from_dropdown(by_id="color") == "Green"
+        assert self.browser.get_attribute(by_id="name", attr="value") == "text"
+        assert self.browser.stats["stale_recoveries"] == 2  # noqa: PLR2004
+
+    def test_removed_element_is_not_found(self) -> None:
+        """Check that removed element is reported after timeout."""
+        button = self.browser.find_element(by_id="send")
+        self.browser.execute_js("document.getElementById('send').remove();")
+
+        with pytest.raises(TimeoutException):
+            self.browser.click(button)
+        assert self.browser.stats["stale_elements"] == 1
+        assert not self.browser.stats["stale_recoveries"]
+
+    def test_origins_are_limited(self) -> None:
+        """Check that locators are kept only for recently found elements."""
+        self.browser.execute_js(
+            "for (var i = 0; i < 1500; i++) {"
+            "  document.body.appendChild(document.createElement('p'));"
+            "}",
+        )
+        paragraphs = self.browser.find_elements(by_tag="p")
+        origins = self.browser._Browser__origins
+
+        assert len(origins) == 1000  # noqa: PLR2004
+        assert paragraphs[0].id not in origins
+        assert paragraphs[-1].id in origins
@@ -0,0 +1,68 @@
+"""Browser wait engine tests."""
+from __future__ import annotations
+
+import pytest
+from selenium.common.exceptions import TimeoutException
+
+from easelenium.base_test import BaseTest
+from easelenium.browser import Browser
+
+
+@pytest.mark.skipif(not Browser.supports("gc"), reason="Browser not supported")
+class BrowserWaitInBrowserTest(BaseTest):
+    """Browser with waits which are done in the page tests."""
+
+    BROWSER_NAME = "gc"
+    LOGGER = None
+
+    @classmethod
+    def setUpClass(cls: type[BrowserWaitInBrowserTest]) -> None:
+        """Set up class."""
+        super().setUpClass(wait_engine=Browser.WAIT_IN_BROWSER)
+
+    def setUp(self) -> None:
+        """Set up."""
+        BaseTest.setUp(self)
+        self.browser.get("https://duckduckgo.com/")
+
+    def test_wait_for_visible_and_present(self) -> None:
+        """Check that waits return element."""
+        text_field = "searchbox_input"
+
+        waits = self.browser.stats["waits"]
+        element = self.browser.wait_for_visible(by_id=text_field)
+        assert element == self.browser.find_element(by_id=text_field)
+        assert self.browser.wait_for_present(by_id=text_field) == element
+        assert self.browser.stats["waits"] == waits + 2
+        assert self.browser.last_wait.polls == 1
+
+    def test_wait_for_element_added_later(self) -> None:
+        """Check wait for element which is added after wait is started."""
+        self.browser.execute_js(
+            "setTimeout(function () {"
+            "  var e = document.createElement('div');"
+            "  e.id = 'added_later'; e.textContent = 'text';"
+            "  document.body.appendChild(e);"
+            "}, 500);",
+        )
+        self.browser.wait_for_visible(by_id="added_later")
+        self.browser.execute_js(
+            "setTimeout(function () {"
+            "  document.getElementById('added_later').textContent = 'new text';"
+            "}, 500);",
+        )
+        self.browser.wait_for_text_is_changed(by_id="added_later", old_text="text")
+        self.browser.execute_js(
+            "setTimeout(function () {"
+            "  document.getElementById('added_later').remove();"
+            "}, 500);",
+        )
+        self.browser.wait_for_not_present(by_id="added_later")
+
+    def test_wait_timeout(self) -> None:
+        """Check that TimeoutException is raised."""
+        waits = self.browser.stats["waits"]
+        with pytest.raises(TimeoutException):
+            self.browser.wait_for_visible(by_id="not_existing_element", timeout=1)
+        assert self.browser.stats["waits"] == waits + 1
+        assert self.browser.last_wait.timed_out
@@ -0,0 +1,139 @@
+"""Async browser tests."""
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from time import monotonic
+from typing import Any
+from unittest.case import TestCase
+
+import pytest
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+
+from easelenium.async_browser import AsyncBrowser
+from easelenium.wait_policy import WaitPolicy
+
+
+class FakeElement:
+    """Element which is displayed after given time."""
+
+    def __init__(self, shown_at: float) -> None:
+        """Initialize."""
+        self.shown_at = shown_at
+
+    def is_displayed(self) -> bool:
+        """Return True if element is shown."""
+        return monotonic() >= self.shown_at
+
+
+class FakeBrowser:
+    """Browser with single element which records actions."""
+
+    def __init__(self, delay: float = 0) -> None:
+        """Initialize, element is shown after `delay` seconds."""
+        self.element = FakeElement(monotonic() + delay)
+        self.stats = Counter()
+        self.calls = []
+        self.wrapped_conditions = 0
+        self._driver = None
+
+    def get_timeout(self) -> float:
+        """Return timeout."""
+        return 1
+
+    def get_wait_policy(self) -> WaitPolicy:
+        """Return wait policy."""
+        return WaitPolicy(initial_poll=0.01, max_poll=0.05)
+
+    def _wait_condition(self, function: Any) -> Any:  # noqa: ANN401
+        self.wrapped_conditions += 1
+        return function
+
+    def _get_element(self, element: Any = None, **query: Any) -> Any:  # noqa: ANN401
+        return element or (By.ID, query["by_id"])
+
+    def find_elements(self, element: Any, parent: Any = None) -> list[FakeElement]:  # noqa: ANN401, ARG002
+        """Return the element."""
+        return [self.element]
+
+    def click(self, **kwargs: Any) -> None:  # noqa: ANN401
+        """Record click."""
+        self.calls.append(("click", kwargs["element"], kwargs["visible"]))
+
+    def get_title(self) -> str:
+        """Return title."""
+        return "Title"
+
+
+class AsyncBrowserTest(TestCase):
+    """AsyncBrowser tests."""
+
+    def test_methods_are_awaitable(self) -> None:
+        """Check that browser methods are run in executor."""
+        browser = FakeBrowser()
+        async_browser = AsyncBrowser(browser)
+
+        assert asyncio.run(async_browser.get_title()) == "Title"
+        assert async_browser.stats is browser.stats
+
+    def test_click_waits_for_visible_element(self) -> None:
+        """Check that found visible element is clicked without second wait."""
+        browser = FakeBrowser(delay=0.1)
+        asyncio.run(AsyncBrowser(browser).click(by_id="send"))
+
+        assert browser.calls == [("click", browser.element, False)]
+        assert browser.wrapped_conditions == 1
+        assert browser.stats["waits"] == 1
+        assert browser.stats["wait_polls"] > 1
+
+    def test_waits_do_not_hold_threads(self) -> None:
+        """Check that sessions wait at the same time in single thread."""
+        browsers = [FakeBrowser(delay=0.3) for _ in range(5)]
+
+        async def wait_for_all() -> None:
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                await asyncio.gather(
+                    *(
+                        AsyncBrowser(browser, executor).wait_for_visible(by_id="id")
+                        for browser in browsers
+                    ),
+                )
+
+        started_at = monotonic()
+        asyncio.run(wait_for_all())
+        assert monotonic() - started_at < 1  # noqa: PLR2004
+
+    def test_facade_is_created_outside_of_loop(self) -> None:
+        """Check that facade can be used in loop which is started later."""
+        async_browser = AsyncBrowser(FakeBrowser())
+
+        async def get_titles() -> list[str]:
+            return await asyncio.gather(
+                async_browser.get_title(),
+                async_browser.get_title(),
+            )
+
+        assert asyncio.run(get_titles()) == ["Title", "Title"]
+
+    def test_wait_timeout(self) -> None:
+        """Check that not visible element is reported after timeout."""
+        async_browser = AsyncBrowser(FakeBrowser(delay=10))
+
+        with pytest.raises(TimeoutException, match="is not visible"):
+            asyncio.run(async_browser.wait_for_visible(by_id="id", timeout=0.1))
+        assert async_browser.last_wait.timed_out
+
+    def test_not_ignored_exception_is_propagated(self) -> None:
+        """Check that exception which is not ignored is raised as is."""
+        async_browser = AsyncBrowser(FakeBrowser())
+
+        def fail(_driver: Any) -> None:  # noqa: ANN401
+            msg = "broken condition"
+            raise ValueError(msg)
+
+        with pytest.raises(ValueError, match="broken condition"):
+            asyncio.run(async_browser.webdriver_wait(fail))
+        assert async_browser.last_wait.polls == 1
+        assert async_browser.stats["waits"] == 1
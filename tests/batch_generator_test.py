@@ -0,0 +1,291 @@
+"""Batch generator tests."""
+from __future__ import annotations
+
+import json
+import tempfile
+from pathlib import Path
+from threading import Lock
+from typing import TYPE_CHECKING, Any
+from unittest.case import TestCase
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.by import By
+
+from easelenium.browser_pool import BrowserPool
+from easelenium.ui.generator.batch_generator import (
+    BatchGenerator,
+    GenerationTask,
+    get_class_name_from_url,
+    get_timing_report,
+    load_manifest,
+)
+from easelenium.ui.generator.page_object_class import (
+    PageObjectClass,
+    PageObjectClassField,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+class FakeBrowser:
+    """Browser which records generated urls."""
+
+    def __init__(self, **kwargs: Any) -> None:  # noqa: ANN401
+        """Initialize."""
+        self.kwargs = kwargs
+        self.logger = None
+        self.urls = []
+        self.alive = True
+        self.quit_count = 0
+
+    def is_alive(self) -> bool:
+        """Return True if session is alive."""
+        return self.alive
+
+    def close_other_windows(self) -> None:
+        """Close other windows."""
+        if not self.alive:
+            raise WebDriverException
+
+    def clear_storage(self) -> None:
+        """Clear storage."""
+
+    def delete_all_cookies(self, *, all_domains: bool = False) -> None:
+        """Delete cookies."""
+
+    def get_window_size(self) -> tuple[int, int]:
+        """Return window size."""
+        return 800, 600
+
+    def set_window_size(self, width: int, height: int) -> None:
+        """Set window size."""
+
+    def clear_state(self) -> None:
+        """Clear state."""
+
+    def get(self, url: str) -> None:
+        """Open url."""
+
+    def quit(self) -> None:  # noqa: A003
+        """Quit."""
+        self.quit_count += 1
+
+
+class FakeGenerator:
+    """Generator which creates class with single field for url."""
+
+    def __init__(self, browser: FakeBrowser) -> None:
+        """Initialize."""
+        self.browser = browser
+
+    def get_po_class_for_url(  # noqa: PLR0913
+        self,
+        url: str,
+        class_name: str,
+        folder_path: str,
+        area: tuple | None = None,
+        *,
+        stream: bool = False,
+    ) -> PageObjectClass:
+        """
+        Return class for url, fail for urls with 'broken'.
+
+        Fields of url with 'interrupted' fail while they are saved.
+        """
+        self.browser.urls.append(url)
+        if "broken" in url:
+            self.browser.alive = False
+            raise WebDriverException
+        fields = [PageObjectClassField("LOGO", By.ID, "logo", (0, 0), (5, 5))]
+        if "interrupted" in url:
+            fields = self.__fail_after(fields)
+        return PageObjectClass(
+            class_name,
+            url,
+            iter(fields) if stream else fields,
+            area,
+            str(Path(folder_path) / f"{class_name}.py"),
+            str(Path(folder_path) / "img" / f"{class_name}.png"),
+            b"png",
+        )
+
+
+    @staticmethod
+    def __fail_after(
+        fields: list[PageObjectClassField],
+    ) -> Iterator[PageObjectClassField]:
+        yield from fields
+        raise WebDriverException
+
+
+class BatchGeneratorTest(TestCase):
+    """BatchGenerator tests."""
+
+    def setUp(self) -> None:
+        """Set up."""
+        tmp_folder = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_folder.cleanup)
+        self.folder = Path(tmp_folder.name)
+        self.browsers = []
+        self.lock = Lock()
+        self.pool = BrowserPool(browser_factory=self.create_browser)
+
+    def create_browser(self, **kwargs: Any) -> FakeBrowser:  # noqa: ANN401
+        """Create and remember browser."""
+        browser = FakeBrowser(**kwargs)
+        with self.lock:
+            self.browsers.append(browser)
+        return browser
+
+    def get_generator(self, **kwargs: Any) -> BatchGenerator:  # noqa: ANN401
+        """Return generator which uses fake browsers."""
+        return BatchGenerator(
+            self.folder,
+            pool=self.pool,
+            generator_factory=FakeGenerator,
+            **kwargs,
+        )
+
+    def test_get_class_name_from_url(self) -> None:
+        """Check class name is made from host and path of url."""
+        assert (
+            get_class_name_from_url("https://www.example.com/user/login?next=1")
+            == "ExampleComUserLoginPage"
+        )
+        assert get_class_name_from_url("http://127.0.0.1:8000/") == "Page1270018000Page"
+
+    def test_load_manifest(self) -> None:
+        """Check manifest entries are urls or dicts."""
+        manifest = self.folder / "manifest.json"
+        manifest.write_text(
+            json.dumps(
+                [
+                    "https://example.com/",
+                    {
+                        "url": "https://example.com/login",
+                        "class_name": "LoginPage",
+                        "area": [0, 0, 100, 100],
+                    },
+                ],
+            ),
+            encoding="utf-8",
+        )
+        tasks = load_manifest(manifest)
+        assert [(t.url, t.class_name, t.area) for t in tasks] == [
+            ("https://example.com/", "ExampleComPage", None),
+            ("https://example.com/login", "LoginPage", (0, 0, 100, 100)),
+        ]
+
+    def test_load_yaml_manifest(self) -> None:
+        """Check manifest is loaded from YAML file."""
+        pytest.importorskip("yaml")
+        manifest = self.folder / "manifest.yaml"
+        manifest.write_text(
+            "- https://example.com/\n"
+            "- url: https://example.com/login\n"
+            "  class_name: LoginPage\n"
+            "  area: [0, 0, 100, 100]\n",
+            encoding="utf-8",
+        )
+        tasks = load_manifest(manifest)
+        assert [(t.url, t.class_name, t.area) for t in tasks] == [
+            ("https://example.com/", "ExampleComPage", None),
+            ("https://example.com/login", "LoginPage", (0, 0, 100, 100)),
+        ]
+
+    def test_bad_manifest_entry(self) -> None:
+        """Check bad manifest entries are not accepted."""
+        for entry in (
+            "example.com",
+            {"url": "https://example.com/", "class_name": "bad name"},
+            {"url": "https://example.com/", "area": [0, 0]},
+            {"url": "https://example.com/", "folder": "pages"},
+        ):
+            with pytest.raises(ValueError, match="Bad"):
+                GenerationTask.from_manifest_entry(entry)
+
+    def test_generate(self) -> None:
+        """Check classes are saved and browser sessions are reused."""
+        tasks = [GenerationTask(f"https://example.com/page{i}") for i in range(6)]
+        reported = []
+        results = self.get_generator(
+            workers=2,
+            browser_kwargs={"browser_name": "gc_headless"},
+        ).generate(tasks, on_result=reported.append)
+
+        assert [r.task for r in results] == tasks
+        assert len(reported) == len(tasks)
+        assert len(self.browsers) <= 2  # noqa: PLR2004
+        assert self.browsers[0].kwargs == {"browser_name": "gc_headless"}
+        assert sum(len(b.urls) for b in self.browsers) == len(tasks)
+        assert self.pool.stats["reused"] == len(tasks) - len(self.browsers)
+        assert not (self.folder / BatchGenerator.CHECKPOINT_FILE_NAME).exists()
+        for result in results:
+            assert result.succeeded
+            assert result.fields_count == 1
+            assert "LOGO = (By.ID, u'logo')" in Path(result.file_path).read_text(
+                encoding="utf8",
+            )
+
+    def test_generate_after_failure(self) -> None:
+        """Check failed url is reported and dead browser is replaced."""
+        tasks = [
+            GenerationTask("https://example.com/broken"),
+            GenerationTask("https://example.com/"),
+        ]
+        results = self.get_generator().generate(tasks)
+
+        assert [r.succeeded for r in results] == [False, True]
+        assert "FAILED https://example.com/broken" in str(results[0])
+        assert [b.urls for b in self.browsers] == [
+            ["https://example.com/broken"],
+            ["https://example.com/"],
+        ]
+        assert self.browsers[0].quit_count == 1
+
+    def test_interrupted_url_keeps_previous_class(self) -> None:
+        """Check that class is not overwritten by partially generated one."""
+        task = GenerationTask("https://example.com/interrupted", "Page")
+        results = self.get_generator().generate([task])
+        assert not results[0].succeeded
+        assert not list(self.folder.glob("*.py"))
+
+        file_path = self.folder / "Page.py"
+        file_path.write_text("previous", encoding="utf8")
+        results = self.get_generator().generate([task])
+        assert not results[0].succeeded
+        assert file_path.read_text(encoding="utf8") == "previous"
+        assert [p.name for p in self.folder.glob("*.py")] == ["Page.py"]
+
+    def test_resume_from_checkpoint(self) -> None:
+        """Check generated urls are not generated again after failure."""
+        tasks = [
+            GenerationTask("https://example.com/"),
+            GenerationTask("https://example.com/broken"),
+        ]
+        self.get_generator().generate(tasks)
+        assert (self.folder / BatchGenerator.CHECKPOINT_FILE_NAME).exists()
+
+        tasks[1] = GenerationTask("https://example.com/fixed", "BrokenPage")
+        results = self.get_generator().generate(tasks)
+        assert [(r.succeeded, r.resumed) for r in results] == [
+            (True, True),
+            (True, False),
+        ]
+        assert sum(len(b.urls) for b in self.browsers) == 3  # noqa: PLR2004
+        assert not (self.folder / BatchGenerator.CHECKPOINT_FILE_NAME).exists()
+
+        results = self.get_generator().generate(tasks[:1], resume=False)
+        assert not results[0].resumed
+
+    def test_timing_report(self) -> None:
+        """Check report contains counts and the slowest urls."""
+        tasks = [
+            GenerationTask("https://example.com/"),
+            GenerationTask("https://example.com/broken"),
+        ]
+        report = get_timing_report(self.get_generator().generate(tasks))
+        assert "Generated: 1, resumed: 0, failed: 1" in report
+        assert "https://example.com/broken" in report
@@ -0,0 +1,121 @@
+"""Batch tests."""
+from __future__ import annotations
+
+from collections import Counter
+from typing import Any
+from unittest.case import TestCase
+
+import pytest
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
+
+from easelenium.batch import Batch, BatchError
+
+
+class FakeBrowser:
+    """Browser which runs batch script in Python against dict of elements."""
+
+    def __init__(self, elements: dict[str, dict[str, Any]]) -> None:
+        """Initialize with elements by id, element is dict of its state."""
+        self.elements = elements
+        self.stats = Counter()
+        self.scripts = []
+        self.calls = []
+
+    def _get_element(self, element: Any = None, **query: Any) -> Any:  # noqa: ANN401
+        return element or (By.ID, query["by_id"])
+
+    def _safe_log(self, msg: str, *args: Any) -> None:  # noqa: ANN401
+        pass
+
+    def execute_js(self, _script: str, steps: list[dict[str, Any]]) -> dict[str, Any]:
+        """Run steps like batch script does."""
+        self.scripts.append([step["method"] for step in steps])
+        results = []
+        for i, step in enumerate(steps):
+            element = self.elements.get(step["element"][1])
+            if element is None:
+                return {
+                    "results": results,
+                    "stopped": {"index": i, "error": "element is not found"},
+                }
+            if step["method"] == "type" and element.get("file"):
+                return {"results": results, "stopped": {"index": i, "native": True}}
+            if step["method"] == "type":
+                element["value"] = step["args"]["text"]
+            results.append(element.get("text") if step["method"] == "get_text" else None)
+        return {"results": results, "stopped": None}
+
+    def type(self, element: Any, text: str, parent: Any) -> None:  # noqa: ANN401, A003, ARG002
+        """Type natively."""
+        self.calls.append(("type", element, text))
+        if element[1] not in self.elements:
+            raise NoSuchElementException(element[1])
+        self.elements[element[1]]["value"] = text
+
+
+class BatchTest(TestCase):
+    """Batch tests."""
+
+    def setUp(self) -> None:
+        """Set up."""
+        self.browser = FakeBrowser(
+            {
+                "name": {},
+                "photo": {"file": True},
+                "send": {},
+                "result": {"text": "Sent"},
+            },
+        )
+
+    def test_steps_are_run_with_one_script(self) -> None:
+        """Check that steps are sent together and values are set."""
+        with Batch(self.browser) as batch:
+            batch.type(by_id="name", text="John")
+            batch.click(by_id="send")
+            result = batch.get_text(by_id="result")
+
+        assert result.value == "Sent"
+        assert self.browser.elements["name"]["value"] == "John"
+        assert self.browser.scripts == [["type", "click", "get_text"]]
+        assert self.browser.stats == {"batches": 1, "batch_scripts": 1}
+
+    def test_native_steps(self) -> None:
+        """Check that steps which need trusted input are run with WebDriver."""
+        with Batch(self.browser) as batch:
+            batch.type(by_id="name", text="John")
+            batch.type(by_id="photo", text="/tmp/photo.png")  # noqa: S108
+            batch.type(by_id="name", text="Jane", native=True)
+            batch.click(by_id="send")
+
+        assert self.browser.scripts == [["type", "type"], ["click"]]
+        assert self.browser.calls == [
+            ("type", (By.ID, "photo"), "/tmp/photo.png"),  # noqa: S108
+            ("type", (By.ID, "name"), "Jane"),
+        ]
+        assert self.browser.stats["batch_native_steps"] == 2  # noqa: PLR2004
+
+    def test_error_is_mapped_to_call_site(self) -> None:
+        """Check that failed step is reported with its position and line."""
+        batch = Batch(self.browser)
+        batch.click(by_id="send")
+        step = batch.click(by_id="missing")
+        batch.click(by_id="result")
+
+        with pytest.raises(BatchError, match=r"step 1 click.* at batch_test.py:\d+") as e:
+            batch.run()
+        assert e.value.step is step
+        assert self.browser.scripts == [["click", "click", "click"]]
+
+    def test_steps_are_not_run_after_exception(self) -> None:
+        """Check that nothing is sent if `with` block failed."""
+
+        def record_and_fail() -> None:
+            with Batch(self.browser) as batch:
+                batch.click(by_id="send")
+                msg = "failed"
+                raise ValueError(msg)
+
+        with pytest.raises(ValueError, match="failed"):
+            record_and_fail()
+        assert not self.browser.scripts
@@ -0,0 +1,167 @@
+"""Browser pool tests."""
+from __future__ import annotations
+
+from typing import Any
+from unittest.case import TestCase
+
+import pytest
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+
+from easelenium.browser_pool import BrowserPool
+
+
+class FakeBrowser:
+    """Browser which records calls instead of driving real browser."""
+
+    def __init__(self, **kwargs: Any) -> None:  # noqa: ANN401
+        """Initialize."""
+        self.kwargs = kwargs
+        self.logger = kwargs.get("logger")
+        self.alive = True
+        self.fail_reset = False
+        self.calls = []
+
+    def is_alive(self) -> bool:
+        """Return True if session is alive."""
+        return self.alive
+
+    def close_other_windows(self) -> None:
+        """Close other windows."""
+        self.calls.append("close_other_windows")
+
+    def clear_storage(self) -> None:
+        """Clear storage."""
+        self.calls.append("clear_storage")
+
+    def get_window_size(self) -> tuple[int, int]:
+        """Return window size."""
+        return 800, 600
+
+    def set_window_size(self, width: int, height: int) -> None:
+        """Set window size."""
+        self.calls.append(("set_window_size", width, height))
+
+    def clear_state(self) -> None:
+        """Clear state."""
+        self.calls.append("clear_state")
+
+    def delete_all_cookies(self, *, all_domains: bool = False) -> None:
+        """Delete cookies."""
+        if self.fail_reset:
+            raise WebDriverException
+        self.calls.append(("delete_all_cookies", all_domains))
+
+    def get(self, url: str) -> None:
+        """Open url."""
+        self.calls.append(url)
+
+    def quit(self) -> None:  # noqa: A003
+        """Quit."""
+        self.calls.append("quit")
+
+
+class BrowserPoolTest(TestCase):
+    """BrowserPool tests."""
+
+    def setUp(self) -> None:
+        """Set up."""
+        self.pool = BrowserPool(max_uses=3, browser_factory=FakeBrowser)
+
+    def test_session_is_reused_after_reset(self) -> None:
+        """Check that released session is reset and handed out again."""
+        with self.pool.lease(browser_name="gc") as browser:
+            pass
+        assert browser.calls == [
+            "close_other_windows",
+            "clear_storage",
+            ("delete_all_cookies", True),
+            ("set_window_size", 800, 600),
+            "about:blank",
+            "clear_state",
+        ]
+
+        assert self.pool.acquire(browser_name="gc", logger="logger") is browser
+        assert browser.logger == "logger"
+        assert self.pool.stats == {"created": 1, "reused": 1}
+
+    def test_sessions_are_kept_by_browser_arguments(self) -> None:
+        """Check that sessions with different arguments are not mixed."""
+        with self.pool.lease(browser_name="gc") as gc_browser:
+            pass
+        with self.pool.lease(browser_name="gc", headless=True) as headless_browser:
+            pass
+        with self.pool.lease(browser_name="gc", timeout=10) as timeout_browser:
+            pass
+
+        assert len({id(gc_browser), id(headless_browser), id(timeout_browser)}) == 3  # noqa: PLR2004
+        assert self.pool.acquire(browser_name="gc") is gc_browser
+
+    def test_options_hash_ignores_arguments_added_by_browser(self) -> None:
+        """Check that options mutated by Browser produce the same key."""
+        options = webdriver.ChromeOptions()
+        options.add_argument("window-size=1366,768")
+        kwargs = {"browser_name": "gc", "webdriver_kwargs": {"options": options}}
+        key = BrowserPool.get_session_key(**kwargs)
+
+        options.add_argument("window-size=1366,768")
+        kwargs["webdriver_kwargs"]["service"] = object()
+        assert BrowserPool.get_session_key(**kwargs) == key
+
+        options.add_argument("--incognito")
+        assert BrowserPool.get_session_key(**kwargs) != key
+
+    def test_options_are_copied_before_session_is_started(self) -> None:
+        """Check that options changed by Browser don't change the key."""
+
+        def create_browser(**kwargs: Any) -> FakeBrowser:  # noqa: ANN401
+            kwargs["webdriver_kwargs"]["options"].add_argument("--headless")
+            return FakeBrowser(**kwargs)
+
+        pool = BrowserPool(browser_factory=create_browser)
+        options = webdriver.ChromeOptions()
+        options.add_argument("window-size=1366,768")
+        kwargs = {"browser_name": "gc", "webdriver_kwargs": {"options": options}}
+        with pool.lease(**kwargs) as browser:
+            pass
+
+        assert options.arguments == ["window-size=1366,768"]
+        assert pool.acquire(**kwargs) is browser
+
+    def test_session_is_retired(self) -> None:
+        """Check that session is quit after max uses or failed reset."""
+        browser = self.pool.acquire(browser_name="gc")
+        self.pool.release(browser)
+        assert self.pool.acquire(browser_name="gc") is browser
+        self.pool.release(browser)
+        assert self.pool.acquire(browser_name="gc") is browser
+        self.pool.release(browser)
+        assert browser.calls[-1] == "quit"
+
+        browser = self.pool.acquire(browser_name="gc")
+        browser.fail_reset = True
+        self.pool.release(browser)
+        assert browser.calls[-1] == "quit"
+        assert self.pool.acquire(browser_name="gc") is not browser
+
+    def test_dead_session_is_not_handed_out(self) -> None:
+        """Check that session which fails health check is replaced."""
+        with self.pool.lease(browser_name="gc") as browser:
+            pass
+        browser.alive = False
+
+        assert self.pool.acquire(browser_name="gc") is not browser
+        assert browser.calls[-1] == "quit"
+        assert self.pool.stats["health_check_failures"] == 1
+
+    def test_release_unknown_browser(self) -> None:
+        """Check that only leased browsers can be released."""
+        with pytest.raises(ValueError, match="not acquired"):
+            self.pool.release(FakeBrowser())
+
+    def test_close(self) -> None:
+        """Check that close quits idle sessions."""
+        with self.pool.lease(browser_name="gc") as browser:
+            pass
+        self.pool.close()
+        assert browser.calls[-1] == "quit"
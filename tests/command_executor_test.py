@@ -0,0 +1,146 @@
+"""Command executor tests."""
+from __future__ import annotations
+
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock, Thread
+from time import perf_counter
+from unittest.case import TestCase
+
+import pytest
+from selenium.webdriver.remote.client_config import ClientConfig
+from selenium.webdriver.remote.remote_connection import RemoteConnection
+
+from easelenium.command_executor import CommandTimings, PooledCommandExecutor
+
+
+class FakeDriverHandler(BaseHTTPRequestHandler):
+    """Handler which answers every WebDriver command with empty value."""
+
+    protocol_version = "HTTP/1.1"
+    # headers and body are separate writes, body should not wait for ACK
+    disable_nagle_algorithm = True
+
+    def setup(self) -> None:
+        """Count new connection."""
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_GET(self) -> None:
+        """Answer command."""
+        body = json.dumps({"value": None}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self) -> None:
+        """Read parameters and answer command."""
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.do_GET()
+
+    def log_message(self, *_args: object) -> None:
+        """Don't log requests."""
+
+
+class CommandExecutorTest(TestCase):
+    """PooledCommandExecutor tests against local stand-in of driver."""
+
+    def setUp(self) -> None:
+        """Start fake driver."""
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), FakeDriverHandler)
+        self.server.daemon_threads = True
+        self.server.lock = Lock()
+        self.server.connections = 0
+        Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.url = f"http://127.0.0.1:{self.server.server_port}"
+
+    def get_connection(self) -> RemoteConnection:
+        """Return connection like the one created by WebDriver."""
+        connection = RemoteConnection(client_config=ClientConfig(self.url))
+        self.addCleanup(connection.close)
+        return connection
+
+    @staticmethod
+    def run_commands(connection: RemoteConnection, count: int) -> float:
+        """Return mean duration of command."""
+        started_at = perf_counter()
+        for _ in range(count):
+            connection.execute("getTitle", {"sessionId": "1"})
+        return (perf_counter() - started_at) / count
+
+    def test_commands_are_timed(self) -> None:
+        """Check that duration of every command is recorded."""
+        executor = PooledCommandExecutor(self.get_connection())
+        self.run_commands(executor, 10)
+        executor.execute("getCurrentUrl", {"sessionId": "1"})
+
+        assert executor.timings.get_commands() == ["getTitle", "getCurrentUrl"]
+        assert executor.timings.get_count("getTitle") == 10  # noqa: PLR2004
+        assert sum(executor.timings.get_histogram("getCurrentUrl")) == 1
+        assert executor.timings.get_report().startswith("getTitle")
+
+    def test_connections_are_reused_by_threads(self) -> None:
+        """Check that threads don't open more connections than pool size."""
+        executor = PooledCommandExecutor(self.get_connection(), pool_size=2)
+        with ThreadPoolExecutor(max_workers=6) as threads:
+            list(threads.map(lambda _: self.run_commands(executor, 20), range(6)))
+
+        assert self.server.connections <= 2  # noqa: PLR2004
+        assert executor.timings.get_count("getTitle") == 120  # noqa: PLR2004
+
+    @pytest.mark.skipif(
+        not os.environ.get("EASELENIUM_BENCHMARK"),
+        reason="Benchmark is run only if EASELENIUM_BENCHMARK is set",
+    )
+    def test_benchmark_under_load(self) -> None:
+        """Compare with default connection of WebDriver used by many threads."""
+        threads, count = 8, 500
+        results = {}
+        for name, connection in (
+            ("default", self.get_connection()),
+            ("pooled", PooledCommandExecutor(self.get_connection(), pool_size=8)),
+        ):
+            self.run_commands(connection, 10)
+            self.server.connections = 0
+            with ThreadPoolExecutor(max_workers=threads) as executor:
+                durations = list(
+                    executor.map(
+                        lambda _, c=connection: self.run_commands(c, count),
+                        range(threads),
+                    ),
+                )
+            results[name] = (sum(durations) / threads, self.server.connections)
+
+        for name, (duration, connections) in results.items():
+            print(  # noqa: T201
+                f"{name}: {duration * 1000:.3f}ms per command, "
+                f"{connections} new connections",
+            )
+
+    def test_bad_pool_size(self) -> None:
+        """Check that pool can't be empty."""
+        with pytest.raises(ValueError, match="Pool size"):
+            PooledCommandExecutor(self.get_connection(), pool_size=0)
+
+
+class CommandTimingsTest(TestCase):
+    """CommandTimings tests."""
+
+    def test_percentiles(self) -> None:
+        """Check that percentile is upper bound of bucket."""
+        timings = CommandTimings()
+        for duration in (0.0005, 0.003, 0.003, 0.04, 10):
+            timings.record("click", duration)
+
+        assert timings.get_histogram("click")[:6] == [1, 0, 2, 0, 0, 1]
+        assert timings.get_histogram("click")[-1] == 1
+        assert timings.get_percentile("click", 50) == 0.005  # noqa: PLR2004
+        assert timings.get_percentile("click", 100) == float("inf")
+        assert timings.get_percentile("getTitle", 50) == 0
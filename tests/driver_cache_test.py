@@ -0,0 +1,119 @@
+"""Driver path cache tests."""
+from __future__ import annotations
+
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from time import sleep
+from unittest import mock
+from unittest.case import TestCase
+
+import pytest
+
+from easelenium import driver_cache
+from easelenium.driver_cache import DriverPathCache, lock_file
+
+
+class DriverPathCacheTest(TestCase):
+    """DriverPathCache tests."""
+
+    def setUp(self) -> None:
+        """Set up."""
+        self.folder = tempfile.TemporaryDirectory()
+        self.addCleanup(self.folder.cleanup)
+        self.cache = DriverPathCache(Path(self.folder.name) / "paths.json")
+        self.resolved = 0
+
+    def create_driver(self, name: str = "driver", mode: int = 0o755) -> str:
+        """Create fake driver file."""
+        driver_path = Path(self.folder.name) / name
+        driver_path.write_text("")
+        driver_path.chmod(mode)
+        return driver_path.as_posix()
+
+    def resolve(self) -> str:
+        """Resolve driver path and count calls."""
+        self.resolved += 1
+        sleep(0.05)
+        return self.create_driver()
+
+    def test_path_is_resolved_once(self) -> None:
+        """Check that resolved path is reused by other caches."""
+        driver_path = self.cache.get("chromedriver:118", self.resolve)
+        assert DriverPathCache(self.cache.path).get("chromedriver:118", None) == (
+            driver_path
+        )
+        assert self.resolved == 1
+
+    def test_path_is_resolved_for_new_browser_version(self) -> None:
+        """Check that keys are not mixed."""
+        self.cache.get("chromedriver:118", self.resolve)
+        self.cache.get("chromedriver:119", self.resolve)
+        assert self.resolved == 2  # noqa: PLR2004
+
+    def test_stale_path_is_resolved_again(self) -> None:
+        """Check that missing or not executable drivers are resolved again."""
+        driver_path = self.cache.get("chromedriver:118", self.resolve)
+        Path(driver_path).unlink()
+        assert self.cache.get("chromedriver:118", self.resolve) == driver_path
+        assert self.resolved == 2  # noqa: PLR2004
+
+        Path(driver_path).chmod(0o644)
+        self.cache.get("chromedriver:118", self.resolve)
+        assert self.resolved == 3  # noqa: PLR2004
+
+    def test_concurrent_resolution(self) -> None:
+        """Check that concurrent callers resolve path exactly once."""
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            paths = list(
+                executor.map(
+                    lambda _: DriverPathCache(self.cache.path).get(
+                        "geckodriver:unknown",
+                        self.resolve,
+                    ),
+                    range(8),
+                ),
+            )
+        assert len(set(paths)) == 1
+        assert self.resolved == 1
+
+    def test_not_resolved_path_is_not_cached(self) -> None:
+        """Check that failed resolution is retried."""
+        assert self.cache.get("IEDriverServer:unknown", lambda: None) is None
+        assert self.cache.get("IEDriverServer:unknown", self.resolve)
+        assert self.resolved == 1
+
+
+class LockFileTest(TestCase):
+    """lock_file tests with Windows locking."""
+
+    def setUp(self) -> None:
+        """Set up."""
+        self.folder = tempfile.TemporaryDirectory()
+        self.addCleanup(self.folder.cleanup)
+        self.msvcrt = mock.Mock(LK_NBLCK=2, LK_UNLCK=0)
+        for patcher in (
+            mock.patch.object(driver_cache, "is_windows", return_value=True),
+            mock.patch.object(driver_cache, "msvcrt", self.msvcrt, create=True),
+            mock.patch.object(driver_cache, "sleep"),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_lock_is_retried_with_sleep(self) -> None:
+        """Check that busy lock is tried again after sleep."""
+        self.msvcrt.locking.side_effect = [OSError, OSError, None, None]
+        with lock_file(Path(self.folder.name) / "paths.lock"):
+            pass
+
+        assert driver_cache.sleep.call_count == 2  # noqa: PLR2004
+        assert self.msvcrt.locking.call_count == 4  # noqa: PLR2004
+
+    def test_lock_timeout(self) -> None:
+        """Check that OSError is raised when lock is not taken in time."""
+        self.msvcrt.locking.side_effect = OSError
+        with pytest.raises(OSError), lock_file(  # noqa: PT011
+            Path(self.folder.name) / "paths.lock",
+            timeout=0,
+        ):
+            pass
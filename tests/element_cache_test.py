@@ -0,0 +1,103 @@
+"""Element cache tests."""
+from __future__ import annotations
+
+from collections import Counter
+from typing import Any
+from unittest.case import TestCase
+
+import pytest
+from selenium.common.exceptions import NoSuchElementException
+
+from easelenium.element_cache import ElementCache
+
+LOCATOR = ("css selector", "a")
+
+
+class ElementCacheTest(TestCase):
+    """ElementCache tests."""
+
+    def setUp(self) -> None:
+        """Set up."""
+        self.dom_version = -1
+        self.page = {LOCATOR: ["a"], ("id", "form"): ["form"]}
+        self.scripts = []
+        self.stats = Counter()
+        self.cache = ElementCache(self.execute_js, self.stats)
+
+    def execute_js(
+        self,
+        _script: str,
+        known_version: int | None,
+        cached: bool,  # noqa: FBT001
+        locator: list[str],
+        parent: list[str] | None,
+    ) -> dict[str, Any]:
+        """Run lookup like find_cached_elements.js does."""
+        self.scripts.append(locator)
+        version = self.dom_version
+        # observer is installed by the first lookup in the document
+        self.dom_version = max(self.dom_version, 0)
+        if cached and version == known_version:
+            return {"version": version, "elements": None, "parentFound": True}
+        if parent and not self.page.get(tuple(parent)):
+            return {"version": version, "elements": [], "parentFound": False}
+        return {
+            "version": version,
+            "elements": list(self.page.get(tuple(locator), [])),
+            "parentFound": True,
+        }
+
+    def test_find_reuses_elements_while_dom_is_not_changed(self) -> None:
+        """Check that elements are found only once if DOM is not changed."""
+        assert self.cache.find(LOCATOR) == ["a"]
+        self.page[LOCATOR] = ["b"]
+        assert self.cache.find(LOCATOR) == ["a"]
+        assert self.stats["element_cache_hits"] == 1
+        assert self.stats["element_cache_misses"] == 1
+
+    def test_dom_is_checked_on_every_lookup(self) -> None:
+        """Check that every lookup is one script which checks DOM."""
+        for _ in range(3):
+            self.cache.find(LOCATOR)
+        assert len(self.scripts) == 3  # noqa: PLR2004
+        assert self.stats["element_cache_checks"] == 3  # noqa: PLR2004
+
+    def test_find_drops_elements_when_dom_is_changed(self) -> None:
+        """Check that elements are found again after DOM mutation."""
+        self.cache.find(LOCATOR)
+        self.page[LOCATOR] = ["b"]
+        self.dom_version = 3
+        assert self.cache.find(LOCATOR) == ["b"]
+        assert self.stats["element_cache_invalidations"] == 1
+        assert len(self.scripts) == 2  # noqa: PLR2004
+
+    def test_find_drops_elements_in_new_document(self) -> None:
+        """Check that elements are found again after navigation."""
+        self.cache.find(LOCATOR)
+        self.page[LOCATOR] = ["b"]
+        self.dom_version = -1
+        assert self.cache.find(LOCATOR) == ["b"]
+
+    def test_find_does_not_cache_missing_elements(self) -> None:
+        """Check that empty results are not cached."""
+        self.page[LOCATOR] = []
+        assert self.cache.find(LOCATOR) == []
+        self.page[LOCATOR] = ["a"]
+        assert self.cache.find(LOCATOR) == ["a"]
+        assert self.stats["element_cache_misses"] == 2  # noqa: PLR2004
+
+    def test_parent_is_found_by_the_same_script(self) -> None:
+        """Check that parent locator is resolved in the page."""
+        assert self.cache.find(LOCATOR, ("id", "form")) == ["a"]
+        assert self.cache.find(LOCATOR, ("id", "form")) == ["a"]
+        assert self.cache.find(LOCATOR) == ["a"]
+        assert self.stats["element_cache_hits"] == 1
+        with pytest.raises(NoSuchElementException, match="missing"):
+            self.cache.find(LOCATOR, ("id", "missing"))
+
+    def test_clear(self) -> None:
+        """Check that clear drops elements."""
+        self.cache.find(LOCATOR)
+        self.page[LOCATOR] = ["b"]
+        self.cache.clear()
+        assert self.cache.find(LOCATOR) == ["b"]
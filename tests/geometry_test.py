@@ -0,0 +1,51 @@
+"""Geometry tests."""
+from __future__ import annotations
+
+from unittest.case import TestCase
+
+import pytest
+
+from easelenium.ui.generator.geometry import contains, get_center, get_inside_mask
+
+
+class GeometryTest(TestCase):
+    """Geometry functions tests."""
+
+    def test_contains(self) -> None:
+        """Check right and bottom edges are outside of area."""
+        area = (10, 20, 30, 40)
+        assert contains(area, (10, 20))
+        assert contains(area, (39, 59))
+        assert not contains(area, (40, 30))
+        assert not contains(area, (20, 60))
+        assert not contains(area, (9, 30))
+
+    def test_get_center(self) -> None:
+        """Check center is moved by frame offset and truncated."""
+        assert get_center((10, 20, 5, 7)) == (12, 23)
+        assert get_center((10, 20, 5, 7), (100, 200)) == (112, 223)
+
+    def test_get_inside_mask(self) -> None:
+        """Check rects are filtered by area and regions."""
+        rects = [(0, 0, 10, 10), (100, 100, 10, 10), (200, 0, 10, 10)]
+        assert get_inside_mask(rects) == [True, True, True]
+        assert get_inside_mask(rects, (0, 0, 150, 150)) == [True, True, False]
+        assert get_inside_mask(
+            rects,
+            regions=[(0, 0, 20, 20), (190, 0, 30, 30)],
+        ) == [True, False, True]
+        assert get_inside_mask(
+            rects,
+            (0, 0, 150, 150),
+            [(0, 0, 20, 20), (190, 0, 30, 30)],
+        ) == [True, False, False]
+        assert get_inside_mask(rects, (0, 0, 100, 100), location_offset=(90, 90)) == [
+            True,
+            False,
+            False,
+        ]
+
+    def test_bad_area(self) -> None:
+        """Check area which is not (x, y, width, height) is not accepted."""
+        with pytest.raises(ValueError, match="Bad area data"):
+            get_inside_mask([(0, 0, 1, 1)], (0, 0, 1))
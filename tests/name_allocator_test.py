@@ -0,0 +1,77 @@
+"""Name allocator tests."""
+from __future__ import annotations
+
+from unittest.case import TestCase
+
+from easelenium.ui.generator.name_allocator import NameAllocator
+
+
+def get_synthetic_names(count: int) -> list[str]:
+    """Return names where most of the names are shared like on real pages."""
+    names = []
+    for i in range(count):
+        if i % 10 == 0:
+            # names which look like already allocated ones
+            names.append(f"BTN_{i % 1000}")
+        elif i % 3 == 0:
+            names.append(f"LINK_{i}")
+        else:
+            names.append(("BTN", "SPAN", "INPUT")[i % 3])
+    return names
+
+
+class NameAllocatorTest(TestCase):
+    """NameAllocator tests."""
+
+    def test_allocate(self) -> None:
+        """Check duplicated names get first free suffix."""
+        names = NameAllocator()
+        assert [
+            names.allocate(name) for name in ("BTN", "BTN", "BTN_0", "BTN", "SPAN")
+        ] == ["BTN", "BTN_0", "BTN_0_0", "BTN_1", "SPAN"]
+        assert "BTN_1" in names
+        assert len(names) == 5  # noqa: PLR2004
+
+    def test_allocate_with_taken_names(self) -> None:
+        """Check names of existing fields are not allocated again."""
+        names = NameAllocator(["BTN", "BTN_0"])
+        names.reserve("BTN_2")
+        assert names.allocate("BTN") == "BTN_1"
+        assert names.allocate("BTN") == "BTN_3"
+        assert names.allocate("SPAN") == "SPAN"
+
+    def test_allocate_as_list_search(self) -> None:
+        """Check names are same as names given by search in list of names."""
+        taken = []
+        for name in get_synthetic_names(300):
+            new_name = name
+            i = 0
+            while new_name in taken:
+                new_name = f"{name}_{i}"
+                i += 1
+            taken.append(new_name)
+
+        names = NameAllocator()
+        assert [names.allocate(n) for n in get_synthetic_names(300)] == taken
+
+    def test_allocate_scales_linearly(self) -> None:
+        """Check that allocation of 50k names takes few checks per name."""
+
+        class CountingSet(set):
+            """Set which counts membership checks."""
+
+            checks = 0
+
+            def __contains__(self, name: object) -> bool:
+                self.checks += 1
+                return super().__contains__(name)
+
+        names = get_synthetic_names(50_000)
+        allocator = NameAllocator()
+        taken_names = CountingSet()
+        allocator._NameAllocator__taken_names = taken_names
+        for name in names:
+            allocator.allocate(name)
+
+        # search in list of names would make thousands of checks per name
+        assert taken_names.checks < 3 * len(names)
@@ -3,18 +3,26 @@ from __future__ import annotations
 
 import codecs
 import pickle
+import tempfile
 from pathlib import Path
+from typing import TYPE_CHECKING
 from unittest.case import TestCase
 
+import pytest
 from selenium.webdriver.common.by import By
 
 from easelenium.ui.file_utils import check_if_path_exists, read_file, safe_remove_path
 from easelenium.ui.generator.page_object_class import (
     PageObjectClass,
+    PageObjectClassDiff,
+    PageObjectClassField,
     get_by_as_code_str,
     get_by_from_code_str,
 )
-from easelenium.utils import is_windows
+from easelenium.utils import LINESEP, is_windows
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
 
 
 class PageObjectClassTest(TestCase):
@@ -133,3 +141,78 @@ class PageObjectClassTest(TestCase):
             assert po_class.img_path == self.po_class_object.img_path
 
             assert po_class == self.po_class_object
+
+    def test_save_fields_from_iterator(self) -> None:
+        """Check page object class with fields iterator is saved as with list."""
+        fields = self.po_class_object.fields
+        with tempfile.TemporaryDirectory() as folder:
+            po_class = PageObjectClass(
+                self.po_class_object.name,
+                self.po_class_object.url,
+                iter(fields),
+                self.po_class_object.area,
+                str(Path(folder) / "duckduckgo.py"),
+                str(Path(folder) / "img" / "duckduckgo.png"),
+                self.po_class_object.img_as_png,
+            )
+            po_class.save()
+
+            assert po_class.fields == fields
+            assert read_file(po_class.file_path) == po_class._get_file_content()
+
+    def test_failed_save_keeps_previous_file(self) -> None:
+        """Check that file is not changed if fields iterator fails."""
+
+        def save_failing_class(folder: str) -> None:
+            def fail_after_first_field() -> Iterator[PageObjectClassField]:
+                yield self.po_class_object.fields[0]
+                msg = "scanning failed"
+                raise RuntimeError(msg)
+
+            po_class = PageObjectClass(
+                self.po_class_object.name,
+                self.po_class_object.url,
+                fail_after_first_field(),
+                self.po_class_object.area,
+                str(Path(folder) / "duckduckgo.py"),
+                str(Path(folder) / "img" / "duckduckgo.png"),
+                self.po_class_object.img_as_png,
+            )
+            with pytest.raises(RuntimeError, match="scanning failed"):
+                po_class.save()
+
+        with tempfile.TemporaryDirectory() as folder:
+            save_failing_class(folder)
+            assert not list(Path(folder).iterdir())
+
+            file_path = Path(folder) / "duckduckgo.py"
+            file_path.write_text("previous", encoding="utf8")
+            save_failing_class(folder)
+            assert file_path.read_text(encoding="utf8") == "previous"
+            assert list(Path(folder).iterdir()) == [file_path]
+
+    def test_save_without_fields(self) -> None:
+        """Check page object class without fields is saved with pass."""
+        po_class = PageObjectClass("Empty", "https://example.com/", iter([]))
+        assert "    pass" + LINESEP in po_class._get_file_content()
+        assert po_class.fields == []
+
+    def test_diff_report(self) -> None:
+        """Check diff report has line for every changed field."""
+        old = PageObjectClassField("LOGO", By.ID, "logo", (10, 10), (50, 20))
+        new = PageObjectClassField("LOGO", By.ID, "logo", (10, 40), (50, 20))
+        removed = PageObjectClassField("MENU", By.CLASS_NAME, "menu", (0, 0), (5, 5))
+        added = PageObjectClassField("SEARCH", By.ID, "search", (0, 0), (5, 5))
+
+        diff = PageObjectClassDiff()
+        assert not diff.has_changes()
+        diff.moved.append((old, new))
+        diff.removed.append((removed, "not found"))
+        diff.added.append(added)
+        assert diff.has_changes()
+        assert str(diff).split(LINESEP) == [
+            "PageObjectClassDiff(kept=0, moved=1, removed=1, added=1)",
+            "~ LOGO: location (10, 10) -> (10, 40), dimensions (50, 20) -> (50, 20)",
+            "- MENU = (By.CLASS_NAME, 'menu'): not found",
+            "+ SEARCH = (By.ID, 'search')",
+        ]
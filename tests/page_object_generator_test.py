@@ -7,15 +7,18 @@ from time import time
 import pytest
 from selenium.webdriver.common.by import By
 
-try:
-    from wx import Point, Rect
-except ModuleNotFoundError:
-    pytest.skip(allow_module_level=True)
-
 from easelenium.base_test import BaseTest
 from easelenium.browser import Browser
+from easelenium.ui.generator.geometry import contains, get_center
+from easelenium.ui.generator.page_object_class import PageObjectClass
 from easelenium.ui.generator.page_object_generator import PageObjectGenerator
 
+FRACTIONAL_BOX = (
+    "data:text/html,<div id='box' style='position: absolute; left: 10.6px; "
+    "top: 20.7px; width: 5px; height: 5px'></div>"
+)
+SPACED_LINK = "data:text/html,<a href='#'> Spaced&nbsp;link </a>"
+
 
 @pytest.mark.skipif(not Browser.supports("gc"), reason="Browser not supported")
 class PageObjectGeneratorTest(BaseTest):
@@ -48,6 +51,36 @@ class PageObjectGeneratorTest(BaseTest):
         fields = self.generator.get_all_po_fields("https://duckduckgo.com/", None)
         assert len(fields) > 7  # noqa: PLR2004
 
+    def test_get_po_fields_from_page_with_js_scan(self) -> None:
+        """Check get page object fields using injected javascript scan."""
+        generator = PageObjectGenerator(self.browser, use_js_scan=True)
+        fields = generator.get_all_po_fields("https://duckduckgo.com/", None)
+        assert len(fields) > 7  # noqa: PLR2004
+
+        by_and_selectors = [(f.by, f.selector) for f in fields]
+        assert (By.ID, "searchbox_input") in by_and_selectors
+        for field in fields:
+            assert field.location != (0, 0)
+            assert field.dimensions != (0, 0)
+
+    def test_locations_are_rounded_like_element_location(self) -> None:
+        """Check that field locations are the same as WebElement locations."""
+        for use_js_scan in (False, True):
+            generator = PageObjectGenerator(self.browser, use_js_scan=use_js_scan)
+            fields = generator.get_all_po_fields(FRACTIONAL_BOX, None)
+            box = next(f for f in fields if (f.by, f.selector) == (By.ID, "box"))
+            assert box.location == self.browser.get_location(by_id="box") == (11, 21)
+
+    def test_selectors_are_built_from_prefetched_candidates(self) -> None:
+        """Check that scan uses link text like WebElement.text without waits."""
+        waits = self.browser.stats["waits"]
+        fields = self.generator.get_all_po_fields(SPACED_LINK, None)
+        assert self.browser.stats["waits"] == waits
+
+        link = self.browser.find_element(by_link="Spaced link")
+        assert self.browser.get_text(link) == "Spaced link"
+        assert [(f.by, f.selector) for f in fields] == [(By.LINK_TEXT, "Spaced link")]
+
     def test_get_po_class_from_url(self) -> None:
         """Check get page object class."""
         folder = tempfile.gettempdir()
@@ -83,6 +116,42 @@ class PageObjectGeneratorTest(BaseTest):
         assert po_class.img_path.startswith(folder)
         assert "duck_duck_go" in po_class.img_path
 
+    def test_update_po_class(self) -> None:
+        """Check existing page object class is updated incrementally."""
+        url = "https://duckduckgo.com/"
+        po_class = self.generator.get_po_class_for_url(
+            url,
+            "DuckDuckGo",
+            tempfile.gettempdir(),
+        )
+        po_class = PageObjectClass.parse_string_to_po_class(
+            po_class._get_file_content(),
+        )
+
+        updated_po_class, diff = self.generator.update_po_class(po_class)
+        assert not diff.has_changes()
+        assert updated_po_class.fields == po_class.fields
+
+        search_field = next(f for f in po_class.fields if f.selector == "searchbox_input")
+        search_field.selector = "missing_searchbox_input"
+        updated_po_class, diff = self.generator.update_po_class(po_class)
+        assert [field for field, _ in diff.removed] == [search_field]
+        assert [(f.by, f.selector) for f in diff.added] == [(By.ID, "searchbox_input")]
+        assert diff.added[0].name != search_field.name
+        assert len(updated_po_class.fields) == len(po_class.fields)
+
+    def test_update_po_class_with_fractional_locations(self) -> None:
+        """Check that field is not moved when page is the same."""
+        po_class = self.generator.get_po_class_for_url(
+            FRACTIONAL_BOX,
+            "Box",
+            tempfile.gettempdir(),
+        )
+
+        updated_po_class, diff = self.generator.update_po_class(po_class, tolerance=0)
+        assert not diff.has_changes()
+        assert updated_po_class.fields == po_class.fields
+
     def test_get_po_class_fields_from_elements(self) -> None:
         """Check get page object class fields."""
         fields = self.generator.get_all_po_fields("https://duckduckgo.com/", None)
@@ -159,10 +228,7 @@ class PageObjectGeneratorTest(BaseTest):
             area,
         )
         for f in po_class.fields:
-            x, y = f.location
-            w, d = f.dimensions
-            p = Point(int(x + w / 2), int(y + d / 2))
-            assert Rect(*area).Contains(p)
+            assert contains(area, get_center((*f.location, *f.dimensions)))
 
         selectors = [f.selector for f in po_class.fields]
         bys = [f.by for f in po_class.fields]
@@ -185,3 +251,27 @@ class PageObjectGeneratorTest(BaseTest):
 
         assert len(selectors) >= 2  # noqa: PLR2004
         assert "/html/body/iframe" in selectors
+
+    def test_get_selectors_with_batched_uniqueness_checks(self) -> None:
+        """Check that selectors are not changed by batched uniqueness checks."""
+        by_and_selector = By.CSS_SELECTOR, "#searchbox_input"
+        element = self.browser.find_element(by_and_selector)
+
+        oracle = self.generator._get_uniqueness_oracle()
+        oracle.prefetch([(By.ID, "searchbox_input"), by_and_selector])
+        assert oracle.is_unique(by_and_selector)
+        assert oracle.count((By.TAG_NAME, "a")) > 1
+        assert self.generator._get_css_selector(element) == by_and_selector
+
+    def test_get_all_po_fields_with_frame_workers(self) -> None:
+        """Check frames are scanned in parallel by worker browsers."""
+        url = "https://www.w3schools.com/html/html_iframe.asp"
+        fields = self.generator.get_all_po_fields(url)
+        parallel_fields = self.generator.get_all_po_fields(url, frame_workers=2)
+
+        assert len(parallel_fields) > 0
+        assert {(f.by, f.selector) for f in parallel_fields} == {
+            (f.by, f.selector) for f in fields
+        }
+        names = [f.name for f in parallel_fields]
+        assert len(names) == len(set(names))
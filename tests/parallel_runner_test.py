@@ -0,0 +1,134 @@
+"""Parallel runner tests."""
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from unittest.case import TestCase
+from xml.etree import ElementTree as ET
+
+from easelenium.parallel_runner import (
+    get_exit_code,
+    get_test_group,
+    get_worker_args,
+    merge_junit_reports,
+    schedule,
+    write_html_report,
+)
+
+JUNIT_REPORT = """<?xml version="1.0" encoding="utf-8"?>
+<testsuites><testsuite name="pytest" errors="0" failures="{failures}" skipped="0"
+tests="{tests}" time="{time}">{testcases}</testsuite></testsuites>
+"""
+
+
+class ParallelRunnerTest(TestCase):
+    """Parallel runner tests."""
+
+    def test_get_test_group(self) -> None:
+        """Check that tests are grouped by class or module."""
+        nodeid = "tests/a_test.py::ATest::test_a[x::y]"
+        assert get_test_group(nodeid, in_class=True) == "tests/a_test.py::ATest"
+        assert get_test_group("tests/a_test.py::test_a", in_class=False) == (
+            "tests/a_test.py"
+        )
+
+    def test_schedule_balances_by_durations(self) -> None:
+        """Check that longest groups are distributed first."""
+        durations = {"a": 10, "b": 6, "c": 5, "d": 4, "e": 1}
+        buckets = schedule(["e", "d", "c", "b", "a"], durations, 2)
+        assert buckets == [["a", "d"], ["b", "c", "e"]]
+
+    def test_schedule_without_history(self) -> None:
+        """Check that groups without history are spread evenly."""
+        buckets = schedule(["a", "b", "c", "d", "e"], {"a": 3}, 3)
+        assert sorted(len(b) for b in buckets) == [1, 2, 2]
+        assert sorted(g for b in buckets for g in b) == ["a", "b", "c", "d", "e"]
+        assert schedule(["a"], {}, 4) == [["a"]]
+
+    def test_get_worker_args(self) -> None:
+        """Check that parent only options are removed."""
+        args = ["tests", "--workers", "4", "--junitxml=r.xml", "-k", "Browser"]
+        assert get_worker_args(args, ("--workers", "--junitxml")) == [
+            "tests",
+            "-k",
+            "Browser",
+        ]
+
+    def test_get_exit_code(self) -> None:
+        """Check that errors take precedence over failed tests."""
+        assert get_exit_code([0, 0]) == 0
+        assert get_exit_code([0, 1]) == 1
+        assert get_exit_code([1, 3, 0]) == 3  # noqa: PLR2004
+
+    def test_run_without_cache_provider(self) -> None:
+        """Check that workers are run when pytest cache plugin is disabled."""
+        with tempfile.TemporaryDirectory() as tmp_folder:
+            folder = Path(tmp_folder)
+            (folder / "test_a.py").write_text(
+                "class TestA:\n    def test_a(self): pass\n"
+                "class TestB:\n    def test_b(self): pass\n",
+                encoding="utf-8",
+            )
+            env = dict(os.environ, PYTHONPATH=str(Path(__file__).parents[1]))
+            exit_code = subprocess.call(  # noqa: S603
+                [
+                    sys.executable,
+                    "-m",
+                    "easelenium.scripts.easelenium_cli",
+                    "--workers",
+                    "2",
+                    "-p",
+                    "no:cacheprovider",
+                    "test_a.py",
+                ],
+                cwd=folder,
+                env=env,
+                stdout=subprocess.DEVNULL,
+            )
+
+            assert exit_code == 0
+            assert (folder / ".pytest_cache").exists()
+
+    def test_merge_reports(self) -> None:
+        """Check that JUnit reports of workers are merged."""
+        with tempfile.TemporaryDirectory() as tmp_folder:
+            folder = Path(tmp_folder)
+            (folder / "worker_0.xml").write_text(
+                JUNIT_REPORT.format(
+                    failures=1,
+                    tests=2,
+                    time=3.5,
+                    testcases='<testcase classname="A" name="a" time="1"/>'
+                    '<testcase classname="A" name="b" time="2.5">'
+                    '<failure message="boom"/></testcase>',
+                ),
+            )
+            (folder / "worker_1.xml").write_text(
+                JUNIT_REPORT.format(
+                    failures=0,
+                    tests=1,
+                    time=2,
+                    testcases='<testcase classname="B" name="c" time="2"/>',
+                ),
+            )
+            merged_path = folder / "report" / "merged.xml"
+            merge_junit_reports(
+                [folder / "worker_0.xml", folder / "worker_1.xml", folder / "none"],
+                merged_path,
+            )
+
+            suite = ET.parse(merged_path).getroot().find("testsuite")  # noqa: S314
+            assert suite.get("tests") == "3"
+            assert suite.get("failures") == "1"
+            assert suite.get("time") == "3.500"
+            assert [t.get("name") for t in suite.iter("testcase")] == ["a", "b", "c"]
+
+            html_path = folder / "report.html"
+            write_html_report(merged_path, html_path, [])
+            html = html_path.read_text(encoding="utf-8")
+            assert "tests: 3" in html
+            assert '<tr class="failure">' in html
+            assert "boom" in html
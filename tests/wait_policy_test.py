@@ -0,0 +1,78 @@
+"""Wait policy tests."""
+from __future__ import annotations
+
+from itertools import islice
+from unittest.case import TestCase
+
+import pytest
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException,
+)
+
+from easelenium.wait_policy import WaitPolicy
+
+
+class WaitPolicyTest(TestCase):
+    """WaitPolicy tests."""
+
+    def test_intervals_back_off_to_max_poll(self) -> None:
+        """Check that poll intervals grow exponentially up to the cap."""
+        policy = WaitPolicy(initial_poll=0.025, backoff=2, max_poll=0.15)
+        assert list(islice(policy.intervals(), 5)) == [
+            0.025,
+            0.05,
+            0.1,
+            0.15,
+            0.15,
+        ]
+
+    def test_wait_returns_first_truthy_value(self) -> None:
+        """Check that wait stops as soon as condition is met."""
+        values = iter([None, False, "element", "other"])
+        result = WaitPolicy(initial_poll=0.001).wait(lambda: next(values), 5)
+        assert result.value == "element"
+        assert result.polls == 3  # noqa: PLR2004
+        assert not result.timed_out
+        assert result.elapsed < 1
+
+    def test_wait_times_out(self) -> None:
+        """Check that wait returns not met result after timeout."""
+        policy = WaitPolicy(initial_poll=0.01, backoff=1.5, max_poll=0.05)
+        result = policy.wait(lambda: None, 0.2)
+        assert result.timed_out
+        assert result.elapsed >= 0.2  # noqa: PLR2004
+        assert 2 < result.polls < 20  # noqa: PLR2004
+
+    def test_wait_ignores_configured_exceptions(self) -> None:
+        """Check that ignored exceptions mean not met condition."""
+        errors = [NoSuchElementException(), StaleElementReferenceException()]
+
+        def condition() -> bool:
+            if errors:
+                raise errors.pop(0)
+            return True
+
+        policy = WaitPolicy(
+            initial_poll=0.001,
+            ignored_exceptions=(
+                NoSuchElementException,
+                StaleElementReferenceException,
+            ),
+        )
+        result = policy.wait(condition, 5)
+        assert result.value is True
+        assert result.polls == 3  # noqa: PLR2004
+
+        errors.append(StaleElementReferenceException())
+        with pytest.raises(StaleElementReferenceException):
+            WaitPolicy().wait(condition, 5)
+
+    def test_invalid_policy(self) -> None:
+        """Check that invalid intervals are rejected."""
+        with pytest.raises(ValueError, match="initial_poll"):
+            WaitPolicy(initial_poll=0)
+        with pytest.raises(ValueError, match="initial_poll"):
+            WaitPolicy(initial_poll=1, max_poll=0.5)
+        with pytest.raises(ValueError, match="Backoff"):
+            WaitPolicy(backoff=0.5)